@@ -0,0 +1,950 @@
+"""
+Deterministické generátory velkých syntetických dokumentů pro benchmarky.
+
+Stejné parametry (včetně seed) dají bajtově stejný soubor, takže časy
+z různých commitů jsou porovnatelné. Používá se jen standardní knihovna.
+"""
+import random
+import struct
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+_ZIP_TIME = (1980, 1, 1, 0, 0, 0)
+
+_WORDS = (
+    "data pacient hodnota výsledek měření analýza studie skupina průměr "
+    "odchylka vzorek metoda kapitola obrázek tabulka závěr úvod text "
+    "dokument práce výzkum graf statistika model systém návrh řešení"
+).split()
+
+_W_NS = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture"'
+)
+
+_ODF_NS = (
+    'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+    'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+    'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+    'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+    'xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0" '
+    'xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink" '
+    'xmlns:svg="urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0" '
+    'xmlns:number="urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0" '
+    'xmlns:of="urn:oasis:names:tc:opendocument:xmlns:of:1.2" '
+    'office:version="1.3"'
+)
+
+_XLSX_NS = (
+    'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_DATA_HEADER = ("Pacient", "Pohlaví", "Výška (cm)", "Váha (kg)", "BMI", "BMI nad střední hodnotou")
+
+
+@dataclass
+class GeneratedDocument:
+    path: Path
+    kind: str  # docx / odt / xlsx / ods
+    paragraphs: int = 0
+    headings: int = 0
+    figures: int = 0
+    sections: int = 0
+    rows: int = 0
+    cells: int = 0
+
+
+# --- společné pomůcky ---
+
+def _write_zip(path: Path, parts: dict[str, str | bytes], mimetype: str | None = None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(path, "w") as z:
+        # ODF vyžaduje nekomprimovaný mimetype jako první položku
+        if mimetype is not None:
+            z.writestr(zipfile.ZipInfo("mimetype", _ZIP_TIME), mimetype, zipfile.ZIP_STORED)
+
+        for name, data in parts.items():
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            z.writestr(zipfile.ZipInfo(name, _ZIP_TIME), data, zipfile.ZIP_DEFLATED)
+
+
+def _png(width: int, height: int, shade: int) -> bytes:
+    """Jednobarevný šedotónový PNG s hlavičkou pHYs (96 DPI)."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    raw = (b"\x00" + bytes([shade]) * width) * height
+    ppm = round(96 / 0.0254)
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+        + chunk(b"pHYs", struct.pack(">IIB", ppm, ppm, 1))
+        + chunk(b"IDAT", zlib.compress(raw, 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _outline(headings: int) -> list[int]:
+    """Úrovně nadpisů 1–3: kapitola, pod ní podkapitoly a oddíly."""
+    levels = []
+    while len(levels) < headings:
+        levels.append(1)
+        for sub in range(3):
+            levels.append(2)
+            if sub < 2:
+                levels.append(3)
+    return levels[:headings]
+
+
+def _spread(count: int, slots: int) -> set[int]:
+    """Rovnoměrně rozmístí `count` položek mezi `slots` pozic."""
+    if count <= 0 or slots <= 0:
+        return set()
+    return {i * slots // count for i in range(count)}
+
+
+def _heading_numbers(levels: list[int]) -> list[str]:
+    counters = [0, 0, 0]
+    numbers = []
+    for level in levels:
+        counters[level - 1] += 1
+        for i in range(level, 3):
+            counters[i] = 0
+        numbers.append(".".join(str(c) for c in counters[:level]))
+    return numbers
+
+
+@dataclass
+class _Body:
+    """Rozvržení textové části: co bude v kterém oddílu."""
+    levels: list[int]
+    numbers: list[str]
+    titles: list[str]
+    # (oddíl, typ, data) – typ: heading / paragraph / figure
+    items: list[tuple[int, str, object]]
+
+
+def _plan_body(rng: random.Random, paragraphs: int, headings: int, figures: int, sections: int) -> _Body:
+    levels = _outline(headings)
+    numbers = _heading_numbers(levels)
+    titles = [_sentence(rng, 3).rstrip(".") for _ in levels]
+
+    # oddíl 1 = titulní strana + obsah, poslední oddíl = seznamy a literatura
+    body_sections = max(1, sections - 2)
+    chapters = [i for i, level in enumerate(levels) if level == 1]
+    chapter_section = {h: 2 + n * body_sections // max(1, len(chapters)) for n, h in enumerate(chapters)}
+
+    slots = max(1, paragraphs)
+    heading_at = dict(zip(sorted(_spread(headings, slots)), range(headings)))
+    figure_at = _spread(figures, slots)
+
+    items = []
+    section = 2
+    figure = 0
+    for i in range(paragraphs):
+        h = heading_at.get(i)
+        if h is not None:
+            section = chapter_section.get(h, section)
+            items.append((section, "heading", h))
+        if i in figure_at:
+            figure += 1
+            items.append((section, "figure", figure))
+        items.append((section, "paragraph", _sentence(rng, rng.randint(8, 30))))
+
+    return _Body(levels, numbers, titles, items)
+
+
+# --- DOCX ---
+
+def _w_run(text: str, rpr: str = "") -> str:
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _w_p(content: str, style: str | None = None, ppr_extra: str = "") -> str:
+    ppr = ""
+    if style or ppr_extra:
+        ps = f'<w:pStyle w:val="{style}"/>' if style else ""
+        ppr = f"<w:pPr>{ps}{ppr_extra}</w:pPr>"
+    return f"<w:p>{ppr}{content}</w:p>"
+
+
+def _w_field_start(instr: str) -> str:
+    return (
+        '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+        f'<w:r><w:instrText xml:space="preserve"> {escape(instr)} </w:instrText></w:r>'
+        '<w:r><w:fldChar w:fldCharType="separate"/></w:r>'
+    )
+
+
+def _w_field(instr: str, result: str) -> str:
+    return (
+        _w_field_start(instr)
+        + _w_run(result)
+        + '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+    )
+
+
+def _w_sect_pr(index: int) -> str:
+    refs = ""
+    if index > 1:
+        refs = (
+            f'<w:headerReference w:type="default" r:id="rIdHeader{index}"/>'
+            f'<w:footerReference w:type="default" r:id="rIdFooter{index}"/>'
+        )
+    start = '<w:pgNumType w:start="1"/>' if index == 2 else ""
+    kind = "" if index == 1 else '<w:type w:val="nextPage"/>'
+    return (
+        f"<w:sectPr>{refs}{kind}"
+        '<w:pgSz w:w="11906" w:h="16838"/>'
+        '<w:pgMar w:top="1417" w:right="1417" w:bottom="1417" w:left="1417" '
+        'w:header="708" w:footer="708" w:gutter="0"/>'
+        f"{start}</w:sectPr>"
+    )
+
+
+def _w_drawing(figure: int) -> str:
+    cx, cy = 3810000, 2857500
+    return (
+        "<w:r><w:drawing>"
+        f'<wp:inline><wp:extent cx="{cx}" cy="{cy}"/>'
+        f'<wp:docPr id="{figure}" name="Obrázek {figure}"/>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        f'<pic:pic><pic:nvPicPr><pic:cNvPr id="{figure}" name="Obrázek {figure}"/><pic:cNvPicPr/></pic:nvPicPr>'
+        f'<pic:blipFill><a:blip r:embed="rIdImage{figure}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+        f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr></pic:pic>'
+        "</a:graphicData></a:graphic></wp:inline></w:drawing></w:r>"
+    )
+
+
+def _w_styles() -> str:
+    def style(style_id, name, *, based_on=None, ppr="", rpr="", custom=False):
+        based = f'<w:basedOn w:val="{based_on}"/>' if based_on else ""
+        flag = ' w:customStyle="1"' if custom else ""
+        return (
+            f'<w:style w:type="paragraph" w:styleId="{style_id}"{flag}>'
+            f'<w:name w:val="{name}"/>{based}<w:qFormat/>'
+            f"<w:pPr>{ppr}</w:pPr><w:rPr>{rpr}</w:rPr></w:style>"
+        )
+
+    font = '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman"/>'
+    headings = "".join(
+        style(
+            f"Nadpis{level}", f"heading {level}", based_on="Normal",
+            ppr=(
+                '<w:keepNext/><w:pageBreakBefore/>' if level == 1 else '<w:keepNext/>'
+            ) + f'<w:numPr><w:ilvl w:val="{level - 1}"/><w:numId w:val="1"/></w:numPr>'
+            f'<w:spacing w:before="240" w:after="120"/><w:outlineLvl w:val="{level - 1}"/>',
+            rpr=f'<w:b/><w:sz w:val="{36 - 4 * level}"/>',
+        )
+        for level in (1, 2, 3)
+    )
+    toc = "".join(
+        style(f"Obsah{level}", f"toc {level}", based_on="Normal") for level in (1, 2, 3)
+    )
+
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:styles {_W_NS}>'
+        f'<w:docDefaults><w:rPrDefault><w:rPr>{font}<w:sz w:val="24"/></w:rPr></w:rPrDefault>'
+        "<w:pPrDefault><w:pPr/></w:pPrDefault></w:docDefaults>"
+        + style(
+            "Normal", "Normal",
+            ppr='<w:spacing w:line="360" w:lineRule="auto"/><w:jc w:val="both"/>',
+            rpr=f'{font}<w:sz w:val="24"/>',
+        )
+        + headings
+        + toc
+        + style("Titulek", "caption", based_on="Normal", rpr='<w:i/><w:sz w:val="20"/>')
+        + style("Nadpisobsahu", "TOC Heading", based_on="Nadpis1")
+        + style("Bibliografie", "Bibliography", based_on="Normal")
+        + style("Seznamobrzk", "table of figures", based_on="Normal")
+        + style("uvodni-tema", "uvodni-tema", based_on="Normal",
+                ppr='<w:jc w:val="center"/>', rpr='<w:b/><w:sz w:val="52"/>', custom=True)
+        + "</w:styles>"
+    )
+
+
+def _w_numbering() -> str:
+    levels = "".join(
+        f'<w:lvl w:ilvl="{i}"><w:start w:val="1"/><w:numFmt w:val="decimal"/>'
+        f'<w:pStyle w:val="Nadpis{i + 1}"/>'
+        f'<w:lvlText w:val="{".".join(f"%{n + 1}" for n in range(i + 1))}"/></w:lvl>'
+        for i in range(3)
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:numbering {_W_NS}>'
+        f'<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="multilevel"/>{levels}</w:abstractNum>'
+        '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num></w:numbering>'
+    )
+
+
+def generate_docx(
+    path: str | Path,
+    paragraphs: int = 10_000,
+    headings: int = 200,
+    figures: int = 100,
+    sections: int = 12,
+    seed: int = 0,
+) -> GeneratedDocument:
+    path = Path(path)
+    rng = random.Random(seed)
+    sections = max(3, sections)
+    body = _plan_body(rng, paragraphs, headings, figures, sections)
+
+    out = []
+
+    # oddíl 1: titulní strana a obsah
+    out.append(_w_p(_w_run("Syntetická práce"), "uvodni-tema"))
+    out.append(_w_p(_w_run("Obsah"), "Nadpisobsahu"))
+    for h, (level, number, title) in enumerate(zip(body.levels, body.numbers, body.titles)):
+        entry = _w_run(f"{number} {title}") + _w_field(f"PAGEREF _Toc{h:06d} \\h", str(h + 1))
+        if h == 0:
+            entry = _w_field_start('TOC \\o "1-3" \\h \\z \\u') + entry
+        out.append(_w_p(f'<w:hyperlink w:anchor="_Toc{h:06d}">{entry}</w:hyperlink>', f"Obsah{level}"))
+    out.append(_w_p('<w:r><w:fldChar w:fldCharType="end"/></w:r>', "Obsah1"))
+    out.append(_w_p("", ppr_extra=_w_sect_pr(1)))
+
+    section = 2
+    for item_section, kind, data in body.items:
+        while item_section > section:
+            out.append(_w_p("", ppr_extra=_w_sect_pr(section)))
+            section += 1
+
+        if kind == "heading":
+            level = body.levels[data]
+            out.append(_w_p(
+                f'<w:bookmarkStart w:id="{data}" w:name="_Toc{data:06d}"/>'
+                + _w_run(body.titles[data])
+                + f'<w:bookmarkEnd w:id="{data}"/>',
+                f"Nadpis{level}",
+            ))
+        elif kind == "figure":
+            out.append(_w_p(_w_drawing(data), ppr_extra="<w:keepNext/>"))
+            out.append(_w_p(
+                f'<w:bookmarkStart w:id="{100_000 + data}" w:name="_Ref{data:06d}"/>'
+                + _w_run("Obrázek ")
+                + f'<w:fldSimple w:instr=" SEQ Obrázek \\* ARABIC ">{_w_run(str(data))}</w:fldSimple>'
+                + f'<w:bookmarkEnd w:id="{100_000 + data}"/>'
+                + _w_run(" " + _sentence(rng, 4)),
+                "Titulek",
+            ))
+            out.append(_w_p(
+                _w_run("Jak ukazuje ")
+                + _w_field(f"REF _Ref{data:06d} \\h", f"Obrázek {data}")
+                + _w_run(", " + _sentence(rng, 6).lower())
+            ))
+        else:
+            out.append(_w_p(_w_run(data)))
+
+    while section < sections - 1:
+        out.append(_w_p("", ppr_extra=_w_sect_pr(section)))
+        section += 1
+    out.append(_w_p("", ppr_extra=_w_sect_pr(section)))
+
+    # poslední oddíl: seznam obrázků a literatura
+    out.append(_w_p(_w_run("Seznam obrázků"), "Nadpisobsahu"))
+    for figure in range(1, figures + 1):
+        entry = _w_run(f"Obrázek {figure}") + _w_field(f"PAGEREF _Ref{figure:06d} \\h", str(figure))
+        if figure == 1:
+            entry = _w_field_start('TOC \\h \\z \\c "Obrázek"') + entry
+        out.append(_w_p(f'<w:hyperlink w:anchor="_Ref{figure:06d}">{entry}</w:hyperlink>', "Seznamobrzk"))
+    if figures:
+        out.append(_w_p('<w:r><w:fldChar w:fldCharType="end"/></w:r>', "Seznamobrzk"))
+
+    sources = "".join(
+        _w_p(_w_run(f"AUTOR, Jan. {_sentence(rng, 5)} Praha, {2000 + i}."), "Bibliografie")
+        for i in range(20)
+    )
+    out.append(
+        '<w:sdt><w:sdtPr><w:docPartObj><w:docPartGallery w:val="Bibliographies"/></w:docPartObj></w:sdtPr>'
+        "<w:sdtContent>"
+        + _w_p(_w_run("Literatura"), "Nadpis1")
+        + '<w:sdt><w:sdtPr><w:bibliography/></w:sdtPr><w:sdtContent>'
+        + _w_p(_w_field("BIBLIOGRAPHY", "")) + sources
+        + "</w:sdtContent></w:sdt></w:sdtContent></w:sdt>"
+    )
+
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {_W_NS}><w:body>'
+        + "".join(out)
+        + _w_sect_pr(sections)
+        + "</w:body></w:document>"
+    )
+
+    rels = [
+        ("rIdStyles", f"{_REL}/styles", "styles.xml"),
+        ("rIdNumbering", f"{_REL}/numbering", "numbering.xml"),
+    ]
+    parts: dict[str, str | bytes] = {}
+    overrides = []
+
+    for i in range(2, sections + 1):
+        header = f"header{i}.xml"
+        footer = f"footer{i}.xml"
+        rels.append((f"rIdHeader{i}", f"{_REL}/header", header))
+        rels.append((f"rIdFooter{i}", f"{_REL}/footer", footer))
+        parts[f"word/{header}"] = (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:hdr {_W_NS}>'
+            + _w_p(_w_run(f"Syntetická práce – oddíl {i}")) + "</w:hdr>"
+        )
+        parts[f"word/{footer}"] = (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:ftr {_W_NS}>'
+            + _w_p(_w_field("PAGE", "1")) + "</w:ftr>"
+        )
+        overrides.append((f"/word/{header}", "header"))
+        overrides.append((f"/word/{footer}", "footer"))
+
+    for figure in range(1, figures + 1):
+        name = f"media/image{figure}.png"
+        rels.append((f"rIdImage{figure}", f"{_REL}/image", name))
+        parts[f"word/{name}"] = _png(64 + figure % 64, 48, figure % 256)
+
+    ct = "application/vnd.openxmlformats-officedocument.wordprocessingml"
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        f'<Override PartName="/word/document.xml" ContentType="{ct}.document.main+xml"/>'
+        f'<Override PartName="/word/styles.xml" ContentType="{ct}.styles+xml"/>'
+        f'<Override PartName="/word/numbering.xml" ContentType="{ct}.numbering+xml"/>'
+        + "".join(f'<Override PartName="{name}" ContentType="{ct}.{kind}+xml"/>' for name, kind in overrides)
+        + "</Types>"
+    )
+
+    _write_zip(path, {
+        "[Content_Types].xml": content_types,
+        "_rels/.rels": _relationships([("rId1", f"{_REL}/officeDocument", "word/document.xml")]),
+        "word/_rels/document.xml.rels": _relationships(rels),
+        "word/document.xml": document,
+        "word/styles.xml": _w_styles(),
+        "word/numbering.xml": _w_numbering(),
+        **parts,
+    })
+
+    return GeneratedDocument(
+        path, "docx",
+        paragraphs=document.count("<w:p>") + document.count("<w:p "),
+        headings=headings, figures=figures, sections=sections,
+    )
+
+
+def _relationships(rels: list[tuple[str, str, str]]) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<Relationships xmlns="{_PKG_REL}">'
+        + "".join(
+            f'<Relationship Id="{rid}" Type="{kind}" Target="{target}"/>'
+            for rid, kind, target in rels
+        )
+        + "</Relationships>"
+    )
+
+
+# --- ODT ---
+
+def _odf_manifest(entries: list[tuple[str, str]], mimetype: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" manifest:version="1.3">'
+        f'<manifest:file-entry manifest:full-path="/" manifest:media-type="{mimetype}"/>'
+        + "".join(
+            f'<manifest:file-entry manifest:full-path="{name}" manifest:media-type="{media}"/>'
+            for name, media in entries
+        )
+        + "</manifest:manifest>"
+    )
+
+
+def _odt_styles(sections: int) -> str:
+    def para(name, display, *, parent=None, props="", text_props="", outline=None):
+        attrs = f'style:name="{name}" style:display-name="{display}" style:family="paragraph"'
+        if parent:
+            attrs += f' style:parent-style-name="{parent}"'
+        if outline:
+            attrs += f' style:default-outline-level="{outline}"'
+        return (
+            f"<style:style {attrs}>"
+            f"<style:paragraph-properties {props}/><style:text-properties {text_props}/>"
+            "</style:style>"
+        )
+
+    font = 'style:font-name="Times New Roman" fo:font-size="12pt"'
+    headings = "".join(
+        para(
+            f"Heading_20_{level}", f"Heading {level}", parent="Heading", outline=level,
+            props='fo:margin-top="0.423cm" fo:margin-bottom="0.212cm"'
+            + (' fo:break-before="page"' if level == 1 else ""),
+            text_props=f'fo:font-size="{18 - 2 * level}pt" fo:font-weight="bold"',
+        )
+        for level in (1, 2, 3)
+    )
+    contents = "".join(
+        para(f"Contents_20_{level}", f"Contents {level}", parent="Index") for level in (1, 2, 3)
+    )
+    outline = "".join(
+        f'<text:outline-level-style text:level="{level}" style:num-format="1" '
+        f'text:display-levels="{level}"/>'
+        for level in (1, 2, 3)
+    )
+
+    masters = ['<style:master-page style:name="Standard" style:page-layout-name="pm1"/>']
+    for i in range(2, sections + 1):
+        masters.append(
+            f'<style:master-page style:name="Oddil{i}" style:page-layout-name="pm1">'
+            f"<style:header><text:p>Syntetická práce – oddíl {i}</text:p></style:header>"
+            '<style:footer><text:p><text:page-number text:select-page="current">1</text:page-number></text:p></style:footer>'
+            "</style:master-page>"
+        )
+
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><office:document-styles {_ODF_NS}><office:styles>'
+        f'<style:default-style style:family="paragraph"><style:text-properties {font}/></style:default-style>'
+        + para("Standard", "Standard", props='fo:text-align="justify" fo:line-height="150%"', text_props=font)
+        + para("Text_20_body", "Text body", parent="Standard")
+        + para("Heading", "Heading", parent="Standard")
+        + headings
+        + para("Index", "Index", parent="Standard")
+        + contents
+        + para("Contents_20_Heading", "Contents Heading", parent="Heading")
+        + para("Caption", "Caption", parent="Standard", text_props='fo:font-style="italic"')
+        + para("Figure", "Figure", parent="Caption")
+        + para("Illustration_20_Index_20_1", "Illustration Index 1", parent="Index")
+        + para("Bibliography_20_1", "Bibliography 1", parent="Index")
+        + f"<text:outline-style style:name=\"Outline\">{outline}</text:outline-style>"
+        + "</office:styles><office:automatic-styles>"
+        '<style:page-layout style:name="pm1"><style:page-layout-properties '
+        'fo:page-width="21.001cm" fo:page-height="29.7cm" style:print-orientation="portrait"/>'
+        "</style:page-layout></office:automatic-styles>"
+        f"<office:master-styles>{''.join(masters)}</office:master-styles></office:document-styles>"
+    )
+
+
+def generate_odt(
+    path: str | Path,
+    paragraphs: int = 10_000,
+    headings: int = 200,
+    figures: int = 100,
+    sections: int = 12,
+    seed: int = 0,
+) -> GeneratedDocument:
+    path = Path(path)
+    rng = random.Random(seed)
+    sections = max(3, sections)
+    body = _plan_body(rng, paragraphs, headings, figures, sections)
+
+    def p(text: str, style: str = "Text_20_body") -> str:
+        return f'<text:p text:style-name="{style}">{text}</text:p>'
+
+    # první odstavec oddílu nese automatický styl s master page
+    auto_styles = "".join(
+        f'<style:style style:name="PSection{i}" style:family="paragraph" '
+        f'style:parent-style-name="Text_20_body" style:master-page-name="Oddil{i}">'
+        f'<style:paragraph-properties style:page-number="{1 if i == 2 else "auto"}"/></style:style>'
+        for i in range(2, sections + 1)
+    )
+
+    out = [p("Syntetická práce", "Standard")]
+
+    toc = "".join(
+        p(escape(f"{number} {title}") + f"<text:tab/>{h + 1}", f"Contents_20_{level}")
+        for h, (level, number, title) in enumerate(zip(body.levels, body.numbers, body.titles))
+    )
+    out.append(
+        '<text:table-of-content text:name="Obsah1">'
+        '<text:table-of-content-source text:outline-level="3"/>'
+        f'<text:index-body><text:index-title text:name="Obsah1_Head">{p("Obsah", "Contents_20_Heading")}'
+        f"</text:index-title>{toc}</text:index-body></text:table-of-content>"
+    )
+
+    section = 1
+    pictures = {}
+    for item_section, kind, data in body.items:
+        while item_section > section:
+            section += 1
+            out.append(p("", f"PSection{section}"))
+
+        if kind == "heading":
+            level = body.levels[data]
+            out.append(
+                f'<text:h text:style-name="Heading_20_{level}" text:outline-level="{level}">'
+                f'<text:bookmark text:name="_Toc{data:06d}"/>{escape(body.titles[data])}</text:h>'
+            )
+        elif kind == "figure":
+            name = f"Pictures/image{data}.png"
+            pictures[name] = _png(64 + data % 64, 48, data % 256)
+            out.append(p(
+                f'<draw:frame draw:name="Obrázek{data}" text:anchor-type="as-char" '
+                'svg:width="10.583cm" svg:height="7.938cm">'
+                f'<draw:image xlink:href="{name}" xlink:type="simple" xlink:show="embed" xlink:actuate="onLoad"/>'
+                "</draw:frame>",
+                "Standard",
+            ))
+            out.append(p(
+                f'<text:bookmark-start text:name="_Ref{data:06d}"/>Obrázek '
+                f'<text:sequence text:ref-name="refIllustration{data - 1}" text:name="Illustration" '
+                f'text:formula="ooow:Illustration+1" style:num-format="1">{data}</text:sequence>'
+                f'<text:bookmark-end text:name="_Ref{data:06d}"/> {escape(_sentence(rng, 4))}',
+                "Figure",
+            ))
+            out.append(p(
+                "Jak ukazuje "
+                f'<text:sequence-ref text:reference-format="category-and-value" '
+                f'text:ref-name="refIllustration{data - 1}">Obrázek {data}</text:sequence-ref>'
+                f", {escape(_sentence(rng, 6).lower())}"
+            ))
+        else:
+            out.append(p(escape(data)))
+
+    while section < sections:
+        section += 1
+        out.append(p("", f"PSection{section}"))
+
+    figure_entries = "".join(
+        p(f"Obrázek {figure}<text:tab/>{figure}", "Illustration_20_Index_20_1")
+        for figure in range(1, figures + 1)
+    )
+    out.append(
+        '<text:illustration-index text:name="Seznam obrázků1">'
+        '<text:illustration-index-source text:caption-sequence-name="Illustration"/>'
+        f'<text:index-body><text:index-title text:name="Seznam obrázků1_Head">'
+        f'{p("Seznam obrázků", "Contents_20_Heading")}</text:index-title>{figure_entries}'
+        "</text:index-body></text:illustration-index>"
+    )
+
+    sources = "".join(
+        p(escape(f"AUTOR, Jan. {_sentence(rng, 5)} Praha, {2000 + i}."), "Bibliography_20_1")
+        for i in range(20)
+    )
+    out.append(
+        '<text:h text:style-name="Heading_20_1" text:outline-level="1">Literatura</text:h>'
+        '<text:bibliography text:name="Literatura1"><text:bibliography-source/>'
+        f"<text:index-body>{sources}</text:index-body></text:bibliography>"
+    )
+
+    content = (
+        f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {_ODF_NS}>'
+        f"<office:automatic-styles>{auto_styles}</office:automatic-styles>"
+        f"<office:body><office:text>{''.join(out)}</office:text></office:body>"
+        "</office:document-content>"
+    )
+
+    mimetype = "application/vnd.oasis.opendocument.text"
+    manifest = _odf_manifest(
+        [("content.xml", "text/xml"), ("styles.xml", "text/xml")]
+        + [(name, "image/png") for name in pictures],
+        mimetype,
+    )
+
+    _write_zip(path, {
+        "META-INF/manifest.xml": manifest,
+        "content.xml": content,
+        "styles.xml": _odt_styles(sections),
+        **pictures,
+    }, mimetype=mimetype)
+
+    return GeneratedDocument(
+        path, "odt",
+        paragraphs=content.count("<text:p ") + content.count("<text:h "),
+        headings=headings + 1, figures=figures, sections=sections,
+    )
+
+
+# --- tabulky ---
+
+def _patients(rng: random.Random, rows: int):
+    """Řádky listu data: (pacient, pohlaví, výška, váha)."""
+    for i in range(1, rows + 1):
+        height = round(rng.uniform(150, 200), 1)
+        weight = round(rng.uniform(45, 120), 1)
+        yield i, rng.choice(("žena", "muž")), height, weight
+
+
+def _bmi(height: float, weight: float) -> float:
+    return weight / (height / 100) ** 2
+
+
+def generate_xlsx(path: str | Path, rows: int = 100_000, seed: int = 0) -> GeneratedDocument:
+    path = Path(path)
+    rng = random.Random(seed)
+
+    strings = list(_DATA_HEADER) + ["žena", "muž", "ne", "více"]
+    sst = {s: i for i, s in enumerate(strings)}
+    last = rows + 1
+
+    data = list(_patients(rng, rows))
+    mean = sum(_bmi(h, w) for _, _, h, w in data) / max(1, len(data))
+
+    out = ['<row r="1">' + "".join(
+        f'<c r="{col}1" s="1" t="s"><v>{sst[text]}</v></c>'
+        for col, text in zip("ABCDEF", _DATA_HEADER)
+    ) + "</row>"]
+
+    for r, (patient, gender, height, weight) in enumerate(data, start=2):
+        bmi = _bmi(height, weight)
+        flag = "ne" if mean > bmi else "více"
+
+        if r == 2:
+            e_formula = f'<f t="shared" ref="E2:E{last}" si="0">D2/(C2/100)^2</f>'
+            f_formula = f'<f t="shared" ref="F2:F{last}" si="1">IF(E${last + 2}&gt;E2,"ne","více")</f>'
+        else:
+            e_formula = '<f t="shared" si="0"/>'
+            f_formula = '<f t="shared" si="1"/>'
+
+        out.append(
+            f'<row r="{r}">'
+            f'<c r="A{r}"><v>{patient}</v></c>'
+            f'<c r="B{r}" t="s"><v>{sst[gender]}</v></c>'
+            f'<c r="C{r}" s="2"><v>{height}</v></c>'
+            f'<c r="D{r}" s="2"><v>{weight}</v></c>'
+            f'<c r="E{r}" s="2">{e_formula}<v>{bmi!r}</v></c>'
+            f'<c r="F{r}" t="str">{f_formula}<v>{flag}</v></c>'
+            "</row>"
+        )
+
+    # souhrnná statistika pod daty
+    stats = [("AVERAGE", mean), ("MEDIAN", None), ("STDEV", None), ("MIN", None), ("MAX", None)]
+    for offset, (func, value) in enumerate(stats, start=2):
+        r = last + offset
+        cached = f"<v>{value!r}</v>" if value is not None else ""
+        out.append(f'<row r="{r}"><c r="E{r}" s="2"><f>{func}(E2:E{last})</f>{cached}</c></row>')
+
+    sheet = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><worksheet {_XLSX_NS}>'
+        f'<dimension ref="A1:F{last + len(stats) + 1}"/>'
+        f"<sheetData>{''.join(out)}</sheetData>"
+        f'<conditionalFormatting sqref="E2:E{last}"><cfRule type="cellIs" dxfId="0" priority="1" '
+        'operator="greaterThan"><formula>25</formula></cfRule></conditionalFormatting>'
+        "</worksheet>"
+    )
+    source = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><worksheet {_XLSX_NS}>'
+        '<sheetData><row r="1"><c r="A1" t="s"><v>0</v></c></row></sheetData></worksheet>'
+    )
+
+    shared = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><sst {_XLSX_NS.split(" ")[0]} '
+        f'count="{len(strings)}" uniqueCount="{len(strings)}">'
+        + "".join(f"<si><t>{escape(s)}</t></si>" for s in strings)
+        + "</sst>"
+    )
+    styles = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><styleSheet {_XLSX_NS.split(" ")[0]}>'
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="0.00"/></numFmts>'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+        '<alignment horizontal="center" wrapText="1"/></xf>'
+        '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '<dxfs count="1"><dxf><font><b/></font></dxf></dxfs></styleSheet>'
+    )
+    workbook = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><workbook {_XLSX_NS}>'
+        '<sheets><sheet name="zdroj" sheetId="1" r:id="rId1"/><sheet name="data" sheetId="2" r:id="rId2"/></sheets>'
+        f'<definedNames><definedName name="pole">data!$E$2:$E${last}</definedName></definedNames>'
+        "</workbook>"
+    )
+
+    ct = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f'<Override PartName="/xl/workbook.xml" ContentType="{ct}.sheet.main+xml"/>'
+        f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{ct}.worksheet+xml"/>'
+        f'<Override PartName="/xl/worksheets/sheet2.xml" ContentType="{ct}.worksheet+xml"/>'
+        f'<Override PartName="/xl/styles.xml" ContentType="{ct}.styles+xml"/>'
+        f'<Override PartName="/xl/sharedStrings.xml" ContentType="{ct}.sharedStrings+xml"/>'
+        "</Types>"
+    )
+
+    _write_zip(path, {
+        "[Content_Types].xml": content_types,
+        "_rels/.rels": _relationships([("rId1", f"{_REL}/officeDocument", "xl/workbook.xml")]),
+        "xl/workbook.xml": workbook,
+        "xl/_rels/workbook.xml.rels": _relationships([
+            ("rId1", f"{_REL}/worksheet", "worksheets/sheet1.xml"),
+            ("rId2", f"{_REL}/worksheet", "worksheets/sheet2.xml"),
+            ("rId3", f"{_REL}/styles", "styles.xml"),
+            ("rId4", f"{_REL}/sharedStrings", "sharedStrings.xml"),
+        ]),
+        "xl/worksheets/sheet1.xml": source,
+        "xl/worksheets/sheet2.xml": sheet,
+        "xl/styles.xml": styles,
+        "xl/sharedStrings.xml": shared,
+    })
+
+    return GeneratedDocument(path, "xlsx", rows=rows + 1 + len(stats), cells=6 * (rows + 1) + len(stats))
+
+
+def generate_ods(
+    path: str | Path,
+    rows: int = 100_000,
+    repeat_every: int = 50,
+    repeat_run: int = 20,
+    seed: int = 0,
+) -> GeneratedDocument:
+    """
+    List data se `rows` logickými řádky. Po každých `repeat_every` řádcích
+    následuje blok `repeat_run` stejných řádků zapsaný jedním
+    table:number-rows-repeated, na konci prázdné řádky jako z LibreOffice.
+    """
+    path = Path(path)
+    rng = random.Random(seed)
+
+    def cell(value, style=None, formula=None, repeat=None):
+        attrs = ""
+        if style:
+            attrs += f' table:style-name="{style}"'
+        if repeat:
+            attrs += f' table:number-columns-repeated="{repeat}"'
+        if formula:
+            attrs += f" table:formula={quoteattr(formula)}"
+        if value is None:
+            return f"<table:table-cell{attrs}/>"
+        if isinstance(value, str):
+            return (
+                f'<table:table-cell{attrs} office:value-type="string">'
+                f"<text:p>{escape(value)}</text:p></table:table-cell>"
+            )
+        return (
+            f'<table:table-cell{attrs} office:value-type="float" office:value="{value!r}">'
+            f"<text:p>{value}</text:p></table:table-cell>"
+        )
+
+    out = ['<table:table-row table:style-name="ro1">' + "".join(cell(t, "ce1") for t in _DATA_HEADER) + "</table:table-row>"]
+
+    last = rows + 1
+    stats_row = last + 2
+    r = 2
+    written = 0
+    patients = _patients(rng, rows)
+
+    while written < rows:
+        block = min(repeat_every, rows - written)
+        for _ in range(block):
+            patient, gender, height, weight = next(patients)
+            bmi = _bmi(height, weight)
+            out.append(
+                '<table:table-row table:style-name="ro1">'
+                + cell(patient)
+                + cell(gender)
+                + cell(height, "ce2")
+                + cell(weight, "ce2")
+                + cell(bmi, "ce2", f"of:=[.D{r}]/([.C{r}]/100)^2")
+                + cell("ne", None, f'of:=IF([.E${stats_row}]>[.E{r}];"ne";"více")')
+                + "</table:table-row>"
+            )
+            r += 1
+        written += block
+
+        run = min(repeat_run, rows - written)
+        if run > 0:
+            # opakované řádky nesou stejné hodnoty bez vzorců (jako po vložení hodnot)
+            out.append(
+                f'<table:table-row table:style-name="ro1" table:number-rows-repeated="{run}">'
+                + cell(0) + cell("žena") + cell(170.0, "ce2") + cell(70.0, "ce2")
+                + cell(_bmi(170.0, 70.0), "ce2") + cell("ne")
+                + "</table:table-row>"
+            )
+            for _ in range(run):
+                next(patients)
+            r += run
+            written += run
+
+    out.append('<table:table-row table:style-name="ro1">' + cell(None, repeat=6) + "</table:table-row>")
+    stats = ("AVERAGE", "MEDIAN", "STDEV", "MIN", "MAX")
+    for func in stats:
+        out.append(
+            '<table:table-row table:style-name="ro1">'
+            + cell(None, repeat=4) + cell(0.0, "ce2", f"of:={func}([.E2:.E{last}])")
+            + "</table:table-row>"
+        )
+    out.append(
+        '<table:table-row table:style-name="ro1" table:number-rows-repeated="1048000">'
+        + cell(None, repeat=1024) + "</table:table-row>"
+    )
+
+    content = (
+        f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {_ODF_NS}>'
+        "<office:automatic-styles>"
+        '<style:style style:name="ro1" style:family="table-row"/>'
+        '<number:number-style style:name="N2"><number:number number:decimal-places="2" '
+        'number:min-integer-digits="1"/></number:number-style>'
+        '<style:style style:name="ce1" style:family="table-cell" style:parent-style-name="Default">'
+        '<style:table-cell-properties fo:wrap-option="wrap"/><style:paragraph-properties fo:text-align="center"/>'
+        '<style:text-properties fo:font-weight="bold"/></style:style>'
+        '<style:style style:name="ce2" style:family="table-cell" style:parent-style-name="Default" '
+        'style:data-style-name="N2"/>'
+        "</office:automatic-styles><office:body><office:spreadsheet>"
+        '<table:table table:name="zdroj"><table:table-row>'
+        + cell("Pacient") + "</table:table-row></table:table>"
+        '<table:table table:name="data">'
+        '<table:table-column table:number-columns-repeated="6" table:default-cell-style-name="Default"/>'
+        + "".join(out)
+        + "</table:table></office:spreadsheet></office:body></office:document-content>"
+    )
+    styles = (
+        f'<?xml version="1.0" encoding="UTF-8"?><office:document-styles {_ODF_NS}><office:styles>'
+        '<style:style style:name="Default" style:family="table-cell"/></office:styles></office:document-styles>'
+    )
+
+    mimetype = "application/vnd.oasis.opendocument.spreadsheet"
+    _write_zip(path, {
+        "META-INF/manifest.xml": _odf_manifest([("content.xml", "text/xml"), ("styles.xml", "text/xml")], mimetype),
+        "content.xml": content,
+        "styles.xml": styles,
+    }, mimetype=mimetype)
+
+    return GeneratedDocument(path, "ods", rows=rows + 1 + len(stats), cells=6 * (rows + 1) + len(stats))
+
+
+def generate_all(directory: str | Path, scale: float = 1.0, seed: int = 0) -> list[GeneratedDocument]:
+    """
+    Vygeneruje sadu DOCX / ODT / XLSX / ODS. scale=1 odpovídá 10 000
+    odstavcům, 200 nadpisům, 100 obrázkům a 100 000 řádkům.
+    """
+    directory = Path(directory)
+
+    def n(value: int, minimum: int = 1) -> int:
+        return max(minimum, round(value * scale))
+
+    text = dict(
+        paragraphs=n(10_000), headings=n(200, 3), figures=n(100), sections=n(12, 3), seed=seed,
+    )
+    tag = f"s{scale:g}"
+
+    return [
+        generate_docx(directory / f"bench-{tag}.docx", **text),
+        generate_odt(directory / f"bench-{tag}.odt", **text),
+        generate_xlsx(directory / f"bench-{tag}.xlsx", rows=n(100_000), seed=seed),
+        generate_ods(directory / f"bench-{tag}.ods", rows=n(100_000), seed=seed),
+    ]
@@ -0,0 +1,394 @@
+"""
+Benchmark načtení dokumentů a všech kontrol nad syntetickými soubory.
+
+    python -m benchmarks.run --scale 0.1
+    python -m benchmarks.run --repeat 3 --json bench.json
+    python -m benchmarks.run --compare bench.json
+
+Soubory se generují deterministicky (benchmarks/generators.py) do --data,
+stejný scale a seed dají vždy stejné dokumenty.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from assignment.excel.excel_assignment_loader import load_excel_assignment
+from assignment.word.word_assignment_loader import load_assignment
+from benchmarks.generators import GeneratedDocument, generate_all
+from checks.excel.chart.chart_formatting_check import ChartFormattingCheck
+from checks.excel.chart.chart_type_check import ChartTypeCheck
+from checks.excel.chart.missing_chart_check import MissingChartCheck
+from checks.excel.chart.threeD_chart_check import ThreeDChartCheck
+from checks.excel.data_process.array_formula_check import ArrayFormulaCheck
+from checks.excel.data_process.descriptive_statistic_check import DescriptiveStatisticsCheck
+from checks.excel.data_process.missing_desciptive_statistic_check import MissingDescriptiveStatisticsCheck
+from checks.excel.data_process.missing_wrong_formula_check import MissingOrWrongFormulaOrNotCalculatedCheck
+from checks.excel.data_process.named_range_usage_check import NamedRangeUsageCheck
+from checks.excel.data_process.non_copyable_formula_check import NonCopyableFormulasCheck
+from checks.excel.data_process.redundant_absolute_reference_check import RedundantAbsoluteReferenceCheck
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
+from checks.excel.data_process.required_source_worksheet_check import RequiredSourceWorksheetCheck
+from checks.excel.formatting.cells_merge_check import MergedCellsCheck
+from checks.excel.formatting.conditional_formatting_check import ConditionalFormattingExistsCheck
+from checks.excel.formatting.conditional_formatting_is_correct_check import ConditionalFormattingCorrectnessCheck
+from checks.excel.formatting.header_formatting_check import HeaderFormattingCheck
+from checks.excel.formatting.number_formatting_check import NumberFormattingCheck
+from checks.excel.formatting.table_border_check import TableBorderCheck
+from checks.excel.formatting.wrap_text_check import WrapTextCheck
+from checks.word.bibliography.bibliography_exist_check import MissingBibliographyCheck
+from checks.word.bibliography.bibliography_up_to_date_check import BibliographyNotUpdatedCheck
+from checks.word.formatting.bibliography_style_check import BibliographyStyleCheck
+from checks.word.formatting.caption_style_check import CaptionStyleCheck
+from checks.word.formatting.content_style_check import ContentHeadingStyleCheck
+from checks.word.formatting.cover_styles_check import CoverStylesCheck
+from checks.word.formatting.custom_style_inheritance_check import CustomStyleInheritanceCheck
+from checks.word.formatting.custom_style_usage_check import RequiredCustomStylesUsageCheck
+from checks.word.formatting.custom_style_with_tabs_check import CustomStyleWithTabsCheck
+from checks.word.formatting.frontpage_styles_check import FrontpageStylesCheck
+from checks.word.formatting.heading_hierarchical_numbering_check import HeadingHierarchicalNumberingCheck
+from checks.word.formatting.heading_style_check import HeadingStyleCheck
+from checks.word.formatting.headings_used_corretcly_check import HeadingsUsedCorrectlyCheck
+from checks.word.formatting.incosistent_formatting_check import InconsistentFormattingCheck
+from checks.word.formatting.list_level_2_used_check import ListLevel2UsedCheck
+from checks.word.formatting.main_chapter_starts_on_new_page_check import MainChapterStartsOnNewPageCheck
+from checks.word.formatting.manual_horizontal_formatting_check import ManualHorizontalSpacingCheck
+from checks.word.formatting.manual_vertical_formatting_check import ManualVerticalSpacingCheck
+from checks.word.formatting.normal_style_check import NormalStyleCheck
+from checks.word.formatting.original_formatting_check import OriginalFormattingCheck
+from checks.word.formatting.toc_heading_numbering_check import TocHeadingNumberingCheck
+from checks.word.formatting.unnumbered_special_headings_check import UnnumberedSpecialHeadingsCheck
+from checks.word.header_footer.header_footer_missing_check import HeaderFooterMissingCheck
+from checks.word.header_footer.second_section_header_text_check import SecondSectionHeaderHasTextCheck
+from checks.word.header_footer.second_section_page_num_start_at_one_check import SecondSectionPageNumberStartsAtOneCheck
+from checks.word.header_footer.section_emty_footer_check import SectionFooterEmptyCheck
+from checks.word.header_footer.section_emty_header_check import SectionHeaderEmptyCheck
+from checks.word.header_footer.section_footer_linked_check import FooterLinkedToPreviousCheck
+from checks.word.header_footer.section_footer_page_number_check import SectionFooterHasPageNumberCheck
+from checks.word.header_footer.section_header_linked_check import HeaderNotLinkedToPreviousCheck
+from checks.word.objects.image_low_quality_check import ImageLowQualityCheck
+from checks.word.objects.list_of_figures_not_up_to_date_check import ListOfFiguresNotUpdatedCheck
+from checks.word.objects.missing_list_of_fugures_check import MissingListOfFiguresCheck
+from checks.word.objects.object_caption_bindings_check import ObjectCaptionBindingCheck
+from checks.word.objects.object_caption_check import ObjectCaptionCheck
+from checks.word.objects.object_caption_description_check import ObjectCaptionDescriptionCheck
+from checks.word.objects.object_cross_reference_check import ObjectCrossReferenceCheck
+from checks.word.sections.section1_toc_check import Section1TOCCheck
+from checks.word.sections.section2_text_check import Section2TextCheck
+from checks.word.sections.section3_bibliography_check import Section3BibliographyCheck
+from checks.word.sections.section3_figure_list_check import Section3FigureListCheck
+from checks.word.sections.section3_table_list_check import Section3TableListCheck
+from checks.word.sections.section_count_check import SectionCountCheck
+from checks.word.structure.chapter_numbering_continuity_check import ChapterNumberingContinuityCheck
+from checks.word.structure.document_structure_check import DocumentStructureCheck
+from checks.word.structure.first_chapter_page1_check import FirstChapterStartsOnPageOneCheck
+from checks.word.structure.toc_exists_check import TOCExistsCheck
+from checks.word.structure.toc_first_section_check import TOCFirstSectionContentCheck
+from checks.word.structure.toc_heading_levels_check import TOCHeadingLevelsCheck
+from checks.word.structure.toc_illegal_content_check import TOCIllegalContentCheck
+from checks.word.structure.toc_up_to_date_check import TOCUpToDateCheck
+from core.batch import TEXT_SUFFIXES, load_document
+from core.profiling import Profiler
+from document import xml_backend
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def text_checks() -> list:
+    return [
+        SectionCountCheck(),
+        Section1TOCCheck(),
+        Section2TextCheck(),
+        Section3FigureListCheck(),
+        Section3TableListCheck(),
+        Section3BibliographyCheck(),
+        NormalStyleCheck(),
+        HeadingStyleCheck(1),
+        HeadingStyleCheck(2),
+        HeadingStyleCheck(3),
+        HeadingHierarchicalNumberingCheck(),
+        TocHeadingNumberingCheck(),
+        UnnumberedSpecialHeadingsCheck(),
+        CoverStylesCheck(),
+        FrontpageStylesCheck(),
+        BibliographyStyleCheck(),
+        CaptionStyleCheck(),
+        ContentHeadingStyleCheck(),
+        HeadingsUsedCorrectlyCheck(),
+        OriginalFormattingCheck(),
+        CustomStyleInheritanceCheck(),
+        RequiredCustomStylesUsageCheck(),
+        CustomStyleWithTabsCheck(),
+        MainChapterStartsOnNewPageCheck(),
+        ManualHorizontalSpacingCheck(),
+        ManualVerticalSpacingCheck(),
+        ListLevel2UsedCheck(),
+        InconsistentFormattingCheck(),
+        TOCExistsCheck(),
+        TOCUpToDateCheck(),
+        DocumentStructureCheck(),
+        TOCHeadingLevelsCheck(),
+        TOCFirstSectionContentCheck(),
+        TOCIllegalContentCheck(),
+        FirstChapterStartsOnPageOneCheck(),
+        ChapterNumberingContinuityCheck(),
+        MissingListOfFiguresCheck(),
+        ListOfFiguresNotUpdatedCheck(),
+        ImageLowQualityCheck(),
+        ObjectCaptionCheck(),
+        ObjectCaptionDescriptionCheck(),
+        ObjectCrossReferenceCheck(),
+        ObjectCaptionBindingCheck(),
+        MissingBibliographyCheck(),
+        BibliographyNotUpdatedCheck(),
+        HeaderFooterMissingCheck(),
+        SecondSectionHeaderHasTextCheck(),
+        SecondSectionPageNumberStartsAtOneCheck(),
+        HeaderNotLinkedToPreviousCheck(2),
+        HeaderNotLinkedToPreviousCheck(3),
+        FooterLinkedToPreviousCheck(2),
+        FooterLinkedToPreviousCheck(3),
+        SectionHeaderEmptyCheck(1),
+        SectionHeaderEmptyCheck(3),
+        SectionFooterEmptyCheck(1),
+        SectionFooterHasPageNumberCheck(2),
+        SectionFooterHasPageNumberCheck(3),
+    ]
+
+
+def spreadsheet_checks() -> list:
+    return [
+        RequiredSourceWorksheetCheck(),
+        RequiredDataWorksheetCheck(),
+        NonCopyableFormulasCheck(),
+        MissingOrWrongFormulaOrNotCalculatedCheck(),
+        ArrayFormulaCheck(),
+        NamedRangeUsageCheck(),
+        RedundantAbsoluteReferenceCheck(),
+        DescriptiveStatisticsCheck(),
+        MissingDescriptiveStatisticsCheck(),
+        NumberFormattingCheck(),
+        TableBorderCheck(),
+        MergedCellsCheck(),
+        HeaderFormattingCheck(),
+        ConditionalFormattingExistsCheck(),
+        ConditionalFormattingCorrectnessCheck(),
+        MissingChartCheck(),
+        ChartFormattingCheck(),
+        ChartTypeCheck(),
+        ThreeDChartCheck(),
+        WrapTextCheck(),
+    ]
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _run_once(generated: GeneratedDocument, checks, assignment) -> tuple[float, float, Profiler, dict]:
+    """
+    Jedno kolo: načtení dokumentu a všechny kontroly. Výjimka kontroly
+    benchmark nepřeruší, jen se zaznamená.
+    """
+    profiler = Profiler()
+    errors = {}
+    label = str(generated.path)
+
+    start = time.perf_counter()
+    document = load_document(generated.path)
+    load = time.perf_counter() - start
+
+    for check in checks:
+        def run(check=check):
+            try:
+                return check.run(document, assignment)
+            except Exception as e:
+                errors[check.name] = f"{type(e).__name__}: {e}"
+
+        profiler.run_check(label, check, run)
+
+    total = time.perf_counter() - start
+    document.close()
+    return load, total, profiler, errors
+
+
+def bench_document(generated: GeneratedDocument, checks, assignment, repeat: int) -> dict:
+    rounds = [_run_once(generated, checks, assignment) for _ in range(repeat)]
+
+    # do přehledu jde nejrychlejší kolo, medián zachytí rozptyl
+    load, total, profiler, errors = min(rounds, key=lambda r: r[1])
+    totals = [r[1] for r in rounds]
+
+    slowest = sorted(
+        ((t.name, t.wall) for t in profiler.timings),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+    return {
+        "kind": generated.kind,
+        "file": generated.path.name,
+        "size": generated.path.stat().st_size,
+        "paragraphs": generated.paragraphs,
+        "headings": generated.headings,
+        "figures": generated.figures,
+        "sections": generated.sections,
+        "rows": generated.rows,
+        "cells": generated.cells,
+        "checks": len(checks),
+        "load": load,
+        "checks_total": total - load,
+        "total": total,
+        "total_median": statistics.median(totals),
+        "documents_per_s": 1 / total if total else None,
+        "paragraphs_per_s": generated.paragraphs / total if total and generated.paragraphs else None,
+        "cells_per_s": generated.cells / total if total and generated.cells else None,
+        "slowest": dict(slowest[:5]),
+        "errors": errors,
+    }
+
+
+def _rate(value: float | None) -> str:
+    return f"{value:,.0f}".replace(",", " ") if value is not None else "–"
+
+
+def print_results(results: list[dict], previous: dict[str, dict] | None = None):
+    print(f"{'formát':<6} {'načtení':>9} {'kontroly':>9} {'celkem':>9} "
+          f"{'dok/s':>7} {'odst/s':>9} {'buněk/s':>10} {'chyby':>6}")
+
+    for r in results:
+        line = (
+            f"{r['kind']:<6} {r['load']:>8.3f}s {r['checks_total']:>8.3f}s {r['total']:>8.3f}s "
+            f"{r['documents_per_s']:>7.2f} {_rate(r['paragraphs_per_s']):>9} "
+            f"{_rate(r['cells_per_s']):>10} {len(r['errors']):>6}"
+        )
+
+        old = (previous or {}).get(r["kind"])
+        if old and old.get("total"):
+            change = (r["total"] - old["total"]) / old["total"] * 100
+            line += f"   {change:+.1f} % proti {old['total']:.3f}s"
+
+        print(line)
+
+        for name, wall in r["slowest"].items():
+            print(f"         {wall:8.3f}s  {name}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark načtení dokumentů a kontrol")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="velikost dokumentů; 1 = 10 000 odstavců, 200 nadpisů, "
+             "100 obrázků, 100 000 řádků (výchozí: 1)",
+    )
+    parser.add_argument(
+        "--data",
+        metavar="ADRESÁŘ",
+        default=".benchmarks",
+        help="kam uložit vygenerované dokumenty (výchozí: .benchmarks)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="počet kol pro každý dokument, hlásí se nejrychlejší",
+    )
+    parser.add_argument(
+        "--only",
+        metavar="FORMÁTY",
+        default=None,
+        help="jen vybrané formáty, např. docx,ods",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed generátorů (výchozí: 0)",
+    )
+    parser.add_argument(
+        "--json",
+        metavar="SOUBOR",
+        default=None,
+        help="uloží výsledky jako JSON pro pozdější porovnání",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="SOUBOR",
+        default=None,
+        help="porovná časy s dřívějším výstupem --json",
+    )
+    parser.add_argument(
+        "--xml-backend",
+        choices=xml_backend.BACKENDS,
+        default="etree",
+        help="parser XML adaptérů (lxml jen je-li nainstalované)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    backend = xml_backend.use(args.xml_backend)
+
+    data = Path(args.data) / f"seed{args.seed}"
+    print(f"Generuji dokumenty (scale={args.scale:g}) do {data} …", file=sys.stderr)
+    generated = generate_all(data, args.scale, args.seed)
+
+    if args.only:
+        kinds = {k.strip().lower().lstrip(".") for k in args.only.split(",")}
+        generated = [g for g in generated if g.kind in kinds]
+
+    text_assignment = load_assignment(str(_ROOT / "assignment/word/assignment.json"))
+    spreadsheet_assignment = load_excel_assignment(str(_ROOT / "assignment/excel/assignment.json"))
+
+    results = []
+    for g in generated:
+        if g.path.suffix in TEXT_SUFFIXES:
+            checks, assignment = text_checks(), text_assignment
+        else:
+            checks, assignment = spreadsheet_checks(), spreadsheet_assignment
+
+        print(f"Měřím {g.path.name} …", file=sys.stderr)
+        results.append(bench_document(g, checks, assignment, max(1, args.repeat)))
+
+    previous = None
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        previous = {r["kind"]: r for r in old.get("results", [])}
+        if old.get("scale") != args.scale or old.get("seed") != args.seed:
+            print(f"Pozor: {args.compare} má jiný scale/seed, časy nejsou srovnatelné.", file=sys.stderr)
+
+    print_results(results, previous)
+
+    if args.json:
+        out = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "xml_backend": backend,
+            "results": results,
+        }
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,29 @@ from assignment.word.word_assignment_model import WordAssignment
 
 
 class CheckResult:
-    def __init__(self, passed: bool, message: str, points: int, fatal: bool = False):
+    def __init__(
+        self,
+        passed: bool,
+        message: str,
+        points: int,
+        fatal: bool = False,
+        skipped: bool = False,
+        error: bool = False,
+    ):
         self.passed = passed
         self.message = message
         self.points = points
         self.fatal = fatal
+        self.skipped = skipped
+        # kontrola spadla na výjimce (poškozený soubor…), výsledek se necachuje
+        self.error = error
 
 
 class BaseCheck(ABC):
     name: str
     penalty: int
+    # třídy kontrol, které musí projít, jinak Runner tuto kontrolu přeskočí
+    requires: tuple[type["BaseCheck"], ...] = ()
 
     @abstractmethod
     def run(self,
@@ -1,4 +1,5 @@
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 from openpyxl.chart.bar_chart import BarChart
 
 # class ChartFormattingCheck(BaseCheck):
@@ -100,6 +101,7 @@ from openpyxl.chart.bar_chart import BarChart
 class ChartFormattingCheck(BaseCheck):
     name = "V grafu chybí název, popisy os nebo popisky dat"
     penalty = -2
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def run(self, document, assignment=None):
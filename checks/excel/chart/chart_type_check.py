@@ -50,11 +50,13 @@ from checks.base_check import BaseCheck, CheckResult
 #         )
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 
 class ChartTypeCheck(BaseCheck):
     name = "Nevhodný typ grafu"
     penalty = -5
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def normalize_chart_type(self, t: str | None) -> str | None:
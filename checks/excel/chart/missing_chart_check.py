@@ -33,11 +33,13 @@ from checks.base_check import BaseCheck, CheckResult
 #         )
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 
 class MissingChartCheck(BaseCheck):
     name = "Požadovaný graf zcela chybí"
     penalty = -100
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def run(self, document, assignment=None):
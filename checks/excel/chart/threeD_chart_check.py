@@ -45,11 +45,13 @@
 #         )
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 
 class ThreeDChartCheck(BaseCheck):
     name = "Použit 3D graf"
     penalty = -2
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def run(self, document, assignment=None):
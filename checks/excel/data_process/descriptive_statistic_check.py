@@ -52,10 +52,12 @@ from checks.base_check import BaseCheck, CheckResult
 #         )
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 class DescriptiveStatisticsCheck(BaseCheck):
     name = "Chybí popisná charakteristika pro datovou řadu"
     penalty = -5
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def row_from_addr(self, addr: str) -> int:
@@ -87,11 +87,13 @@
 
 import re
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 
 class MissingOrWrongFormulaOrNotCalculatedCheck(BaseCheck):
     name = "Zcela chybí výpočet / vzorec je chybný nebo není vypočten"
     penalty = -10
+    requires = (RequiredDataWorksheetCheck,)
     
     def run(self, document, assignment=None) -> CheckResult:
 
@@ -110,12 +112,15 @@ class MissingOrWrongFormulaOrNotCalculatedCheck(BaseCheck):
 
         errors = []
 
-        for addr, spec in assignment.cells.items():
-            expected = getattr(spec, "expression", None)
-            if not expected:
-                continue
+        expressions = {
+            addr: spec.expression
+            for addr, spec in assignment.cells.items()
+            if getattr(spec, "expression", None)
+        }
+        cells = document.get_range(sheet, expressions)
 
-            info = document.get_cell_info(sheet, addr)
+        for addr, expected in expressions.items():
+            info = cells.info(addr)
 
             if info is None:
                 errors.append(f"{sheet}!{addr}: buňka neexistuje")
@@ -17,24 +17,27 @@ class RedundantAbsoluteReferenceCheck(BaseCheck):
 
         problems = []
 
-        for addr, spec in assignment.cells.items():
-            expected = spec.expression
-            if not expected:
+        sheet = "data"
+        expressions = {
+            addr: spec.expression
+            for addr, spec in assignment.cells.items()
+            if spec.expression
+        }
+        cells = document.get_range(sheet, expressions)
+
+        for addr, expected in expressions.items():
+            i = cells.index(addr)
+            if not cells.exists[i]:
                 continue
 
-            sheet = "data"
-            cell = document.get_cell(f"{sheet}!{addr}")
-            if cell is None:
-                continue
-
-            student = cell["formula"]
+            student = cells.formulas[i]
             if not isinstance(student, str):
                 continue
 
             if student.replace("$", "") == expected.replace("$", ""):
                 if "$" in student and "$" not in expected:
                     problems.append(
-                        f"{cell['sheet']}!{addr}: {student}"
+                        f"{sheet}!{addr}: {student}"
                     )
 
         if problems:
@@ -2,7 +2,7 @@ from checks.base_check import BaseCheck, CheckResult
 
 
 class RequiredDataWorksheetCheck(BaseCheck):
-    name = "Požadovaný list „zdroj“ zcela chybí"
+    name = "Požadovaný list „data“ zcela chybí"
     penalty = -100
 
     def run(self, document, assignment=None):
@@ -1,5 +1,6 @@
 import re
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 from openpyxl.utils import range_boundaries
 
 # class MergedCellsCheck(BaseCheck):
@@ -64,6 +65,7 @@ from openpyxl.utils import range_boundaries
 class MergedCellsCheck(BaseCheck):
     name = "Chybné sloučení buněk"
     penalty = -1
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
 
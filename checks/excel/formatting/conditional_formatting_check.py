@@ -28,11 +28,13 @@
 #         )
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 
 class ConditionalFormattingExistsCheck(BaseCheck):
     name = "Chybí podmíněné formátování"
     penalty = -5
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def run(self, document, assignment=None):
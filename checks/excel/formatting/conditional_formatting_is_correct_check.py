@@ -1,4 +1,5 @@
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 import re
 
 # # NOTE - kontroluje se pouze, zda barva existuje.
@@ -117,6 +118,7 @@ import re
 class ConditionalFormattingCorrectnessCheck(BaseCheck):
     name = "Podmíněné formátování nefunguje správně"
     penalty = -2
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def _expected_from_assignment(self, assignment):
@@ -1,4 +1,5 @@
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 # class HeaderFormattingCheck(BaseCheck):
 #     name = "Není formátováno záhlaví tabulky"
@@ -59,6 +60,7 @@ from checks.base_check import BaseCheck, CheckResult
 class HeaderFormattingCheck(BaseCheck):
     name = "Není formátováno záhlaví tabulky"
     penalty = -1
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def run(self, document, assignment=None):
@@ -67,15 +69,15 @@ class HeaderFormattingCheck(BaseCheck):
 
         problems = []
 
-        for addr, spec in assignment.cells.items():
-            style_req = spec.style
-            if not style_req:
-                continue
-
-            if not style_req.get("bold"):
-                continue
+        headers = {
+            addr: spec.style
+            for addr, spec in assignment.cells.items()
+            if spec.style and spec.style.get("bold")
+        }
+        cells = document.get_range(self.SHEET, headers)
 
-            style = document.get_cell_style(self.SHEET, addr)
+        for addr, style_req in headers.items():
+            style = cells.style(addr)
             if style is None:
                 problems.append(f"{addr}: buňka neexistuje")
                 continue
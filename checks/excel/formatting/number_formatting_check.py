@@ -38,11 +38,13 @@
 #         return CheckResult(True, "Formátování odpovídá zadání.", 0)
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 from document.calc_document import CalcDocument
 
 class NumberFormattingCheck(BaseCheck):
     name = "Chybné formátování číselných hodnot"
     penalty = -2
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     def expected_decimal_places(self, fmt: str) -> int:
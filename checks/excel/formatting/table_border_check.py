@@ -1,9 +1,11 @@
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 from openpyxl.utils import range_boundaries
 
 class TableBorderCheck(BaseCheck):
     name = "Chybí vnitřní/vnější ohraničení tabulky"
     penalty = -1
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
 
     STYLE_EQUIV = {
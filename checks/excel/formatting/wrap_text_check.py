@@ -1,4 +1,5 @@
 from checks.base_check import BaseCheck, CheckResult
+from checks.excel.data_process.required_data_worksheet_check import RequiredDataWorksheetCheck
 
 # class WrapTextCheck(BaseCheck):
 #     name = "Není zalamování textu v buňce"
@@ -57,6 +58,7 @@ from checks.base_check import BaseCheck, CheckResult
 class WrapTextCheck(BaseCheck):
     name = "Není zalamování textu v buňce"
     penalty = -1
+    requires = (RequiredDataWorksheetCheck,)
     SHEET = "data"
     MIN_TEXT_LENGTH = 20
 
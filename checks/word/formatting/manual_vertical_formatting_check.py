@@ -89,20 +89,20 @@ class ManualVerticalSpacingCheck(BaseCheck):
     penalty = -5
 
     def run(self, document, assignment=None):
-        paragraphs = list(document.iter_paragraphs())
+        paragraphs = document.iter_paragraph_infos()
         errors = []
 
         i = 0
         while i < len(paragraphs) - 1:
             p = paragraphs[i]
 
-            if not document.paragraph_is_empty(p):
+            if not p.is_empty:
                 i += 1
                 continue
 
             empty_count = 1
             j = i + 1
-            while j < len(paragraphs) and document.paragraph_is_empty(paragraphs[j]):
+            while j < len(paragraphs) and paragraphs[j].is_empty:
                 empty_count += 1
                 j += 1
 
@@ -115,36 +115,25 @@ class ManualVerticalSpacingCheck(BaseCheck):
 
             next_p = paragraphs[j]
 
-            if not document.paragraph_has_text(next_p):
+            if next_p.is_empty:
                 i = j
                 continue
 
-
-            if document._paragraph_is_toc_or_object_list(next_p):
-                i = j
-                continue
-
-            if document.paragraph_is_generated(next_p):
-                i = j
-                continue
-
-            if document.paragraph_has_page_break(next_p):
-                i = j
-                continue
-
-            if document.paragraph_has_spacing_before(next_p):
-                i = j
-                continue
-
-            if document.paragraph_is_heading(next_p):
+            # generovaný obsah (obsah, seznamy, pole), zalomení stránky, mezera ve stylu, nadpis
+            if (
+                next_p.is_generated
+                or next_p.page_break_before
+                or next_p.spacing_before
+                or next_p.is_heading
+            ):
                 i = j
                 continue
 
             errors.append({
                 "empty_from": i + 1,
                 "empty_to": j,
-                "style": document.paragraph_style_name(next_p) or "bez stylu",
-                "text": document.paragraph_text(next_p),
+                "style": document.paragraph_style_name(next_p.element) or "bez stylu",
+                "text": next_p.text,
                 "count": empty_count,
             })
 
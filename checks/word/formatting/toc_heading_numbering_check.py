@@ -31,10 +31,12 @@
 #         )
 
 from checks.base_check import BaseCheck, CheckResult
+from checks.word.structure.toc_exists_check import TOCExistsCheck
 
 class TocHeadingNumberingCheck(BaseCheck):
     name = "Čísla nadpisů se nezobrazují v obsahu (nebo naopak)"
     penalty = -5
+    requires = (TOCExistsCheck,)
 
     def run(self, document, assignment=None):
         any_toc = False
@@ -1,6 +1,4 @@
 from checks.base_check import BaseCheck, CheckResult
-from PIL import Image
-import io
 
 
 class ImageLowQualityCheck(BaseCheck):
@@ -20,15 +18,12 @@ class ImageLowQualityCheck(BaseCheck):
             element = obj["element"]
 
             for rid in document.object_image_rids(element):
-                img_bytes = document.get_image_bytes(rid)
-                if not img_bytes:
+                # jen hlavička souboru, jednou pro každý obrázek v balíku
+                info = document.image_info(rid)
+                if info is None:
                     continue
 
-                try:
-                    image = Image.open(io.BytesIO(img_bytes))
-                    width, height = image.size
-                except Exception:
-                    continue
+                width, height = info.width, info.height
 
                 if width < self.MIN_WIDTH or height < self.MIN_HEIGHT:
                     return CheckResult(
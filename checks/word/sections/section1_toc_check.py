@@ -1,9 +1,11 @@
 from ...base_check import BaseCheck, CheckResult
+from ..structure.toc_exists_check import TOCExistsCheck
 
 
 class Section1TOCCheck(BaseCheck):
     name = "Obsah v 1. oddílu"
     penalty = -5
+    requires = (TOCExistsCheck,)
 
     def run(self, document, assignment=None):
         if not document.has_toc_in_section(0):
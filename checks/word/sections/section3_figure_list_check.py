@@ -1,8 +1,10 @@
 from ...base_check import BaseCheck, CheckResult
+from .section_count_check import SectionCountCheck
 
 class Section3FigureListCheck(BaseCheck):
     name = "Seznam obrázků ve 3. oddílu"
     penalty = -5
+    requires = (SectionCountCheck,)
 
     def run(self, document, assignment=None):
         if document.has_list_of_figures_in_section(2):
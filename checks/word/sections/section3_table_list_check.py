@@ -1,8 +1,10 @@
 from ...base_check import BaseCheck, CheckResult
+from .section_count_check import SectionCountCheck
 
 class Section3TableListCheck(BaseCheck):
     name = "Seznam tabulek ve 3. oddílu"
     penalty = -5
+    requires = (SectionCountCheck,)
 
     def run(self, document, assignment=None):
         has_tables = False
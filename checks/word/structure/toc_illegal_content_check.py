@@ -1,26 +1,27 @@
 from checks.base_check import BaseCheck, CheckResult
+from checks.word.structure.toc_exists_check import TOCExistsCheck
+from document.writer_document import WriterDocument
 import re
 
 
 class TOCIllegalContentCheck(BaseCheck):
     name = "Ruční text nebo nepovolená položka v obsahu"
     penalty = -10
+    requires = (TOCExistsCheck,)
 
     def _clean_text(self, text: str) -> str:
         return re.sub(r"\s+", " ", text or "").strip()
 
     def run(self, document, assignment=None):
-        toc_section = None
-        for i in range(document.section_count()):
-            if document.has_toc_in_section(i):
-                toc_section = i
-                break
-
-        if toc_section is None:
+        toc = document.table_of_contents()
+        if toc is None:
             return CheckResult(True, "Obsah dokumentu neexistuje.", 0)
 
+        if isinstance(document, WriterDocument):
+            return self._result(self._writer_errors(document, toc))
+
         toc_sdt = None
-        for el in document.section(toc_section):
+        for el in document.section(toc.section):
             if el.tag.endswith("}sdt"):
                 pr = el.find("w:sdtPr", document.NS)
                 if pr is not None and pr.find("w:docPartObj", document.NS) is not None:
@@ -34,21 +35,8 @@ class TOCIllegalContentCheck(BaseCheck):
                 self.penalty
             )
 
-        heading_bookmarks = set()
-
-        for p in document._xml.findall(".//w:body/w:p", document.NS):
-            sid = document._paragraph_style_id(p)
-            if not sid:
-                continue
-
-            lvl = document._style_level_from_styles_xml(sid)
-            if lvl is None or not (1 <= lvl <= 3):
-                continue
-
-            for bm in p.findall(".//w:bookmarkStart", document.NS):
-                name = bm.attrib.get(f"{{{document.NS['w']}}}name")
-                if name:
-                    heading_bookmarks.add(name)
+        heading_bookmarks = document.heading_bookmarks(3)
+        entries = {entry.element: entry for entry in toc.entries}
 
         errors = []
 
@@ -80,20 +68,14 @@ class TOCIllegalContentCheck(BaseCheck):
                     errors.append(f"Ručně vložený text v obsahu: „{text}“")
                 continue
 
-            text = document._visible_text(link)
-
-            has_pageref = False
-
-            for instr in link.findall(".//w:instrText", document.NS):
-                if instr.text and "PAGEREF" in instr.text:
-                    has_pageref = True
-                    break
+            entry = entries.get(el)
+            text = entry.text if entry is not None else document._visible_text(link)
 
-            if not has_pageref:
+            if entry is None or not entry.has_page_ref:
                 errors.append(f"Položka obsahu bez odkazu na stránku: „{text}“")
                 continue
 
-            anchor = link.attrib.get(f"{{{document.NS['w']}}}anchor")
+            anchor = entry.anchor
 
             if not anchor:
                 errors.append(f"Položka obsahu bez anchor odkazu: „{text}“")
@@ -110,6 +92,54 @@ class TOCIllegalContentCheck(BaseCheck):
                         f"Položka obsahu bez odpovídajícího nadpisu: „{text}“"
                     )
 
+        return self._result(errors)
+
+    def _writer_errors(self, document, toc) -> list[str]:
+        """
+        Rejstřík ODT: obsah je v text:index-body. Čísla stránek jsou jen
+        text (PAGEREF ani záložky tu nejsou), za ruční text se tedy bere
+        odstavec bez odkazu jen tam, kde ostatní položky odkazy mají.
+        """
+        body = toc.element.find("text:index-body", document.NS)
+        if body is None:
+            return []
+
+        entries = {entry.element: entry for entry in toc.entries}
+        linked = any(entry.has_link for entry in toc.entries)
+
+        errors = []
+
+        for el in body:
+            if el.tag.endswith("}index-title"):
+                continue
+
+            if el.tag.endswith("}table"):
+                errors.append("V obsahu je vložená tabulka.")
+                continue
+
+            tags = {child.tag.rsplit("}", 1)[-1] for child in el.iter()}
+
+            if "math" in tags:
+                errors.append("V obsahu je vložená rovnice.")
+                continue
+
+            if "frame" in tags:
+                errors.append("V obsahu je vložený obrázek nebo graf.")
+                continue
+
+            if not el.tag.endswith("}p"):
+                errors.append("V obsahu je nepovolený objekt.")
+                continue
+
+            entry = entries.get(el)
+            if linked and (entry is None or not entry.has_link):
+                text = self._clean_text(document.paragraph_text(el))
+                if text and text.lower() != "obsah":
+                    errors.append(f"Ručně vložený text v obsahu: „{text}“")
+
+        return errors
+
+    def _result(self, errors: list[str]) -> CheckResult:
         if errors:
             return CheckResult(
                 False,
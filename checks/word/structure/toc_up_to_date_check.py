@@ -1,10 +1,12 @@
 import re
 from checks.base_check import BaseCheck, CheckResult
+from checks.word.structure.toc_exists_check import TOCExistsCheck
 
 
 class TOCUpToDateCheck(BaseCheck):
     name = "Obsah není aktuální"
     penalty = -5
+    requires = (TOCExistsCheck,)
 
     ALLOWED_EXTRA_TOC_ITEMS = {
         "bibliografie",
@@ -23,13 +25,8 @@ class TOCUpToDateCheck(BaseCheck):
         return text.strip()
         
     def run(self, document, assignment=None):
-        toc_section = None
-        for i in range(document.section_count()):
-            if document.has_toc_in_section(i):
-                toc_section = i
-                break
-
-        if toc_section is None:
+        toc = document.table_of_contents()
+        if toc is None:
             return CheckResult(True, "Obsah neexistuje – nelze ověřit aktuálnost.", 0)
 
         headings = {
@@ -43,29 +40,10 @@ class TOCUpToDateCheck(BaseCheck):
 
         toc_items = set()
 
-        paragraphs = document.section(toc_section)
-        inside_toc = False
-
-        for el in paragraphs:
-            for p in el.findall(".//w:p", document.NS):
-                for instr in p.findall(".//w:instrText", document.NS):
-                    if instr.text and instr.text.strip().upper().startswith("TOC"):
-                        inside_toc = True
-                        break
-
-                if not inside_toc:
-                    continue
-
-                if p.find("w:pPr/w:sectPr", document.NS) is not None:
-                    break
-
-                hl = p.find("w:hyperlink", document.NS)
-                if hl is None:
-                    continue
-
-                text = self._norm(document._visible_text(hl))
-                if text and text.lower() != "obsah":
-                    toc_items.add(text)
+        for entry in toc.entries:
+            text = self._norm(entry.text)
+            if text and text.lower() != "obsah":
+                toc_items.add(text)
 
         allowed = {t.lower() for t in self.ALLOWED_EXTRA_TOC_ITEMS}
 
@@ -0,0 +1,193 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator
+
+from checks.base_check import CheckResult
+from core.profiling import Profiler
+from core.report import Report
+from core.result_cache import ResultCache
+from core.runner import Runner
+from document import xml_backend
+from document.spreadsheet_document import SpreadsheetDocument
+from document.text_document import TextDocument
+
+TEXT_SUFFIXES = {".docx", ".odt"}
+SPREADSHEET_SUFFIXES = {".xlsx", ".ods"}
+
+
+def load_document(path: str | Path):
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix in TEXT_SUFFIXES:
+        return TextDocument.from_path(path)
+
+    if suffix in SPREADSHEET_SUFFIXES:
+        return SpreadsheetDocument.from_path(path)
+
+    raise ValueError(f"Nepodporovaný formát odevzdání: {path}")
+
+
+def discover_submissions(directory: str | Path) -> list[Path]:
+    directory = Path(directory)
+    found = []
+
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+
+        # zámky a dočasné soubory Office / LibreOffice
+        if path.name.startswith(("~$", ".~lock")):
+            continue
+
+        if path.suffix.lower() in TEXT_SUFFIXES | SPREADSHEET_SUFFIXES:
+            found.append(path)
+
+    return found
+
+
+def grade_submission(
+    path: Path,
+    checks,
+    assignment,
+    cache: ResultCache | None = None,
+    profiler: Profiler | None = None,
+    fail_fast: bool = False,
+    debug_dir: str | Path | None = None,
+    debug_parts: list[str] | None = None,
+) -> Report:
+    report = Report()
+
+    try:
+        document = load_document(path)
+    except Exception as e:
+        report.add(
+            "Načtení dokumentu",
+            CheckResult(False, f"Soubor nelze načíst: {e}", 0, fatal=True),
+        )
+        return report
+
+    # archiv je otevřený po celé hodnocení, v dlouhé dávce se musí zavřít
+    try:
+        if debug_dir is not None:
+            dump_debug_xml(document, Path(debug_dir) / path.name, debug_parts)
+
+        for check, result in Runner(checks, cache, profiler, fail_fast).run(document, assignment):
+            report.add(check.name, result)
+    finally:
+        document.close()
+
+    return report
+
+
+def dump_debug_xml(document, out_dir: Path, parts: list[str] | None = None, workers: int = 1):
+    """XML části dokumentu pro ladění (u textových jen DEBUG_PARTS, není-li `parts`)."""
+    if isinstance(document, TextDocument):
+        return document.save_xml(out_dir, parts, workers)
+    return document.save_debug_xml(out_dir, parts, workers)
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        text_checks,
+        spreadsheet_checks,
+        text_assignment=None,
+        spreadsheet_assignment=None,
+        workers: int | None = None,
+        cache: ResultCache | None = None,
+        profiler: Profiler | None = None,
+        fail_fast: bool = False,
+        debug_dir: str | Path | None = None,
+        debug_parts: list[str] | None = None,
+    ):
+        """
+        S debug_dir se u každého odevzdání vypíšou i jeho XML části do
+        debug_dir/<název souboru>/ – v procesu, který ho hodnotí.
+        """
+        self.text_checks = text_checks
+        self.spreadsheet_checks = spreadsheet_checks
+        self.text_assignment = text_assignment
+        self.spreadsheet_assignment = spreadsheet_assignment
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+        self.profiler = profiler
+        self.fail_fast = fail_fast
+        self.debug_dir = debug_dir
+        self.debug_parts = debug_parts
+
+    def _job(self, path: Path):
+        if path.suffix.lower() in TEXT_SUFFIXES:
+            return self.text_checks, self.text_assignment, self.cache
+        return self.spreadsheet_checks, self.spreadsheet_assignment, self.cache
+
+    def run(self, directory: str | Path) -> Iterator[tuple[Path, Report]]:
+        """
+        Ohodnotí všechna odevzdání v adresáři a vrací (cesta, Report)
+        v pořadí, v jakém jsou hotová.
+        """
+        paths = discover_submissions(directory)
+
+        if self.workers <= 1:
+            for path in paths:
+                try:
+                    report = grade_submission(
+                        path, *self._job(path), self.profiler, self.fail_fast,
+                        self.debug_dir, self.debug_parts,
+                    )
+                except Exception as e:
+                    report = _failed_report(e)
+                yield path, report
+            return
+
+        # zvolený XML backend platí i v procesech (nezávisle na způsobu startu)
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=xml_backend.use,
+            initargs=(xml_backend.active(),),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _grade_profiled, path, *self._job(path), self._worker_profiler(), self.fail_fast,
+                    self.debug_dir, self.debug_parts,
+                ): path
+                for path in paths
+            }
+
+            for future in as_completed(futures):
+                # chyba jednoho odevzdání (i pád procesu) nesmí ukončit celou dávku
+                try:
+                    report, profiler = future.result()
+                except Exception as e:
+                    report, profiler = _failed_report(e), None
+
+                if profiler is not None:
+                    self.profiler.merge(profiler)
+                yield futures[future], report
+
+    def _worker_profiler(self) -> Profiler | None:
+        # každý proces měří do vlastní kopie, výsledky se pak slijí
+        return self.profiler.spawn() if self.profiler is not None else None
+
+
+def _failed_report(error: Exception) -> Report:
+    report = Report()
+    report.add(
+        "Hodnocení odevzdání",
+        CheckResult(
+            False,
+            f"Odevzdání nelze ohodnotit: {type(error).__name__}: {error}",
+            0,
+            fatal=True,
+            error=True,
+        ),
+    )
+    return report
+
+
+def _grade_profiled(path: Path, checks, assignment, cache, profiler, fail_fast, debug_dir, debug_parts):
+    report = grade_submission(
+        path, checks, assignment, cache, profiler, fail_fast, debug_dir, debug_parts,
+    )
+    return report, profiler
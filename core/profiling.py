@@ -0,0 +1,178 @@
+import cProfile
+import csv
+import heapq
+import json
+import marshal
+import re
+import time
+import tracemalloc
+from dataclasses import asdict, astuple, dataclass, fields
+from pathlib import Path
+
+
+@dataclass
+class CheckTiming:
+    document: str
+    check: str
+    name: str
+    wall: float
+    cpu: float  # CPU čas vlákna, ve kterém kontrola běžela
+    memory_peak: int | None = None  # bajty, jen s trace_memory
+    cached: bool = False
+
+
+class Profiler:
+    """
+    Měří čas (wall / CPU) a volitelně alokovanou paměť každé kontroly.
+    S profile_top > 0 se kontroly navíc spouští pod cProfile a uchová se
+    profil N nejpomalejších.
+    """
+
+    def __init__(self, trace_memory: bool = False, profile_top: int = 0):
+        self.trace_memory = trace_memory
+        self.profile_top = profile_top
+        self.timings: list[CheckTiming] = []
+        # min-halda (wall, pořadí, dokument, kontrola, cProfile statistiky)
+        self._profiles: list[tuple[float, int, str, str, dict]] = []
+        self._seq = 0
+
+    @property
+    def thread_safe(self) -> bool:
+        """
+        Lze měřit souběžné kontroly ve vláknech? tracemalloc (špička paměti)
+        i cProfile jsou společné celému procesu, CPU čas se měří po vláknech.
+        """
+        return not self.trace_memory and self.profile_top == 0
+
+    def spawn(self) -> "Profiler":
+        """Prázdný profiler se stejným nastavením (pro jiný proces)."""
+        return Profiler(self.trace_memory, self.profile_top)
+
+    def run_check(self, document: str, check, run):
+        profile = cProfile.Profile() if self.profile_top > 0 else None
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+
+        if profile is not None:
+            result = profile.runcall(run)
+        else:
+            result = run()
+
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+
+        memory_peak = None
+        if self.trace_memory:
+            memory_peak = max(0, tracemalloc.get_traced_memory()[1] - mem_start)
+
+        timing = CheckTiming(document, type(check).__name__, check.name, wall, cpu, memory_peak)
+        self.timings.append(timing)
+
+        if profile is not None:
+            profile.create_stats()
+            self._keep_profile(wall, document, check.name, profile.stats)
+
+        return result
+
+    def skipped(self, document: str, check):
+        self.timings.append(CheckTiming(document, type(check).__name__, check.name, 0.0, 0.0, cached=True))
+
+    def _keep_profile(self, wall: float, document: str, name: str, stats: dict):
+        self._seq += 1
+        item = (wall, self._seq, document, name, stats)
+
+        if len(self._profiles) < self.profile_top:
+            heapq.heappush(self._profiles, item)
+        elif wall > self._profiles[0][0]:
+            heapq.heapreplace(self._profiles, item)
+
+    def merge(self, other: "Profiler"):
+        self.timings.extend(other.timings)
+        for wall, _, document, name, stats in other._profiles:
+            self._keep_profile(wall, document, name, stats)
+
+    # --- výstupy ---
+
+    def summary(self) -> dict:
+        by_check: dict[str, dict] = {}
+        by_document: dict[str, dict] = {}
+
+        for t in self.timings:
+            c = by_check.setdefault(t.name, {
+                "check": t.check, "runs": 0, "cached": 0,
+                "wall_total": 0.0, "wall_max": 0.0, "cpu_total": 0.0,
+                "memory_peak_max": None,
+            })
+            d = by_document.setdefault(t.document, {
+                "checks": 0, "cached": 0, "wall_total": 0.0, "cpu_total": 0.0,
+            })
+
+            if t.cached:
+                c["cached"] += 1
+                d["cached"] += 1
+                continue
+
+            c["runs"] += 1
+            c["wall_total"] += t.wall
+            c["wall_max"] = max(c["wall_max"], t.wall)
+            c["cpu_total"] += t.cpu
+            if t.memory_peak is not None:
+                c["memory_peak_max"] = max(c["memory_peak_max"] or 0, t.memory_peak)
+
+            d["checks"] += 1
+            d["wall_total"] += t.wall
+            d["cpu_total"] += t.cpu
+
+        slowest = sorted(by_check.items(), key=lambda kv: kv[1]["wall_total"], reverse=True)
+
+        return {
+            "checks": dict(slowest),
+            "documents": by_document,
+            "timings": [asdict(t) for t in self.timings],
+        }
+
+    def write_json(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def write_csv(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([fl.name for fl in fields(CheckTiming)])
+            for t in self.timings:
+                writer.writerow(astuple(t))
+
+    def write_profiles(self, directory: str | Path) -> list[Path]:
+        """Uloží profily N nejpomalejších kontrol (.prof, čitelné přes pstats)."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        written = []
+        ranked = sorted(self._profiles, reverse=True)
+        for rank, (wall, _, document, name, stats) in enumerate(ranked, start=1):
+            slug = re.sub(r"[^\w.-]+", "_", f"{Path(document).stem}-{name}")[:80]
+            target = directory / f"{rank:02d}-{slug}.prof"
+            with open(target, "wb") as f:
+                marshal.dump(stats, f)
+            written.append(target)
+
+        return written
+
+    def write(self, directory: str | Path):
+        directory = Path(directory)
+        self.write_json(directory / "timings.json")
+        self.write_csv(directory / "timings.csv")
+        if self.profile_top > 0:
+            self.write_profiles(directory / "profiles")
+
@@ -11,7 +11,10 @@ class Report:
         print("\n=== VÝSLEDKY HODNOCENÍ ===\n")
 
         for name, result in self.entries:
-            status = "OK" if result.passed else "CHYBA"
+            if result.skipped:
+                status = "PŘESKOČENO"
+            else:
+                status = "OK" if result.passed else "CHYBA"
             print(f"{status}: {name}")
             print(f"  {result.message}")
             print(f"  Body: {result.points}\n")
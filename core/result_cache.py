@@ -0,0 +1,117 @@
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from checks.base_check import CheckResult
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def file_digest(path: str | Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def assignment_fingerprint(assignment) -> str:
+    if assignment is None:
+        return "none"
+
+    if dataclasses.is_dataclass(assignment):
+        data = dataclasses.asdict(assignment)
+    else:
+        data = vars(assignment)
+
+    raw = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _source_digest(*files: str) -> str:
+    h = hashlib.sha256()
+    for name in files:
+        h.update(name.encode("utf-8"))
+        h.update(Path(name).read_bytes())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _document_sources() -> tuple[str, ...]:
+    return tuple(sorted(str(p) for p in (_ROOT / "document").glob("*.py")))
+
+
+def check_fingerprint(check) -> str:
+    """
+    Třída kontroly + argumenty konstruktoru (atributy instance) + zdrojový
+    kód kontroly a adaptérů – po úpravě kódu se výsledky přepočítají.
+    """
+    cls = type(check)
+    params = json.dumps(vars(check), sort_keys=True, ensure_ascii=False, default=repr)
+
+    module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+    sources = (module_file,) if module_file else ()
+    code = _source_digest(*sources, *_document_sources())
+
+    return f"{cls.__module__}.{cls.__qualname__}|{params}|{code}"
+
+
+class ResultCache:
+    """
+    Trvalá cache výsledků kontrol (SQLite). Klíč je SHA-256 odevzdaného
+    souboru + otisk zadání + otisk kontroly.
+    """
+
+    def __init__(self, directory: str | Path = ".cache"):
+        self.directory = Path(directory)
+        self._conn = None
+
+    # spojení se nepřenáší do procesů BatchRunneru, každý si otevře vlastní
+    def __getstate__(self):
+        return {"directory": self.directory, "_conn": None}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.directory / "results.sqlite", timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " passed INTEGER NOT NULL,"
+                " message TEXT NOT NULL,"
+                " points INTEGER NOT NULL,"
+                " fatal INTEGER NOT NULL)"
+            )
+        return self._conn
+
+    def key(self, submission_digest: str, assignment_fp: str, check) -> str:
+        raw = "\n".join((submission_digest, assignment_fp, check_fingerprint(check)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CheckResult | None:
+        row = self.conn.execute(
+            "SELECT passed, message, points, fatal FROM results WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        passed, message, points, fatal = row
+        return CheckResult(bool(passed), message, points, fatal=bool(fatal))
+
+    def put(self, key: str, result: CheckResult):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, int(result.passed), result.message, result.points, int(result.fatal)),
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
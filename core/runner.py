@@ -1,9 +1,334 @@
+import heapq
+import multiprocessing
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from checks.base_check import CheckResult
+from core.profiling import Profiler
+from core.result_cache import ResultCache, assignment_fingerprint, file_digest
+
+EXECUTORS = ("thread", "process")
+
+
+def schedule(checks) -> tuple[list[int], dict[int, list[int]]]:
+    """
+    Pořadí spuštění kontrol podle `requires` (topologické, jinak v pořadí
+    seznamu) a pro každou kontrolu indexy jejích předpokladů. Předpoklad,
+    který v seznamu není, se ignoruje.
+    """
+    prerequisites = {}
+    dependents = {i: [] for i in range(len(checks))}
+
+    for i, check in enumerate(checks):
+        required = tuple(check.requires)
+        prerequisites[i] = [
+            j for j, other in enumerate(checks)
+            if j != i and required and isinstance(other, required)
+        ]
+        for j in prerequisites[i]:
+            dependents[j].append(i)
+
+    waiting = {i: len(deps) for i, deps in prerequisites.items()}
+    ready = [i for i, n in waiting.items() if n == 0]
+    heapq.heapify(ready)
+
+    order = []
+    while ready:
+        i = heapq.heappop(ready)
+        order.append(i)
+        for d in dependents[i]:
+            waiting[d] -= 1
+            if waiting[d] == 0:
+                heapq.heappush(ready, d)
+
+    if len(order) != len(checks):
+        cycle = ", ".join(checks[i].name for i, n in waiting.items() if n > 0)
+        raise ValueError(f"Cyklická závislost kontrol: {cycle}")
+
+    return order, prerequisites
+
+
 class Runner:
-    def __init__(self, checks):
+    def __init__(
+        self,
+        checks,
+        cache: ResultCache | None = None,
+        profiler: Profiler | None = None,
+        fail_fast: bool = False,
+        workers: int = 1,
+        executor: str = "thread",
+    ):
+        """
+        S workers > 1 běží nezávislé kontroly souběžně nad jedním předem
+        načteným dokumentem – ve vláknech, nebo (executor="process")
+        v procesech, které model zdědí přes fork. Výsledky jsou stejné
+        a ve stejném pořadí jako při sekvenčním běhu.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Neznámý executor: {executor}")
+
+        # spawn by musel dokument (stromy, otevřený archiv) serializovat
+        if executor == "process" and "fork" not in multiprocessing.get_all_start_methods():
+            warnings.warn(
+                "Procesy pro kontroly vyžadují fork, kontroly poběží ve vláknech.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            executor = "thread"
+
         self.checks = checks
+        self.cache = cache
+        self.profiler = profiler
+        self.fail_fast = fail_fast
+        self.workers = workers
+        self.executor = executor
+        self._order, self._prerequisites = schedule(checks)
+
+    def _run_check(self, check, document, assignment):
+        if self.profiler is None:
+            return _safe_run(check, document, assignment)
+
+        label = str(getattr(document, "path", type(document).__name__))
+        return self.profiler.run_check(label, check, lambda: _safe_run(check, document, assignment))
 
     def run(self, document, assignment):
-        results = []
-        for check in self.checks:
-            results.append((check, check.run(document, assignment)))
-        return results
\ No newline at end of file
+        """
+        Spustí kontroly a vrátí [(kontrola, výsledek)] v pořadí seznamu.
+        Kontrola, jejíž předpoklad neprošel, se přeskočí; s fail_fast se po
+        první fatální chybě přeskočí i všechny zbývající.
+        """
+        keys = None
+        if self.cache is not None:
+            # kontroly, které už pro stejný soubor a zadání proběhly, se přeskočí
+            submission = file_digest(document.path)
+            assignment_fp = assignment_fingerprint(assignment)
+            keys = {
+                i: self.cache.key(submission, assignment_fp, check)
+                for i, check in enumerate(self.checks)
+            }
+
+        if self._parallel():
+            results = self._run_parallel(document, assignment, keys)
+        else:
+            results = self._run_sequential(document, assignment, keys)
+
+        return [(check, results[i]) for i, check in enumerate(self.checks)]
+
+    def _parallel(self) -> bool:
+        if self.workers <= 1 or len(self.checks) <= 1:
+            return False
+
+        # cProfile a tracemalloc jsou na celý proces, souběžná vlákna by si
+        # navzájem nulovala a přičítala měření
+        if self.executor == "thread" and self.profiler is not None and not self.profiler.thread_safe:
+            return False
+
+        return True
+
+    def _run_sequential(self, document, assignment, keys) -> dict[int, CheckResult]:
+        results: dict[int, CheckResult] = {}
+        stopped_by = None
+
+        for i in self._order:
+            check = self.checks[i]
+            result = self._blocked(i, results, stopped_by)
+
+            if result is None:
+                result = self._cached(i, keys, document)
+                if result is None:
+                    result = self._run_check(check, document, assignment)
+                    if keys is not None and not result.error:
+                        self.cache.put(keys[i], result)
+
+            results[i] = result
+
+            if self._is_stop(result):
+                stopped_by = check
+
+        return results
+
+    def _run_parallel(self, document, assignment, keys) -> dict[int, CheckResult]:
+        document.preload()
+
+        position = {i: n for n, i in enumerate(self._order)}
+        pending = list(self._order)
+        running = {}
+        results: dict[int, CheckResult] = {}
+        stop = None  # pozice první fatální chyby v self._order
+
+        def finish(i, result):
+            nonlocal stop
+            results[i] = result
+            if self._is_stop(result) and (stop is None or position[i] < stop):
+                stop = position[i]
+
+        with self._executor(document, assignment) as pool:
+            while pending or running:
+                # spustí vše, co už má vyhodnocené předpoklady
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for i in list(pending):
+                        if stop is not None and position[i] > stop:
+                            pending.remove(i)
+                            continue
+                        if any(j not in results for j in self._prerequisites[i]):
+                            continue
+
+                        pending.remove(i)
+                        result = self._blocked(i, results, None)
+                        if result is None:
+                            result = self._cached(i, keys, document)
+
+                        if result is None:
+                            running[self._submit(pool, i, document, assignment)] = i
+                        else:
+                            finish(i, result)
+                            progressed = True
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    result = self._collect(future)
+                    if keys is not None and not result.error:
+                        self.cache.put(keys[i], result)
+                    finish(i, result)
+
+        # stejný výsledek jako sekvenčně: vše za první fatální chybou se přeskočí
+        if stop is not None:
+            stopped_by = self.checks[self._order[stop]]
+            for i in self._order[stop + 1:]:
+                results[i] = self._blocked(i, results, stopped_by)
+
+        return results
+
+    def _cached(self, i, keys, document) -> CheckResult | None:
+        if keys is None:
+            return None
+
+        result = self.cache.get(keys[i])
+        if result is not None and self.profiler is not None:
+            self.profiler.skipped(str(document.path), self.checks[i])
+        return result
+
+    def _blocked(self, i, results, stopped_by) -> CheckResult | None:
+        """
+        Důvod, proč se kontrola nespustí: neprošlý předpoklad, fatální chyba
+        dřívější kontroly, nebo předpoklad, který sám nebyl vyhodnocen
+        (přeskočený, spadlý). None = kontrolu lze spustit.
+        """
+        failed = []
+        unevaluated = []
+        for j in self._prerequisites[i]:
+            result = results[j]
+            if result.skipped or result.error:
+                unevaluated.append(self.checks[j])
+            elif not result.passed:
+                failed.append(self.checks[j])
+
+        if failed:
+            return self._unmet(failed)
+        if stopped_by is not None:
+            return self._stopped(stopped_by)
+        if unevaluated:
+            return self._unevaluated(unevaluated)
+        return None
+
+    def _unmet(self, failed) -> CheckResult:
+        return CheckResult(
+            False,
+            "Přeskočeno – nesplněný předpoklad: "
+            + ", ".join(f"„{c.name}“" for c in failed) + ".",
+            0,
+            skipped=True,
+        )
+
+    def _unevaluated(self, checks) -> CheckResult:
+        return CheckResult(
+            False,
+            "Přeskočeno – předpoklad nebyl vyhodnocen: "
+            + ", ".join(f"„{c.name}“" for c in checks) + ".",
+            0,
+            skipped=True,
+        )
+
+    def _stopped(self, check) -> CheckResult:
+        return CheckResult(
+            False,
+            f"Přeskočeno – hodnocení ukončeno po fatální chybě „{check.name}“.",
+            0,
+            skipped=True,
+        )
+
+    def _is_stop(self, result: CheckResult) -> bool:
+        return self.fail_fast and result.fatal and not result.passed and not result.skipped
+
+    # --- souběžné spuštění ---
+
+    def _executor(self, document, assignment):
+        if self.executor == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers)
+
+        # fork: procesy zdědí načtený model bez serializace (jinak se sem
+        # __init__ nedostane, viz výše)
+        context = multiprocessing.get_context("fork")
+
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(document, self.checks, assignment),
+        )
+
+    def _submit(self, pool, i, document, assignment):
+        if self.executor == "thread":
+            return pool.submit(self._run_check, self.checks[i], document, assignment)
+
+        profiler = self.profiler.spawn() if self.profiler is not None else None
+        return pool.submit(_run_in_worker, i, profiler)
+
+    def _collect(self, future) -> CheckResult:
+        if self.executor == "thread":
+            return future.result()
+
+        result, profiler = future.result()
+        if profiler is not None:
+            self.profiler.merge(profiler)
+        return result
+
+
+def _safe_run(check, document, assignment) -> CheckResult:
+    # výjimka jedné kontroly (typicky poškozená část, která se načte až
+    # líně uvnitř kontroly) nesmí shodit ostatní kontroly ani celou dávku
+    try:
+        return check.run(document, assignment)
+    except Exception as e:
+        return CheckResult(
+            False,
+            f"Kontrolu nelze provést: {type(e).__name__}: {e}",
+            0,
+            error=True,
+        )
+
+
+_worker_state = None
+
+
+def _init_worker(document, checks, assignment):
+    global _worker_state
+    document.reopen()
+    _worker_state = (document, checks, assignment)
+
+
+def _run_in_worker(i: int, profiler: Profiler | None):
+    document, checks, assignment = _worker_state
+    check = checks[i]
+
+    if profiler is None:
+        return _safe_run(check, document, assignment), None
+
+    label = str(getattr(document, "path", type(document).__name__))
+    return profiler.run_check(label, check, lambda: _safe_run(check, document, assignment)), profiler
@@ -0,0 +1,115 @@
+"""
+Balík odevzdaného souboru (docx, odt, xlsx, ods) otevřený jednou pro celé
+hodnocení. Adaptéry i openpyxl čtou části přes jediný ZipFile a jeho
+jednou načtený centrální adresář. Velké části (document.xml, content.xml,
+listy) se parsují přímo z proudu a v paměti se nedrží; do malé LRU cache
+jdou jen drobné části (vztahy, [Content_Types].xml, styly), které se
+čtou víckrát.
+"""
+import io
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import IO
+
+DEFAULT_CACHE_BYTES = 4 * 1024 * 1024
+# větší části se do cache nedávají nikdy
+SMALL_PART_BYTES = 256 * 1024
+
+
+class Archive:
+    def __init__(
+        self,
+        path: str,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+        part_bytes: int = SMALL_PART_BYTES,
+    ):
+        self.path = path
+        self.cache_bytes = cache_bytes
+        self.part_bytes = min(part_bytes, cache_bytes)
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cached = 0
+        self._lock = threading.Lock()
+        self._open()
+
+    def _open(self):
+        self.file = open(self.path, "rb")
+        self._zip = zipfile.ZipFile(self.file)
+        self._members = {info.filename: info for info in self._zip.infolist()}
+
+    def reopen(self):
+        """Vlastní deskriptor po fork; rozbalené části zůstávají."""
+        self._open()
+
+    def close(self):
+        self._zip.close()
+        self.file.close()
+
+    # --- centrální adresář ---
+
+    def names(self) -> list[str]:
+        return list(self._members)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+
+    def size(self, name: str) -> int:
+        """Rozbalená velikost části."""
+        return self._info(name).file_size
+
+    def _info(self, name: str) -> zipfile.ZipInfo:
+        info = self._members.get(name)
+        if info is None:
+            raise KeyError(f"There is no item named {name!r} in the archive")
+        return info
+
+    # --- čtení částí ---
+
+    def read(self, name: str) -> memoryview:
+        """Celá rozbalená část; malá část se zapamatuje."""
+        return memoryview(self._bytes(name))
+
+    def open(self, name: str, cache: bool = True) -> IO[bytes]:
+        """
+        Proud části. Se `cache` se malá část rozbalí celá a další otevření
+        už ji nerozbaluje; jinak (velké části, obrázky, kterým stačí
+        hlavička) jde o proud omezený na danou položku.
+        """
+        with self._lock:
+            data = self._cache.get(name)
+            if data is not None:
+                self._cache.move_to_end(name)
+
+        if data is not None:
+            return io.BytesIO(data)
+
+        info = self._info(name)
+        if cache and info.file_size <= self.part_bytes:
+            return io.BytesIO(self._bytes(name))
+
+        return self._zip.open(info)
+
+    def _bytes(self, name: str) -> bytes:
+        with self._lock:
+            data = self._cache.get(name)
+            if data is not None:
+                self._cache.move_to_end(name)
+                return data
+
+        data = self._zip.read(self._info(name))
+        self._remember(name, data)
+        return data
+
+    def _remember(self, name: str, data: bytes):
+        if len(data) > self.part_bytes:
+            return
+
+        with self._lock:
+            if name in self._cache:
+                return
+
+            self._cache[name] = data
+            self._cached += len(data)
+            while self._cached > self.cache_bytes:
+                _, old = self._cache.popitem(last=False)
+                self._cached -= len(old)
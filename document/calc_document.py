@@ -1,200 +1,242 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
-import zipfile
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
 import xml.etree.ElementTree as ET
 import re
-import xml.dom.minidom as minidom
 
-from document.spreadsheet_document import SpreadsheetDocument
+from openpyxl.utils import get_column_letter
+
+from document import xml_backend
+from document.archive import Archive
+from document.qnames import (
+    ALL_CHART_CHART, ALL_CHART_SERIES, ALL_NUMBER_NUMBER_STYLE, ALL_STYLE_MAP,
+    ALL_TABLE_NAMED_RANGE, ALL_TABLE_TABLE, ALL_TABLE_TABLE_CELL, CALCEXT_NS,
+    CHART_CLASS, CHART_DATA_LABEL_NUMBER, CHART_DISPLAY_LABEL, CHART_NS,
+    CHART_STYLE_NAME, CHART_THREE_DIMENSIONAL, DR3D, DR3D_NS, FO_FONT_WEIGHT, FO_NS,
+    FO_TEXT_ALIGN, FO_WRAP_OPTION, NUMBER_DECIMAL_PLACES, NUMBER_NS, NUMBER_NUMBER,
+    OFFICE_NS, OFFICE_SPREADSHEET, OFFICE_VALUE, STYLE_CHART_PROPERTIES,
+    STYLE_DATA_STYLE_NAME, STYLE_NAME, STYLE_NS, STYLE_PARENT_STYLE_NAME,
+    TABLE_DEFAULT_CELL_STYLE_NAME, TABLE_FORMULA, TABLE_NAME, TABLE_NS,
+    TABLE_NUMBER_COLUMNS_REPEATED, TABLE_NUMBER_COLUMNS_SPANNED,
+    TABLE_NUMBER_MATRIX_COLUMNS_SPANNED, TABLE_NUMBER_MATRIX_ROWS_SPANNED,
+    TABLE_NUMBER_ROWS_REPEATED, TABLE_NUMBER_ROWS_SPANNED, TABLE_STYLE_NAME,
+    TABLE_TABLE, TABLE_TABLE_CELL, TABLE_TABLE_COLUMN, TABLE_TABLE_ROW, TEXT_NS,
+)
+from document.spreadsheet_document import (
+    CellRange, SpreadsheetDocument, parse_address, range_addresses,
+)
+from document.xml_stream import iter_children
+
+
+@dataclass
+class _RunIndex:
+    """
+    Seřazené intervaly [start, end] (číslováno od 1) s hodnotou –
+    opakované řádky / buňky jsou uložené jako jeden interval.
+    """
+    starts: list[int] = field(default_factory=list)
+    ends: list[int] = field(default_factory=list)
+    values: list = field(default_factory=list)
+
+    def append(self, start: int, end: int, value):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.values.append(value)
+
+    def get(self, pos: int):
+        i = bisect_right(self.starts, pos) - 1
+        if i < 0 or pos > self.ends[i]:
+            return None
+        return self.values[i]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends, self.values)
+
+
+@dataclass
+class _SheetGrid:
+    rows: _RunIndex
+    column_default_styles: _RunIndex
+
 
 class CalcDocument(SpreadsheetDocument):
+    DEBUG_DIR = "debug_calc_xml"
+
     NS = {
-        "table": "urn:oasis:names:tc:opendocument:xmlns:table:1.0",
-        "calcext": "urn:org:documentfoundation:names:experimental:calc:xmlns:calcext:1.0",
-        "number": "urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0",
+        "table": TABLE_NS,
+        "calcext": CALCEXT_NS,
+        "number": NUMBER_NS,
 
-        "office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
-        "style": "urn:oasis:names:tc:opendocument:xmlns:style:1.0",
-        "fo": "urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0",
+        "office": OFFICE_NS,
+        "style": STYLE_NS,
+        "fo": FO_NS,
 
-        "text": "urn:oasis:names:tc:opendocument:xmlns:text:1.0",
+        "text": TEXT_NS,
 
-        "chart": "urn:oasis:names:tc:opendocument:xmlns:chart:1.0",
-        "dr3d": "urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0",
+        "chart": CHART_NS,
+        "dr3d": DR3D_NS,
     }
 
     def __init__(self, path: str):
         self.path = path
-        self._zip = zipfile.ZipFile(path)
-        self.content = self._load_xml("content.xml")
-        self.styles = self._load_xml("styles.xml")
+        self._archive = Archive(path)
+        self._grids: dict[str, _SheetGrid | None] = {}
 
-        self.number_styles = {}
+    # části balíku se načítají až při prvním použití
+    @cached_property
+    def content(self) -> ET.Element:
+        return self._load_xml("content.xml")
 
-        def collect_number_styles(root):
-            if root is None:
-                return
+    @cached_property
+    def styles(self) -> ET.Element:
+        return self._load_xml("styles.xml")
 
-            for ns in root.findall(f".//{{{self.NS["number"]}}}number-style"):
-                name = ns.attrib.get(f"{{{self.NS["style"]}}}name")
+    @cached_property
+    def number_styles(self) -> dict[str, int]:
+        number_styles = {}
+
+        for root in (self.content, self.styles):
+            for ns in root.findall(ALL_NUMBER_NUMBER_STYLE):
+                name = ns.attrib.get(STYLE_NAME)
                 if not name:
                     continue
 
-                for child in ns.findall(f"{{{self.NS["number"]}}}number"):
-                    dp = child.attrib.get(f"{{{self.NS["number"]}}}decimal-places")
+                for child in ns.findall(NUMBER_NUMBER):
+                    dp = child.attrib.get(NUMBER_DECIMAL_PLACES)
                     if dp is not None:
-                        self.number_styles[name] = int(dp)
+                        number_styles[name] = int(dp)
 
-        collect_number_styles(self.content)
-        collect_number_styles(self.styles)
+        return number_styles
 
-        self.objects = {}
+    @cached_property
+    def objects(self) -> dict[str, ET.Element]:
+        objects = {}
 
-        for name in self._zip.namelist():
+        for name in self._archive.names():
             if name.startswith("Object") and name.endswith("content.xml"):
-                with self._zip.open(name) as f:
-                    self.objects[name] = ET.fromstring(f.read())
-
-    def _load_xml(self, name: str):
-        with self._zip.open(name) as f:
-            return ET.fromstring(f.read())
-        
-    def save_debug_xml(self, out_dir: str | Path = "debug_calc_xml"):
-        out_dir = Path(out_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
+                objects[name] = self._load_xml(name)
 
-        with zipfile.ZipFile(self.path) as z:
-            for name in z.namelist():
-                if not name.endswith(".xml"):
-                    continue
+        return objects
 
-                try:
-                    raw = z.read(name)
-                    root = ET.fromstring(raw)
-                except Exception:
-                    continue
+    def preload(self):
+        self.content
+        self.styles
+        self.number_styles
+        self.objects
+        self._style_elements
+        for name in self.sheet_names():
+            self._sheet_grid(name)
 
-                pretty = minidom.parseString(
-                    ET.tostring(root, encoding="utf-8")
-                ).toprettyxml(
-                    indent="  ",
-                    encoding="utf-8"
-                )
-
-                target = out_dir / name
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_bytes(pretty)
+    def _load_xml(self, name: str):
+        with self._archive.open(name) as f:
+            return xml_backend.parse(f)
         
     def sheet_names(self) -> list[str]:
+        return list(self._sheet_names)
+
+    @cached_property
+    def _sheet_names(self) -> list[str]:
+        if "content" in self.__dict__:
+            sheets = self.content.findall(ALL_TABLE_TABLE)
+            return [s.attrib[TABLE_NAME] for s in sheets if s.attrib.get(TABLE_NAME)]
+
+        # obsah ještě není načtený – listy se projdou proudově po jednom
         names = []
-        for sheet in self.content.findall(".//table:table", self.NS):
-            name = sheet.attrib.get(f"{{{self.NS['table']}}}name")
-            if name:
-                names.append(name)
+        with self._archive.open("content.xml") as f:
+            for el in iter_children(f, OFFICE_SPREADSHEET):
+                if el.tag == TABLE_TABLE and el.attrib.get(TABLE_NAME):
+                    names.append(el.attrib[TABLE_NAME])
+
         return names
     
 
-    def _addr_to_row_col(self, addr: str) -> tuple[int, int]:
-        m = re.fullmatch(r"([A-Z]+)(\d+)", addr.upper())
-        if not m:
-            raise ValueError(f"Neplatná adresa buňky: {addr}")
-
-        col_letters, row = m.groups()
-        row = int(row)
+    def _runs(self, elements, repeat_attr: str):
+        pos = 0
+        for el in elements:
+            repeat = int(el.attrib.get(repeat_attr, "1"))
+            yield pos + 1, pos + repeat, el
+            pos += repeat
+
+    def _build_grid(self, sheet) -> _SheetGrid:
+        rows = _RunIndex()
+        for start, end, row in self._runs(
+            sheet.findall(TABLE_TABLE_ROW), TABLE_NUMBER_ROWS_REPEATED
+        ):
+            cells = _RunIndex()
+            for c_start, c_end, cell in self._runs(
+                row.findall(TABLE_TABLE_CELL), TABLE_NUMBER_COLUMNS_REPEATED
+            ):
+                cells.append(c_start, c_end, cell)
+            rows.append(start, end, cells)
+
+        col_defaults = _RunIndex()
+        for start, end, col in self._runs(
+            sheet.findall(TABLE_TABLE_COLUMN), TABLE_NUMBER_COLUMNS_REPEATED
+        ):
+            col_defaults.append(start, end, col.attrib.get(TABLE_DEFAULT_CELL_STYLE_NAME))
+
+        return _SheetGrid(rows=rows, column_default_styles=col_defaults)
+
+    def _sheet_grid(self, sheet_name: str) -> _SheetGrid | None:
+        if sheet_name not in self._grids:
+            grid = None
+            for sheet in self.content.findall(ALL_TABLE_TABLE):
+                if sheet.attrib.get(TABLE_NAME) == sheet_name:
+                    grid = self._build_grid(sheet)
+                    break
+            self._grids[sheet_name] = grid
 
-        col = 0
-        for c in col_letters:
-            col = col * 26 + (ord(c) - ord("A") + 1)
+        return self._grids[sheet_name]
 
-        return row, col
-    
     def _find_cell(self, sheet_name: str, addr: str) -> dict | None:
-        row_target, col_target = self._addr_to_row_col(addr)
+        row_target, col_target = parse_address(addr)
 
-        for sheet in self.content.findall(".//table:table", self.NS):
-            name = sheet.attrib.get(f"{{{self.NS['table']}}}name")
-            if name != sheet_name:
-                continue
-
-            row_idx = 0
-            for row in sheet.findall("table:table-row", self.NS):
-                row_repeat = int(
-                    row.attrib.get(
-                        f"{{{self.NS["table"]}}}number-rows-repeated",
-                        "1",
-                    )
-                )
+        grid = self._sheet_grid(sheet_name)
+        if grid is None:
+            return None
 
-                for _ in range(row_repeat):
-                    row_idx += 1
-                    if row_idx != row_target:
-                        continue
+        cells = grid.rows.get(row_target)
+        if cells is None:
+            return None
 
-                    col_idx = 0
-                    for cell in row.findall("table:table-cell", self.NS):
-                        repeat = int(
-                            cell.attrib.get(
-                                f"{{{self.NS["table"]}}}number-columns-repeated",
-                                "1",
-                            )
-                        )
-
-                        for _ in range(repeat):
-                            col_idx += 1
-                            if col_idx == col_target:
-                                formula = cell.attrib.get(
-                                   f"{{{self.NS["table"]}}}formula"
-                                )
-
-                                value = cell.attrib.get(
-                                   f"{{{self.NS["office"]}}}value"
-                                )
-
-                                col_defaults = self._column_default_styles(sheet)
-                                col_default = (
-                                    col_defaults[col_target - 1]
-                                    if col_target - 1 < len(col_defaults)
-                                    else None
-                                )
-
-                                return {
-                                    "sheet": sheet_name,
-                                    "address": addr,
-                                    "formula": formula,
-                                    "value_cached": value,
-                                    "raw_cell": cell,
-                                    "col_default_style": col_default,
-                                }
-
-                    return None
+        cell = cells.get(col_target)
+        if cell is None:
+            return None
 
-        return None
+        return {
+            "sheet": sheet_name,
+            "address": addr,
+            "formula": cell.attrib.get(TABLE_FORMULA),
+            "value_cached": cell.attrib.get(OFFICE_VALUE),
+            "raw_cell": cell,
+            "col_default_style": grid.column_default_styles.get(col_target),
+        }
 
     #----------------
         
     def get_array_formula_cells(self) -> list[str]:
         cells = []
 
-        for sheet in self.content.findall(".//table:table", self.NS):
+        for sheet in self.content.findall(ALL_TABLE_TABLE):
             sheet_name = sheet.attrib.get(
-                f"{{{self.NS['table']}}}name", "Sheet"
+                TABLE_NAME, "Sheet"
             )
 
             row_idx = 0
-            for row in sheet.findall("table:table-row", self.NS):
+            for row in sheet.findall(TABLE_TABLE_ROW):
                 row_idx += 1
                 col_idx = 0
 
-                for cell in row.findall("table:table-cell", self.NS):
+                for cell in row.findall(TABLE_TABLE_CELL):
                     col_idx += 1
 
                     rows_span = cell.attrib.get(
-                        f"{{{self.NS['table']}}}number-matrix-rows-spanned"
+                        TABLE_NUMBER_MATRIX_ROWS_SPANNED
                     )
                     cols_span = cell.attrib.get(
-                        f"{{{self.NS['table']}}}number-matrix-columns-spanned"
+                        TABLE_NUMBER_MATRIX_COLUMNS_SPANNED
                     )
 
                     if rows_span or cols_span:
@@ -208,14 +250,15 @@ class CalcDocument(SpreadsheetDocument):
         if cell is None:
             return None
 
-        raw = cell["raw_cell"]
+        return self._cell_info(cell["raw_cell"])
 
+    def _cell_info(self, raw) -> dict:
         formula = raw.attrib.get(
-            f"{{{self.NS['table']}}}formula"
+            TABLE_FORMULA
         )
 
         value = raw.attrib.get(
-            f"{{{self.NS['office']}}}value"
+            OFFICE_VALUE
         )
 
         if formula and formula.startswith("of:="):
@@ -229,12 +272,12 @@ class CalcDocument(SpreadsheetDocument):
         }
     
     def iter_formulas(self):
-        for sheet in self.content.findall(".//table:table", self.NS):
-            sheet_name = sheet.attrib.get(f"{{{self.NS['table']}}}name")
+        for sheet in self.content.findall(ALL_TABLE_TABLE):
+            sheet_name = sheet.attrib.get(TABLE_NAME)
 
-            for cell in sheet.findall(".//table:table-cell", self.NS):
+            for cell in sheet.findall(ALL_TABLE_TABLE_CELL):
                 formula = cell.attrib.get(
-                    f"{{{self.NS['table']}}}formula"
+                    TABLE_FORMULA
                 )
                 if formula:
                     formula = formula.replace("of:=", "=")
@@ -270,8 +313,8 @@ class CalcDocument(SpreadsheetDocument):
     def get_defined_names(self) -> set[str]:
         names = set()
 
-        for ne in self.content.findall(".//table:named-range", self.NS):
-            name = ne.attrib.get(f"{{{self.NS['table']}}}name")
+        for ne in self.content.findall(ALL_TABLE_NAMED_RANGE):
+            name = ne.attrib.get(TABLE_NAME)
             if name:
                 names.add(name.upper())
 
@@ -280,23 +323,23 @@ class CalcDocument(SpreadsheetDocument):
     def cells_with_formulas(self):
         out = []
 
-        for sheet in self.content.findall(".//table:table", self.NS):
-            sheet_name = sheet.attrib.get(f"{{{self.NS['table']}}}name", "Sheet")
+        for sheet in self.content.findall(ALL_TABLE_TABLE):
+            sheet_name = sheet.attrib.get(TABLE_NAME, "Sheet")
 
             row_idx = 0
-            for row in sheet.findall("table:table-row", self.NS):
+            for row in sheet.findall(TABLE_TABLE_ROW):
                 row_idx += 1
                 col_idx = 0
 
-                for cell in row.findall("table:table-cell", self.NS):
+                for cell in row.findall(TABLE_TABLE_CELL):
                     col_idx += 1
 
-                    formula = cell.attrib.get(f"{{{self.NS['table']}}}formula")
+                    formula = cell.attrib.get(TABLE_FORMULA)
                     if not formula:
                         continue
 
                     # A1 / B3...
-                    col_letter = self._col_to_letters(col_idx)
+                    col_letter = get_column_letter(col_idx)
                     addr = f"{col_letter}{row_idx}"
 
                     out.append({
@@ -307,37 +350,30 @@ class CalcDocument(SpreadsheetDocument):
 
         return out
 
-    def _col_to_letters(self, col: int) -> str:
-        s = ""
-        while col:
-            col, r = divmod(col - 1, 26)
-            s = chr(65 + r) + s
-        return s
-        
     def merged_ranges(self, sheet: str):
         ranges = []
 
-        for table in self.content.findall(".//table:table", self.NS):
+        for table in self.content.findall(ALL_TABLE_TABLE):
             name = table.attrib.get(
-                f"{{{self.NS['table']}}}name"
+                TABLE_NAME
             )
             if name != sheet:
                 continue
 
             row_idx = 0
-            for row in table.findall("table:table-row", self.NS):
+            for row in table.findall(TABLE_TABLE_ROW):
                 row_idx += 1
                 col_idx = 0
 
-                for cell in row.findall("table:table-cell", self.NS):
+                for cell in row.findall(TABLE_TABLE_CELL):
                     col_idx += 1
 
                     rows = int(cell.attrib.get(
-                        f"{{{self.NS['table']}}}number-rows-spanned",
+                        TABLE_NUMBER_ROWS_SPANNED,
                         "1"
                     ))
                     cols = int(cell.attrib.get(
-                       f"{{{self.NS['table']}}}number-columns-spanned",
+                       TABLE_NUMBER_COLUMNS_SPANNED,
                         "1"
                     ))
 
@@ -354,7 +390,7 @@ class CalcDocument(SpreadsheetDocument):
     
     def has_conditional_formatting(self, sheet: str) -> bool:
         return bool(
-            self.content.findall(".//style:map", self.NS)
+            self.content.findall(ALL_STYLE_MAP)
         )
    
     def ods_cf_values(self, sheet: str) -> set[tuple[str, float]]:
@@ -409,11 +445,14 @@ class CalcDocument(SpreadsheetDocument):
 
         raw = cell["raw_cell"]
 
-        style_name = raw.attrib.get(f"{{{self.NS['table']}}}style-name")
+        style_name = raw.attrib.get(TABLE_STYLE_NAME)
 
         if not style_name:
             style_name = cell.get("col_default_style")
 
+        return self._cell_style(style_name)
+
+    def _cell_style(self, style_name: str | None) -> dict:
         style = self._find_style(style_name) if style_name else {}
 
         return {
@@ -439,24 +478,24 @@ class CalcDocument(SpreadsheetDocument):
         align_h = None
         wrap = None
 
-        number_format = style_el.attrib.get(f"{{{self.NS["style"]}}}data-style-name")
+        number_format = style_el.attrib.get(STYLE_DATA_STYLE_NAME)
         decimal_places = self.number_styles.get(number_format)
 
         for el in style_el.iter():
 
             if el.tag.endswith("text-properties"):
-                if el.attrib.get(f"{{{self.NS["fo"]}}}font-weight") == "bold":
+                if el.attrib.get(FO_FONT_WEIGHT) == "bold":
                     bold = True
 
             if el.tag.endswith("paragraph-properties"):
-                align_h = el.attrib.get(f"{{{self.NS["fo"]}}}text-align")
+                align_h = el.attrib.get(FO_TEXT_ALIGN)
 
             if el.tag.endswith("table-cell-properties"):
-                wo = el.attrib.get(f"{{{self.NS["fo"]}}}wrap-option")
+                wo = el.attrib.get(FO_WRAP_OPTION)
                 if wo is not None:
                     wrap = (wo != "no-wrap")
 
-        parent = style_el.attrib.get(f"{{{self.NS["style"]}}}parent-style-name")
+        parent = style_el.attrib.get(STYLE_PARENT_STYLE_NAME)
         if parent:
             p = self._find_style(parent)
             bold = bold or p["bold"]
@@ -473,84 +512,112 @@ class CalcDocument(SpreadsheetDocument):
             "wrap": wrap,
         }
     
-    def _find_style_element(self, name: str):
-        STYLE_NAME_ATTR = f"{{{self.NS["style"]}}}name"
-        for s in self.content.iter():
-            if s.attrib.get(STYLE_NAME_ATTR) == name:
-                return s
-
-        if self.styles is not None:
-            for s in self.styles.iter():
-                if s.attrib.get(STYLE_NAME_ATTR) == name:
-                    return s
+    @cached_property
+    def _style_elements(self) -> dict[str, ET.Element]:
+        """style:name -> první prvek s tímto názvem (content.xml má přednost)."""
+        index = {}
+        for root in (self.content, self.styles):
+            if root is None:
+                continue
+            for el in root.iter():
+                name = el.attrib.get(STYLE_NAME)
+                if name is not None:
+                    index.setdefault(name, el)
+        return index
 
-        return None
+    def _find_style_element(self, name: str):
+        return self._style_elements.get(name)
     
-    def _column_default_styles(self, sheet) -> list[str | None]:
-        defaults = []
-
-        for col in sheet.findall("table:table-column", self.NS):
-            rep = int(col.attrib.get(
-                f"{{{self.NS["table"]}}}number-columns-repeated",
-                "1"
-            ))
-            style = col.attrib.get(
-                f"{{{self.NS["table"]}}}default-cell-style-name"
-            )
-            defaults.extend([style] * rep)
-
-        return defaults
-        
     def iter_cells(self, sheet: str):
-        for table in self.content.findall(".//table:table", self.NS):
-            if table.attrib.get(f"{{{self.NS['table']}}}name") != sheet:
-                continue
-
-            row_idx = 0
-            for row in table.findall("table:table-row", self.NS):
-                repeat_row = int(row.attrib.get(
-                    f"{{{self.NS["table"]}}}number-rows-repeated",
-                    "1"
-                ))
-
-                for _ in range(repeat_row):
-                    row_idx += 1
-                    col_idx = 0
-
-                    for cell in row.findall("table:table-cell", self.NS):
-                        repeat_col = int(cell.attrib.get(
-                            f"{{{self.NS["table"]}}}number-columns-repeated",
-                            "1"
-                        ))
-
-                        for _ in range(repeat_col):
-                            col_idx += 1
-
-                            text = "".join(cell.itertext()).strip()
-                            value = cell.attrib.get(
-                                f"{{{self.NS["office"]}}}value"
-                            )
-
-                            if not text and value is None:
-                                continue
-
-                            yield f"{self._col_to_letters(col_idx)}{row_idx}"
+        grid = self._sheet_grid(sheet)
+        if grid is None:
+            return
+
+        for row_start, row_end, cells in grid.rows:
+            # prázdné buňky se přeskočí celým intervalem, ne po jedné
+            filled = []
+            for col_start, col_end, cell in cells:
+                text = "".join(cell.itertext()).strip()
+                value = cell.attrib.get(OFFICE_VALUE)
+                if text or value is not None:
+                    filled.append((col_start, col_end))
+
+            for row_idx in range(row_start, row_end + 1):
+                for col_start, col_end in filled:
+                    for col_idx in range(col_start, col_end + 1):
+                        yield f"{get_column_letter(col_idx)}{row_idx}"
 
     def get_cell_value(self, sheet: str, addr: str):
         cell = self._find_cell(sheet, addr)
         if cell is None:
             return None
 
-        raw = cell["raw_cell"]
+        return self._cell_value(cell["raw_cell"])
 
+    def _cell_value(self, raw):
         text = "".join(raw.itertext()).strip()
         if text:
             return text
 
         return raw.attrib.get(
-            f"{{{self.NS["office"]}}}value"
+            OFFICE_VALUE
         )
     
+    def get_range(self, sheet: str, cells) -> CellRange:
+        addresses = range_addresses(cells)
+        found = [None] * len(addresses)  # (buňka, sloupec) pro každou adresu
+
+        grid = self._sheet_grid(sheet)
+        if grid is not None:
+            targets = sorted(
+                (*parse_address(addr), i)
+                for i, addr in enumerate(addresses)
+            )
+
+            # jeden průchod intervaly řádků a buněk v pořadí adres
+            rows = grid.rows
+            r = c = 0
+            current = None
+            for row, col, i in targets:
+                while r < len(rows.ends) and rows.ends[r] < row:
+                    r += 1
+                if r == len(rows.ends) or rows.starts[r] > row:
+                    continue
+
+                if row != current:
+                    current, c = row, 0
+
+                row_cells = rows.values[r]
+                while c < len(row_cells.ends) and row_cells.ends[c] < col:
+                    c += 1
+                if c == len(row_cells.ends) or row_cells.starts[c] > col:
+                    continue
+
+                found[i] = (row_cells.values[c], col)
+
+        # opakované buňky sdílí jeden prvek, styly se opakují – obojí stačí spočítat jednou
+        parsed: dict[int, tuple] = {}
+        styles: dict[str | None, dict] = {}
+
+        result = CellRange(sheet)
+        for addr, hit in zip(addresses, found):
+            if hit is None:
+                result.append(addr, None, None, None)
+                continue
+
+            raw, col = hit
+            if id(raw) not in parsed:
+                parsed[id(raw)] = (self._cell_info(raw), self._cell_value(raw))
+            info, value = parsed[id(raw)]
+
+            style_name = raw.attrib.get(TABLE_STYLE_NAME) or grid.column_default_styles.get(col)
+            if style_name not in styles:
+                styles[style_name] = self._cell_style(style_name)
+
+            result.append(addr, info, value, styles[style_name])
+
+        return result
+
     def has_formula(self, sheet: str, addr: str) -> bool:
         cell = self._find_cell(sheet, addr)
         if not cell:
@@ -558,11 +625,11 @@ class CalcDocument(SpreadsheetDocument):
         return cell["formula"] is not None
     
     def iter_charts(self):
-        for ch in self.content.findall(".//chart:chart", self.NS):
+        for ch in self.content.findall(ALL_CHART_CHART):
             yield ch, self.content
 
         for obj in self.objects.values():
-            for ch in obj.findall(".//chart:chart", self.NS):
+            for ch in obj.findall(ALL_CHART_CHART):
                 yield ch, obj
 
     def has_chart(self, sheet: str) -> bool:
@@ -598,9 +665,9 @@ class CalcDocument(SpreadsheetDocument):
     def chart_has_data_labels(self, sheet: str) -> bool:
         for chart, root in self.iter_charts():
 
-            for series in chart.findall(".//chart:series", self.NS):
+            for series in chart.findall(ALL_CHART_SERIES):
                 style_name = series.attrib.get(
-                    f"{{{self.NS['chart']}}}style-name"
+                    CHART_STYLE_NAME
                 )
                 if not style_name:
                     continue
@@ -612,13 +679,13 @@ class CalcDocument(SpreadsheetDocument):
                 if style is None:
                     continue
 
-                props = style.find("style:chart-properties", self.NS)
+                props = style.find(STYLE_CHART_PROPERTIES)
                 if props is None:
                     continue
 
                 if (
-                    props.attrib.get(f"{{{self.NS['chart']}}}data-label-number") == "value"
-                    or props.attrib.get(f"{{{self.NS['chart']}}}display-label") == "true"
+                    props.attrib.get(CHART_DATA_LABEL_NUMBER) == "value"
+                    or props.attrib.get(CHART_DISPLAY_LABEL) == "true"
                 ):
                     return True
 
@@ -627,7 +694,7 @@ class CalcDocument(SpreadsheetDocument):
     def chart_type(self, sheet: str) -> str | None:
         for chart, _root in self.iter_charts():
             chart_class = chart.attrib.get(
-                f"{{{self.NS['chart']}}}class"
+                CHART_CLASS
             )
             if not chart_class:
                 continue
@@ -643,12 +710,12 @@ class CalcDocument(SpreadsheetDocument):
         for chart, _source in self.iter_charts():
 
             if chart.attrib.get(
-                f"{{{self.NS['chart']}}}three-dimensional"
+                CHART_THREE_DIMENSIONAL
             ) == "true":
                 return True
 
             for el in chart.iter():
-                if el.tag.startswith(f"{{{self.NS['dr3d']}}}"):
+                if el.tag.startswith(DR3D):
                     return True
 
         return False
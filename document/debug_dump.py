@@ -0,0 +1,75 @@
+"""
+Výpis XML částí balíku pro ladění. Každá vybraná část se znovu načte
+z archivu do samostatného stromu (stromy kontrol zůstanou beze změny),
+odsadí se přes ET.indent a zapíše rovnou do souboru – bez převodu na
+řetězec a minidom. Víc částí lze vypsat souběžně v procesech.
+"""
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterable
+
+from document.archive import Archive
+
+
+def select_parts(names: Iterable[str], patterns: Iterable[str] | None) -> list[str]:
+    """Části odpovídající některému vzoru (fnmatch); bez vzorů všechna .xml."""
+    patterns = list(patterns or ["*.xml"])
+    return [name for name in names if any(fnmatch(name, p) for p in patterns)]
+
+
+def dump_part(archive: Archive, name: str, out_dir: str | Path) -> Path | None:
+    """Odsazená kopie části v out_dir/<název části>; nečitelné XML se přeskočí."""
+    try:
+        with archive.open(name, cache=False) as f:
+            tree = ET.parse(f)
+    except (ET.ParseError, KeyError):
+        return None
+
+    ET.indent(tree, space="  ")
+
+    target = Path(out_dir) / name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tree.write(target, encoding="utf-8", xml_declaration=True)
+    return target
+
+
+def dump_parts(
+    archive: Archive,
+    names: list[str],
+    out_dir: str | Path,
+    workers: int = 1,
+) -> list[Path]:
+    """
+    Vypíše části do out_dir. S workers > 1 se části rozdělí mezi procesy,
+    každý si archiv otevře sám (stromy se mezi procesy nepřenáší).
+    """
+    workers = min(workers, len(names))
+    if workers <= 1:
+        written = [dump_part(archive, name, out_dir) for name in names]
+        return [path for path in written if path is not None]
+
+    # největší části první, ať se procesy vytíží rovnoměrně
+    names = sorted(names, key=archive.size, reverse=True)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(archive.path,),
+    ) as pool:
+        written = list(pool.map(_dump_in_worker, names, [out_dir] * len(names)))
+
+    return [path for path in written if path is not None]
+
+
+_worker_archive = None
+
+
+def _init_worker(path: str):
+    global _worker_archive
+    _worker_archive = Archive(path)
+
+
+def _dump_in_worker(name: str, out_dir: str | Path) -> Path | None:
+    return dump_part(_worker_archive, name, out_dir)
@@ -1,74 +1,232 @@
 import re
-import zipfile
-from pathlib import Path
-import xml.dom.minidom as minidom
+from functools import cached_property
 import xml.etree.ElementTree as ET
-from openpyxl import load_workbook
-from openpyxl.utils import range_boundaries
-from openpyxl.utils import range_boundaries, column_index_from_string
-
-from document.spreadsheet_document import SpreadsheetDocument
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import Cell
+from openpyxl.cell.read_only import EmptyCell
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.stylesheet import apply_stylesheet
+from openpyxl.utils import range_boundaries, column_index_from_string, get_column_letter
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+from openpyxl.worksheet.formula import ArrayFormula
+
+from document import xml_backend
+from document.archive import Archive
+from document.qnames import (
+    REL_NS, SML_C, SML_F, SML_NS, SML_ROW,
+)
+from document.spreadsheet_document import CellRange, SpreadsheetDocument, range_addresses
 
 NS = {
-    "main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
-    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "main": SML_NS,
+    "rel": REL_NS,
 }
 
 
 class ExcelDocument(SpreadsheetDocument):
+    DEBUG_DIR = "debug_excel_xml"
+
     def __init__(self, path: str):
         self.path = path
-        self.wb = load_workbook(path, data_only=False)
-        self.wb_values = load_workbook(path, data_only=True) 
+        self._archive = Archive(path)
 
         self.NS = NS
-        self._zip = zipfile.ZipFile(path)
         self.workbook_xml = self._load_xml("xl/workbook.xml")
-        self.sheets = self._load_sheets_xml()    
 
 
-    def _load_xml(self, name: str) -> ET.Element:
-        with self._zip.open(name) as f:
-            return ET.fromstring(f.read())
+    def preload(self):
+        self._sheet_data
+        self.wb
 
-    def _load_sheets_xml(self) -> dict:
-        sheets = {}
+    @cached_property
+    def wb(self):
+        """
+        Celý sešit z openpyxl; načítá se až pro funkce, které z listů
+        nečteme sami (grafy, sloučené buňky, podmíněné formátování…).
+        openpyxl čte přes stejný otevřený soubor.
+        """
+        return load_workbook(self._archive.file, data_only=False)
 
+    def _load_xml(self, name: str) -> ET.Element:
+        with self._archive.open(name) as f:
+            return xml_backend.parse(f)
+
+    def _workbook_parts(self) -> tuple[dict, str | None]:
+        """
+        Vrací {název listu: cesta k XML listu} a cestu ke sdíleným řetězcům
+        podle xl/_rels/workbook.xml.rels.
+        """
         rels = self._load_xml("xl/_rels/workbook.xml.rels")
-        rel_map = {
-            r.attrib["Id"]: r.attrib["Target"]
-            for r in rels.findall(".//{*}Relationship")
-        }
+        rel_map = {}
+        shared_strings = None
 
-        for sheet in self.workbook_xml.findall(".//{*}sheet"):
-            name = sheet.attrib.get("name")
+        for r in rels.findall(".//{*}Relationship"):
+            target = r.attrib["Target"]
+            target = target[1:] if target.startswith("/") else f"xl/{target}"
+            rel_type = r.attrib.get("Type", "")
+
+            if rel_type.endswith("/sharedStrings"):
+                shared_strings = target
+            elif rel_type.endswith("/worksheet"):
+                rel_map[r.attrib["Id"]] = target
 
+        parts = {}
+        for sheet in self.workbook_xml.findall(".//{*}sheet"):
             r_id = None
             for k, v in sheet.attrib.items():
                 if k.endswith("}id"):
                     r_id = v
                     break
 
-            if not r_id:
-                continue
-
             target = rel_map.get(r_id)
-            if not target:
-                continue
+            if target:
+                parts[sheet.attrib.get("name")] = target
+
+        return parts, shared_strings
+
+    @property
+    def _cells(self) -> dict:
+        return self._sheet_data[0]
+
+    @cached_property
+    def _sheet_data(self) -> tuple[dict, dict]:
+        """
+        Buňky všech listů ({list: {adresa: buňka}}) a styl buňky, která
+        v XML listu není. Každá buňka má value (cachovanou hodnotu),
+        formula, array_ref, row, column a style (slovník z _style_of).
+
+        Rychlá cesta stojí na interním API openpyxl (WorkSheetParser,
+        seznamy stylů sešitu); když se v jiné verzi openpyxl změní,
+        buňky se načtou veřejným load_workbook(read_only=True).
+        """
+        try:
+            return self._parse_sheets()
+        except (ImportError, AttributeError):
+            return self._read_sheets()
+
+    def _parse_sheets(self) -> tuple[dict, dict]:
+        """
+        Jeden průchod přes XML každého listu. Převody hodnot (sdílené
+        řetězce, data, sdílené vzorce) dělá WorkSheetParser z openpyxl,
+        takže výsledek odpovídá load_workbook s data_only=True / False.
+        """
+        from openpyxl.worksheet._reader import WorkSheetParser
+
+        # prázdný sešit jen se styly z xl/styles.xml a epochou sešitu
+        book = Workbook()
+        apply_stylesheet(self._archive, book)
+
+        pr = self.workbook_xml.find("{*}workbookPr")
+        if pr is not None and pr.get("date1904") in ("1", "true"):
+            book.epoch = CALENDAR_MAC_1904
+
+        # styl se počítá jednou pro každé style_id, ne pro každou buňku
+        styles = {}
+
+        def style_of(style_id):
+            if style_id not in styles:
+                array = book._cell_styles[style_id] if style_id is not None else None
+                styles[style_id] = self._style_of(Cell(book.active, style_array=array))
+            return styles[style_id]
+
+        parts, strings_part = self._workbook_parts()
+
+        shared_strings = []
+        if strings_part and strings_part in self._archive:
+            with self._archive.open(strings_part) as f:
+                shared_strings = read_string_table(f)
+
+        cells = {}
+        for name, part in parts.items():
+            parser = WorkSheetParser(
+                None,
+                shared_strings,
+                data_only=True,
+                epoch=book.epoch,
+                date_formats=book._date_formats,
+                timedelta_formats=book._timedelta_formats,
+            )
+            sheet_cells = {}
+
+            # list se čte jen jednou, do cache se nedává
+            with self._archive.open(part, cache=False) as f:
+                for event, el in xml_backend.iterparse(
+                    f, events=("start", "end"), tag=(SML_ROW, SML_C)
+                ):
+                    if event == "start":
+                        if el.tag == SML_ROW:
+                            parser.row_counter = int(el.get("r", parser.row_counter + 1))
+                            parser.col_counter = 0
+                    elif el.tag == SML_C:
+                        cell = parser.parse_cell(el)
+                        f_el = el.find(SML_F)
+
+                        cell["style"] = style_of(cell.pop("style_id"))
+                        cell["formula"] = None
+                        cell["array_ref"] = None
+                        if f_el is not None:
+                            cell["formula"] = parser.parse_formula(el)
+                            if f_el.get("t") == "array":
+                                cell["array_ref"] = f_el.get("ref") or ""
+
+                        addr = get_column_letter(cell["column"]) + str(cell["row"])
+                        sheet_cells[addr] = cell
+                    elif el.tag == SML_ROW:
+                        el.clear()
+
+            cells[name] = dict(
+                sorted(sheet_cells.items(), key=lambda kv: (kv[1]["row"], kv[1]["column"]))
+            )
+
+        return cells, style_of(None)
+
+    def _read_sheets(self) -> tuple[dict, dict]:
+        """Totéž přes veřejné API openpyxl – dva průchody v režimu read_only."""
+        formulas = load_workbook(self._archive.path, read_only=True, data_only=False)
+        values = load_workbook(self._archive.path, read_only=True, data_only=True)
+
+        cells = {}
+        for ws in formulas.worksheets:
+            sheet_cells = {}
+
+            for row in ws.iter_rows():
+                for c in row:
+                    if isinstance(c, EmptyCell):
+                        continue
 
-            xml = self._load_xml(f"xl/{target}")
-            sheets[name] = {
-                "xml": xml,
-                "path": target,
-            }
+                    formula = array_ref = None
+                    if isinstance(c.value, ArrayFormula):
+                        formula, array_ref = c.value, c.value.ref or ""
+                    elif isinstance(c.value, str) and c.value.startswith("="):
+                        formula = c.value
+
+                    sheet_cells[c.coordinate] = {
+                        "row": c.row,
+                        "column": c.column,
+                        "value": None,
+                        "formula": formula,
+                        "array_ref": array_ref,
+                        "style": self._style_of(c),
+                    }
+
+            for row in values[ws.title].iter_rows():
+                for c in row:
+                    if not isinstance(c, EmptyCell) and c.coordinate in sheet_cells:
+                        sheet_cells[c.coordinate]["value"] = c.value
 
-        return sheets
+            cells[ws.title] = sheet_cells
+
+        default = self._style_of(Cell(formulas.worksheets[0])) if formulas.worksheets else {}
+        formulas.close()
+        values.close()
+        return cells, default
 
     def get_cell_value_cached(self, sheet: str, addr: str):
-        return self.wb_values[sheet][addr].value
+        cell = self._cells[sheet].get(addr.replace("$", "").upper())
+        return cell["value"] if cell else None
 
     def sheet_names(self) -> list[str]:
-        return self.wb.sheetnames
+        return [s.get("name") for s in self.workbook_xml.findall(".//{*}sheet")]
 
     def get_cell(self, address: str, *, include_value=False):
         if "!" not in address:
@@ -76,79 +234,40 @@ class ExcelDocument(SpreadsheetDocument):
 
         sheet, addr = address.split("!", 1)
 
-        if sheet not in self.wb.sheetnames:
+        if sheet not in self.sheet_names():
             return None
 
-        ws = self.wb[sheet]
-        cell = ws[addr]
+        cell = self._cells.get(sheet, {}).get(addr.replace("$", "").upper())
 
-        if cell.value is None and cell.data_type != "f":
+        if cell is None or (cell["value"] is None and cell["formula"] is None):
             return None
 
         data = {
             "sheet": sheet,
             "address": addr,
-            "raw_cell": cell,
-            "formula": cell.value if cell.data_type == "f" else None,
-            "value_cached": self.wb_values[sheet][addr].value,
+            "formula": cell["formula"],
+            "value_cached": cell["value"],
         }
 
         if include_value:
-            data["value"] = cell.value
+            data["value"] = cell["formula"] if cell["formula"] is not None else cell["value"]
 
         return data
 
-    def save_debug_xml(self, out_dir: str | Path = "debug_excel_xml"):
-        out_dir = Path(out_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(self.path) as z:
-            for name in z.namelist():
-                if not name.endswith(".xml"):
-                    continue
-
-                try:
-                    raw = z.read(name)
-                    root = ET.fromstring(raw)
-                except Exception:
-                    continue
-
-                pretty = minidom.parseString(
-                    ET.tostring(root, encoding="utf-8")
-                ).toprettyxml(indent="  ", encoding="utf-8")
-
-                target = out_dir / name
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_bytes(pretty)
-
-
 #------------
     def get_array_formula_cells(self) -> list[str]:
         cells: list[str] = []
 
-        for sheet_name, data in self.sheets.items():
-            xml = data["xml"] 
-
-            for c in xml.iter():
-                if not c.tag.endswith("}c"):
-                    continue
-
-                f = None
-                for ch in list(c):
-                    if ch.tag.endswith("}f"):
-                        f = ch
-                        break
-
-                if f is None:
+        for sheet_name, sheet_cells in self._cells.items():
+            for addr, cell in sheet_cells.items():
+                ref = cell["array_ref"]
+                if ref is None:
                     continue
 
-                if f.get("t") == "array":
-                    addr = c.get("r")
-                    ref = f.get("ref") 
-                    if ref:
-                        cells.append(f"{sheet_name}!{ref} (anchor {addr})")
-                    else:
-                        cells.append(f"{sheet_name}!{addr}")
+                if ref:
+                    cells.append(f"{sheet_name}!{ref} (anchor {addr})")
+                else:
+                    cells.append(f"{sheet_name}!{addr}")
 
         return cells
         
@@ -168,14 +287,13 @@ class ExcelDocument(SpreadsheetDocument):
         }
     
     def iter_formulas(self):
-        for ws in self.wb.worksheets:
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.data_type == "f" and isinstance(cell.value, str):
-                        yield {
-                            "sheet": ws.title,
-                            "formula": cell.value,
-                        }
+        for sheet, sheet_cells in self._cells.items():
+            for cell in sheet_cells.values():
+                if isinstance(cell["formula"], str):
+                    yield {
+                        "sheet": sheet,
+                        "formula": cell["formula"],
+                    }
 
     def normalize_formula(self, f) -> str:
         if f is None:
@@ -196,15 +314,14 @@ class ExcelDocument(SpreadsheetDocument):
     def cells_with_formulas(self):
         cells = []
 
-        for ws in self.wb.worksheets:
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.data_type == "f":
-                        cells.append({
-                            "sheet": ws.title,
-                            "address": cell.coordinate,
-                            "formula": cell.value,
-                        })
+        for sheet, sheet_cells in self._cells.items():
+            for addr, cell in sheet_cells.items():
+                if cell["formula"] is not None:
+                    cells.append({
+                        "sheet": sheet,
+                        "address": addr,
+                        "formula": cell["formula"],
+                    })
 
         return cells
         
@@ -285,30 +402,74 @@ class ExcelDocument(SpreadsheetDocument):
         if cell is None:
             return None
 
+        return self._style_of(cell)
+
+    def _style_of(self, cell) -> dict:
         return {
             "number_format": cell.number_format,
             "align_h": cell.alignment.horizontal,
             "bold": bool(cell.font and cell.font.bold),
             "wrap": bool(cell.alignment and cell.alignment.wrap_text), 
         }
+
+    def get_range(self, sheet: str, cells) -> CellRange:
+        result = CellRange(sheet)
+        addresses = range_addresses(cells)
+
+        if sheet not in self.sheet_names():
+            for addr in addresses:
+                result.append(addr, None, None, None)
+            return result
+
+        sheet_cells = self._cells.get(sheet, {})
+        default_style = self._sheet_data[1]
+
+        for addr in addresses:
+            cell = sheet_cells.get(addr.replace("$", "").upper())
+
+            info = value = None
+            style = default_style
+            if cell is not None:
+                style = cell["style"]
+                value = cell["formula"] if cell["formula"] is not None else cell["value"]
+
+                if cell["value"] is not None or cell["formula"] is not None:
+                    cached = cell["value"]
+                    info = {
+                        "formula": cell["formula"],
+                        "value_cached": cached,
+                        "is_error": isinstance(cached, str) and cached.startswith("#"),
+                    }
+
+            result.append(addr, info, value, style)
+
+        return result
     
     def iter_cells(self, sheet: str):
-        try:
-            ws = self.wb[sheet]
-        except KeyError:
+        sheet_cells = self._cells.get(sheet)
+        if not sheet_cells:
             return
-        for row in ws.iter_rows():
-            for cell in row:
-                yield cell.coordinate
+
+        # jako ws.iter_rows() v openpyxl: od A1 po poslední buňku
+        max_row = max(c["row"] for c in sheet_cells.values())
+        max_col = max(c["column"] for c in sheet_cells.values())
+        for row in range(1, max_row + 1):
+            for col in range(1, max_col + 1):
+                yield get_column_letter(col) + str(row)
+
+    def _formula_or_value(self, sheet: str, addr: str):
+        # jako hodnota buňky v openpyxl s data_only=False
+        cell = self._cells[sheet].get(addr.replace("$", "").upper())
+        if cell is None:
+            return None
+        return cell["formula"] if cell["formula"] is not None else cell["value"]
 
     def get_cell_value(self, sheet: str, addr: str):
-        ws = self.wb[sheet]
-        return ws[addr].value
+        return self._formula_or_value(sheet, addr)
     
     def has_formula(self, sheet: str, addr: str) -> bool:
-        ws = self.wb[sheet]
-        cell = ws[addr]
-        return isinstance(cell.value, str) and cell.value.startswith("=")
+        value = self._formula_or_value(sheet, addr)
+        return isinstance(value, str) and value.startswith("=")
     
     def has_chart(self, sheet: str) -> bool:
         try:
@@ -380,4 +541,4 @@ class ExcelDocument(SpreadsheetDocument):
         return False
     
     def has_sheet(self, name: str) -> bool:
-        return name in self.wb.sheetnames
\ No newline at end of file
+        return name in self.sheet_names()
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""
+Rozměry obrázků z balíku bez dekódování: z hlavičky PNG, JPEG, GIF, BMP,
+TIFF a EMF se přečte jen několik bajtů přímo z proudu zip položky.
+Ostatní formáty zkusí Pillow, pokud je nainstalovaný.
+"""
+import io
+import struct
+from dataclasses import dataclass
+from typing import IO
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    format: str
+    width: int
+    height: int
+    dpi: tuple[float, float] | None = None
+
+
+def probe(f: IO[bytes]) -> ImageInfo | None:
+    """Rozměry obrázku z otevřeného proudu; None, když formát nezná."""
+    head = f.read(32)
+    s = _Stream(head, f)
+
+    try:
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return _png(s)
+        if head.startswith(b"\xff\xd8"):
+            return _jpeg(s)
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            w, h = struct.unpack_from("<HH", head, 6)
+            return ImageInfo("GIF", w, h)
+        if head.startswith(b"BM"):
+            return _bmp(s)
+        if head[:4] in (b"II*\x00", b"MM\x00*"):
+            return _tiff(s)
+        if head[:4] == b"\x01\x00\x00\x00":
+            return _emf(s)
+    except (struct.error, ValueError, EOFError, ZeroDivisionError):
+        return None
+
+    return None
+
+
+def probe_member(archive, name: str) -> ImageInfo | None:
+    """
+    Rozměry obrázku z položky balíku (document.archive.Archive). Chybějící
+    položka vyhodí KeyError; neznámý formát se celý načte a zkusí se Pillow.
+    """
+    with archive.open(name, cache=False) as f:
+        info = probe(f)
+
+    if info is None:
+        with archive.open(name, cache=False) as f:
+            info = _pillow(f.read())
+
+    return info
+
+
+class _Stream:
+    """Čtení od začátku položky: nejdřív už přečtená hlavička, pak proud."""
+
+    def __init__(self, head: bytes, f):
+        self._head = head
+        self._pos = 0
+        self._f = f
+
+    def read(self, n: int) -> bytes:
+        data = self._head[self._pos:self._pos + n]
+        self._pos += len(data)
+        if len(data) < n:
+            data += self._f.read(n - len(data))
+        if len(data) < n:
+            raise EOFError
+        return data
+
+    def skip(self, n: int):
+        rest = len(self._head) - self._pos
+        if n <= rest:
+            self._pos += n
+            return
+
+        self._pos = len(self._head)
+        n -= rest
+        if self._f.seekable():
+            # zip položka se přeskočí bez kopírování dat do Pythonu
+            self._f.seek(n, io.SEEK_CUR)
+            return
+
+        while n > 0:
+            chunk = self._f.read(min(n, 1 << 16))
+            if not chunk:
+                raise EOFError
+            n -= len(chunk)
+
+
+def _png(s: _Stream) -> ImageInfo:
+    header = s.read(33)  # podpis + IHDR
+    if header[12:16] != b"IHDR":
+        raise ValueError
+    w, h = struct.unpack_from(">II", header, 16)
+
+    # pHYs musí být před IDAT
+    dpi = None
+    while True:
+        length, kind = struct.unpack(">I4s", s.read(8))
+        if kind == b"pHYs":
+            x, y, unit = struct.unpack(">IIB", s.read(9))
+            if unit == 1:
+                dpi = (x * 0.0254, y * 0.0254)
+            break
+        if kind in (b"IDAT", b"IEND"):
+            break
+        s.skip(length + 4)
+
+    return ImageInfo("PNG", w, h, dpi)
+
+
+# SOF0–SOF15 kromě DHT (C4), JPG (C8) a DAC (CC)
+_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg(s: _Stream) -> ImageInfo:
+    s.skip(2)
+    dpi = None
+
+    while True:
+        if s.read(1) != b"\xff":
+            continue
+
+        code = s.read(1)[0]
+        while code == 0xFF:
+            code = s.read(1)[0]
+
+        if code in (0x01, 0xD8) or 0xD0 <= code <= 0xD7:
+            continue
+        if code == 0xD9:
+            raise ValueError
+
+        length = struct.unpack(">H", s.read(2))[0]
+
+        if code in _SOF:
+            h, w = struct.unpack(">xHH", s.read(5))
+            return ImageInfo("JPEG", w, h, dpi)
+
+        if code == 0xE0 and dpi is None and length >= 16:
+            segment = s.read(length - 2)
+            if segment.startswith(b"JFIF\x00"):
+                unit, x, y = struct.unpack_from(">BHH", segment, 7)
+                if unit == 1:
+                    dpi = (float(x), float(y))
+                elif unit == 2:
+                    dpi = (x * 2.54, y * 2.54)
+            continue
+
+        s.skip(length - 2)
+
+
+def _bmp(s: _Stream) -> ImageInfo:
+    header = s.read(26)
+    size = struct.unpack_from("<I", header, 14)[0]
+
+    if size == 12:
+        w, h = struct.unpack_from("<HH", header, 18)
+        return ImageInfo("BMP", w, h)
+
+    header += s.read(46 - len(header))
+    w, h = struct.unpack_from("<ii", header, 18)
+    x, y = struct.unpack_from("<ii", header, 38)
+    dpi = (x * 0.0254, y * 0.0254) if x > 0 and y > 0 else None
+    return ImageInfo("BMP", w, abs(h), dpi)
+
+
+def _tiff(s: _Stream) -> ImageInfo:
+    data = s.read(8)
+    order = "<" if data[:2] == b"II" else ">"
+
+    def upto(end: int):
+        # IFD bývá hned za hlavičkou, hodnoty mohou ležet dál v souboru
+        nonlocal data
+        if end > len(data):
+            data += s.read(end - len(data))
+
+    offset = struct.unpack_from(order + "I", data, 4)[0]
+    upto(offset + 2)
+    count = struct.unpack_from(order + "H", data, offset)[0]
+    upto(offset + 2 + count * 12)
+
+    tags = {}
+    for i in range(count):
+        tag, kind, _, value = struct.unpack_from(order + "HHI4s", data, offset + 2 + i * 12)
+        if kind == 3:
+            tags[tag] = struct.unpack_from(order + "H", value)[0]
+        elif kind == 4:
+            tags[tag] = struct.unpack_from(order + "I", value)[0]
+        elif kind == 5:
+            tags[tag] = (struct.unpack(order + "I", value)[0],)
+
+    w, h = tags[256], tags[257]
+
+    dpi = None
+    res = (tags.get(282), tags.get(283))
+    if all(isinstance(r, tuple) for r in res):
+        values = []
+        for (pointer,) in res:
+            upto(pointer + 8)
+            num, den = struct.unpack_from(order + "II", data, pointer)
+            values.append(num / den)
+
+        unit = tags.get(296, 2)
+        if unit == 2:
+            dpi = (values[0], values[1])
+        elif unit == 3:
+            dpi = (values[0] * 2.54, values[1] * 2.54)
+
+    return ImageInfo("TIFF", w, h, dpi)
+
+
+def _emf(s: _Stream) -> ImageInfo:
+    header = s.read(44)
+    if header[40:44] != b" EMF":
+        raise ValueError
+
+    # rclBounds v bodech zařízení, rclFrame v setinách milimetru (jako Pillow)
+    x0, y0, x1, y1 = struct.unpack_from("<iiii", header, 8)
+    fx0, fy0, fx1, fy1 = struct.unpack_from("<iiii", header, 24)
+    w, h = x1 - x0, y1 - y0
+    dpi = (2540.0 * w / (fx1 - fx0), 2540.0 * h / (fy1 - fy0))
+    return ImageInfo("EMF", w, h, dpi)
+
+
+def _pillow(data: bytes) -> ImageInfo | None:
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        image = Image.open(io.BytesIO(data))
+        width, height = image.size
+    except Exception:
+        return None
+
+    dpi = image.info.get("dpi")
+    return ImageInfo(image.format or "", width, height, tuple(dpi) if dpi else None)
@@ -0,0 +1,274 @@
+"""
+Jmenné prostory, názvy prvků a atributů v Clarkově notaci ({uri}název)
+a z nich složené cesty. Skládají se jednou při importu, takže se v cyklech
+žádné názvy neformátují a find() / findall() nad nimi nepotřebují mapu
+prefixů – přímého potomka ElementTree najde bez ElementPath.
+"""
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+M_NS = "http://schemas.openxmlformats.org/officeDocument/2006/math"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+SML_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+OFFICE_NS = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+STYLE_NS = "urn:oasis:names:tc:opendocument:xmlns:style:1.0"
+TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+FO_NS = "urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0"
+NUMBER_NS = "urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0"
+CHART_NS = "urn:oasis:names:tc:opendocument:xmlns:chart:1.0"
+DR3D_NS = "urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0"
+LOEXT_NS = "urn:org:documentfoundation:names:experimental:office:xmlns:loext:1.0"
+CALCEXT_NS = "urn:org:documentfoundation:names:experimental:calc:xmlns:calcext:1.0"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+
+# --- WordprocessingML (DOCX) ---
+
+W = f"{{{W_NS}}}"
+W_ABSTRACTNUM = f"{W}abstractNum"
+W_ABSTRACTNUMID = f"{W}abstractNumId"
+W_ANCHOR = f"{W}anchor"
+W_ASCII = f"{W}ascii"
+W_B = f"{W}b"
+W_BASEDON = f"{W}basedOn"
+W_BCS = f"{W}bCs"
+W_BEFORE = f"{W}before"
+W_BIBLIOGRAPHY = f"{W}bibliography"
+W_BODY = f"{W}body"
+W_BOOKMARKSTART = f"{W}bookmarkStart"
+W_CAPS = f"{W}caps"
+W_CITATION = f"{W}citation"
+W_COLOR = f"{W}color"
+W_CS = f"{W}cs"
+W_DEFAULT = f"{W}default"
+W_DRAWING = f"{W}drawing"
+W_EVENANDODDHEADERS = f"{W}evenAndOddHeaders"
+W_FIRSTLINE = f"{W}firstLine"
+W_FLDCHAR = f"{W}fldChar"
+W_FLDCHARTYPE = f"{W}fldCharType"
+W_FLDSIMPLE = f"{W}fldSimple"
+W_FOOTERREFERENCE = f"{W}footerReference"
+W_HANGING = f"{W}hanging"
+W_HANSI = f"{W}hAnsi"
+W_HEADERREFERENCE = f"{W}headerReference"
+W_HYPERLINK = f"{W}hyperlink"
+W_I = f"{W}i"
+W_ICS = f"{W}iCs"
+W_ILVL = f"{W}ilvl"
+W_IND = f"{W}ind"
+W_INSTR = f"{W}instr"
+W_INSTRTEXT = f"{W}instrText"
+W_JC = f"{W}jc"
+W_LEFT = f"{W}left"
+W_LINE = f"{W}line"
+W_LINERULE = f"{W}lineRule"
+W_LINK = f"{W}link"
+W_LVL = f"{W}lvl"
+W_LVLTEXT = f"{W}lvlText"
+W_NAME = f"{W}name"
+W_NUM = f"{W}num"
+W_NUMID = f"{W}numId"
+W_NUMPR = f"{W}numPr"
+W_OUTLINELVL = f"{W}outlineLvl"
+W_P = f"{W}p"
+W_PAGEBREAKBEFORE = f"{W}pageBreakBefore"
+W_PGNUMTYPE = f"{W}pgNumType"
+W_POS = f"{W}pos"
+W_PPR = f"{W}pPr"
+W_PSTYLE = f"{W}pStyle"
+W_R = f"{W}r"
+W_RFONTS = f"{W}rFonts"
+W_RIGHT = f"{W}right"
+W_RPR = f"{W}rPr"
+W_RSTYLE = f"{W}rStyle"
+W_SDT = f"{W}sdt"
+W_SDTPR = f"{W}sdtPr"
+W_SECTPR = f"{W}sectPr"
+W_SPACING = f"{W}spacing"
+W_START = f"{W}start"
+W_STYLE = f"{W}style"
+W_STYLEID = f"{W}styleId"
+W_SZ = f"{W}sz"
+W_T = f"{W}t"
+W_TAB = f"{W}tab"
+W_TABS = f"{W}tabs"
+W_TBL = f"{W}tbl"
+W_TITLEPG = f"{W}titlePg"
+W_TYPE = f"{W}type"
+W_U = f"{W}u"
+W_VAL = f"{W}val"
+W_WEBHIDDEN = f"{W}webHidden"
+
+M = f"{{{M_NS}}}"
+M_OMATH = f"{M}oMath"
+M_OMATHPARA = f"{M}oMathPara"
+
+R = f"{{{R_NS}}}"
+R_EMBED = f"{R}embed"
+R_ID = f"{R}id"
+
+A = f"{{{A_NS}}}"
+A_BLIP = f"{A}blip"
+A_GRAPHICDATA = f"{A}graphicData"
+
+REL = f"{{{REL_NS}}}"
+REL_RELATIONSHIP = f"{REL}Relationship"
+
+# --- SpreadsheetML (XLSX) ---
+
+SML = f"{{{SML_NS}}}"
+SML_C = f"{SML}c"
+SML_F = f"{SML}f"
+SML_ROW = f"{SML}row"
+
+# --- OpenDocument (ODT / ODS) ---
+
+OFFICE = f"{{{OFFICE_NS}}}"
+OFFICE_SPREADSHEET = f"{OFFICE}spreadsheet"
+OFFICE_TEXT = f"{OFFICE}text"
+OFFICE_VALUE = f"{OFFICE}value"
+
+STYLE = f"{{{STYLE_NS}}}"
+STYLE_CHART_PROPERTIES = f"{STYLE}chart-properties"
+STYLE_DATA_STYLE_NAME = f"{STYLE}data-style-name"
+STYLE_DEFAULT_OUTLINE_LEVEL = f"{STYLE}default-outline-level"
+STYLE_DEFAULT_STYLE = f"{STYLE}default-style"
+STYLE_DISPLAY_NAME = f"{STYLE}display-name"
+STYLE_FONT_NAME = f"{STYLE}font-name"
+STYLE_FONT_STYLE_NAME = f"{STYLE}font-style-name"
+STYLE_FOOTER = f"{STYLE}footer"
+STYLE_HEADER = f"{STYLE}header"
+STYLE_MAP = f"{STYLE}map"
+STYLE_MASTER_PAGE = f"{STYLE}master-page"
+STYLE_MASTER_PAGE_NAME = f"{STYLE}master-page-name"
+STYLE_NAME = f"{STYLE}name"
+STYLE_NUM_FORMAT = f"{STYLE}num-format"
+STYLE_PAGE_LAYOUT_NAME = f"{STYLE}page-layout-name"
+STYLE_PAGE_LAYOUT_PROPERTIES = f"{STYLE}page-layout-properties"
+STYLE_PAGE_NUMBER = f"{STYLE}page-number"
+STYLE_PARAGRAPH_PROPERTIES = f"{STYLE}paragraph-properties"
+STYLE_PARENT_STYLE_NAME = f"{STYLE}parent-style-name"
+STYLE_POSITION = f"{STYLE}position"
+STYLE_STYLE = f"{STYLE}style"
+STYLE_TAB_STOP = f"{STYLE}tab-stop"
+STYLE_TAB_STOPS = f"{STYLE}tab-stops"
+STYLE_TEXT_PROPERTIES = f"{STYLE}text-properties"
+STYLE_TYPE = f"{STYLE}type"
+
+TEXT = f"{{{TEXT_NS}}}"
+TEXT_A = f"{TEXT}a"
+TEXT_BIBLIOGRAPHY = f"{TEXT}bibliography"
+TEXT_C = f"{TEXT}c"
+TEXT_CAPTION_SEQUENCE_NAME = f"{TEXT}caption-sequence-name"
+TEXT_DISPLAY_OUTLINE_LEVEL = f"{TEXT}display-outline-level"
+TEXT_H = f"{TEXT}h"
+TEXT_ILLUSTRATION_INDEX = f"{TEXT}illustration-index"
+TEXT_ILLUSTRATION_INDEX_SOURCE = f"{TEXT}illustration-index-source"
+TEXT_INDEX_BODY = f"{TEXT}index-body"
+TEXT_LEVEL = f"{TEXT}level"
+TEXT_LINE_BREAK = f"{TEXT}line-break"
+TEXT_NUM_LIST_FORMAT = f"{TEXT}num-list-format"
+TEXT_OUTLINE_LEVEL = f"{TEXT}outline-level"
+TEXT_OUTLINE_LEVEL_STYLE = f"{TEXT}outline-level-style"
+TEXT_OUTLINE_STYLE = f"{TEXT}outline-style"
+TEXT_P = f"{TEXT}p"
+TEXT_PAGE_NUMBER = f"{TEXT}page-number"
+TEXT_S = f"{TEXT}s"
+TEXT_SPAN = f"{TEXT}span"
+TEXT_STYLE_NAME = f"{TEXT}style-name"
+TEXT_TAB = f"{TEXT}tab"
+TEXT_TABLE_INDEX = f"{TEXT}table-index"
+TEXT_TABLE_INDEX_SOURCE = f"{TEXT}table-index-source"
+TEXT_TABLE_OF_CONTENT = f"{TEXT}table-of-content"
+TEXT_TABLE_OF_CONTENT_ENTRY_TEMPLATE = f"{TEXT}table-of-content-entry-template"
+TEXT_TABLE_OF_CONTENT_SOURCE = f"{TEXT}table-of-content-source"
+TEXT_TRACKED_CHANGES = f"{TEXT}tracked-changes"
+
+TABLE = f"{{{TABLE_NS}}}"
+TABLE_DEFAULT_CELL_STYLE_NAME = f"{TABLE}default-cell-style-name"
+TABLE_FORMULA = f"{TABLE}formula"
+TABLE_NAME = f"{TABLE}name"
+TABLE_NAMED_RANGE = f"{TABLE}named-range"
+TABLE_NUMBER_COLUMNS_REPEATED = f"{TABLE}number-columns-repeated"
+TABLE_NUMBER_COLUMNS_SPANNED = f"{TABLE}number-columns-spanned"
+TABLE_NUMBER_MATRIX_COLUMNS_SPANNED = f"{TABLE}number-matrix-columns-spanned"
+TABLE_NUMBER_MATRIX_ROWS_SPANNED = f"{TABLE}number-matrix-rows-spanned"
+TABLE_NUMBER_ROWS_REPEATED = f"{TABLE}number-rows-repeated"
+TABLE_NUMBER_ROWS_SPANNED = f"{TABLE}number-rows-spanned"
+TABLE_STYLE_NAME = f"{TABLE}style-name"
+TABLE_TABLE = f"{TABLE}table"
+TABLE_TABLE_CELL = f"{TABLE}table-cell"
+TABLE_TABLE_COLUMN = f"{TABLE}table-column"
+TABLE_TABLE_ROW = f"{TABLE}table-row"
+
+FO = f"{{{FO_NS}}}"
+FO_BREAK_BEFORE = f"{FO}break-before"
+FO_COLOR = f"{FO}color"
+FO_FONT_SIZE = f"{FO}font-size"
+FO_FONT_STYLE = f"{FO}font-style"
+FO_FONT_WEIGHT = f"{FO}font-weight"
+FO_LINE_HEIGHT = f"{FO}line-height"
+FO_MARGIN_TOP = f"{FO}margin-top"
+FO_TEXT_ALIGN = f"{FO}text-align"
+FO_TEXT_TRANSFORM = f"{FO}text-transform"
+FO_WRAP_OPTION = f"{FO}wrap-option"
+
+NUMBER = f"{{{NUMBER_NS}}}"
+NUMBER_DECIMAL_PLACES = f"{NUMBER}decimal-places"
+NUMBER_NUMBER = f"{NUMBER}number"
+NUMBER_NUMBER_STYLE = f"{NUMBER}number-style"
+
+CHART = f"{{{CHART_NS}}}"
+CHART_CHART = f"{CHART}chart"
+CHART_CLASS = f"{CHART}class"
+CHART_DATA_LABEL_NUMBER = f"{CHART}data-label-number"
+CHART_DISPLAY_LABEL = f"{CHART}display-label"
+CHART_SERIES = f"{CHART}series"
+CHART_STYLE_NAME = f"{CHART}style-name"
+CHART_THREE_DIMENSIONAL = f"{CHART}three-dimensional"
+
+DR3D = f"{{{DR3D_NS}}}"
+
+LOEXT = f"{{{LOEXT_NS}}}"
+LOEXT_NUM_LIST_FORMAT = f"{LOEXT}num-list-format"
+
+XLINK = f"{{{XLINK_NS}}}"
+XLINK_HREF = f"{XLINK}href"
+
+
+# cesty „kdekoli pod prvkem“
+ALL_A_BLIP = f".//{A_BLIP}"
+ALL_A_GRAPHICDATA = f".//{A_GRAPHICDATA}"
+ALL_CHART_CHART = f".//{CHART_CHART}"
+ALL_CHART_SERIES = f".//{CHART_SERIES}"
+ALL_M_OMATH = f".//{M_OMATH}"
+ALL_M_OMATHPARA = f".//{M_OMATHPARA}"
+ALL_NUMBER_NUMBER_STYLE = f".//{NUMBER_NUMBER_STYLE}"
+ALL_REL_RELATIONSHIP = f".//{REL_RELATIONSHIP}"
+ALL_STYLE_DEFAULT_STYLE = f".//{STYLE_DEFAULT_STYLE}"
+ALL_STYLE_MAP = f".//{STYLE_MAP}"
+ALL_STYLE_MASTER_PAGE = f".//{STYLE_MASTER_PAGE}"
+ALL_STYLE_STYLE = f".//{STYLE_STYLE}"
+ALL_TABLE_NAMED_RANGE = f".//{TABLE_NAMED_RANGE}"
+ALL_TABLE_TABLE = f".//{TABLE_TABLE}"
+ALL_TABLE_TABLE_CELL = f".//{TABLE_TABLE_CELL}"
+ALL_TEXT_H = f".//{TEXT_H}"
+ALL_TEXT_OUTLINE_STYLE = f".//{TEXT_OUTLINE_STYLE}"
+ALL_TEXT_P = f".//{TEXT_P}"
+ALL_TEXT_PAGE_NUMBER = f".//{TEXT_PAGE_NUMBER}"
+ALL_TEXT_SPAN = f".//{TEXT_SPAN}"
+ALL_TEXT_TABLE_OF_CONTENT = f".//{TEXT_TABLE_OF_CONTENT}"
+ALL_W_ABSTRACTNUM = f".//{W_ABSTRACTNUM}"
+ALL_W_BOOKMARKSTART = f".//{W_BOOKMARKSTART}"
+ALL_W_DRAWING = f".//{W_DRAWING}"
+ALL_W_FLDCHAR = f".//{W_FLDCHAR}"
+ALL_W_FLDSIMPLE = f".//{W_FLDSIMPLE}"
+ALL_W_INSTRTEXT = f".//{W_INSTRTEXT}"
+ALL_W_NUM = f".//{W_NUM}"
+ALL_W_P = f".//{W_P}"
+ALL_W_R = f".//{W_R}"
+ALL_W_STYLE = f".//{W_STYLE}"
+ALL_W_T = f".//{W_T}"
+ALL_W_TAB = f".//{W_TAB}"
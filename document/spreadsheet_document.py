@@ -1,9 +1,136 @@
+import math
 from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+from openpyxl.utils.exceptions import CellCoordinatesException
+
+from document.debug_dump import dump_parts, select_parts
+
+
+def parse_address(addr: str) -> tuple[int, int]:
+    """'B3' / '$B$3' -> (řádek, sloupec), číslováno od 1 – pro xlsx i ods."""
+    try:
+        letters, row = coordinate_from_string(addr.strip())
+    except CellCoordinatesException:
+        raise ValueError(f"Neplatná adresa buňky: {addr}") from None
+
+    return row, column_index_from_string(letters)
+
+
+def expand_range(ref: str) -> list[str]:
+    """'A1:C2' -> ['A1', 'B1', 'C1', 'A2', 'B2', 'C2'] (po řádcích)."""
+    first, _, last = ref.partition(":")
+    r1, c1 = parse_address(first)
+    r2, c2 = parse_address(last or first)
+
+    return [
+        f"{get_column_letter(c)}{r}"
+        for r in range(min(r1, r2), max(r1, r2) + 1)
+        for c in range(min(c1, c2), max(c1, c2) + 1)
+    ]
+
+
+def range_addresses(cells: str | Iterable[str]) -> list[str]:
+    if isinstance(cells, str):
+        return expand_range(cells)
+    return list(cells)
+
+
+@dataclass
+class CellRange:
+    """
+    Hodnoty, vzorce a styly oblasti buněk po sloupcích – i-tý prvek
+    každého pole patří buňce addresses[i]. info() a style() vrací totéž
+    co get_cell_info() / get_cell_style() daného adaptéru.
+    """
+    sheet: str
+    addresses: list[str] = field(default_factory=list)
+
+    exists: array = field(default_factory=lambda: array("b"))
+    formulas: list = field(default_factory=list)
+    values_cached: list = field(default_factory=list)
+    values: list = field(default_factory=list)  # jako get_cell_value()
+    numbers: array = field(default_factory=lambda: array("d"))  # NaN = není číslo
+    is_error: array = field(default_factory=lambda: array("b"))
+
+    styled: array = field(default_factory=lambda: array("b"))
+    number_formats: list = field(default_factory=list)
+    decimal_places: list = field(default_factory=list)
+    align_h: list = field(default_factory=list)
+    bold: array = field(default_factory=lambda: array("b"))
+    wrap: list = field(default_factory=list)
+
+    _index: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def append(self, addr: str, info: dict | None, value, style: dict | None):
+        self._index.setdefault(addr.replace("$", "").upper(), len(self.addresses))
+        self.addresses.append(addr)
+
+        info = info or {}
+        cached = info.get("value_cached")
+        self.exists.append(bool(info))
+        self.formulas.append(info.get("formula"))
+        self.values_cached.append(cached)
+        self.values.append(value)
+        self.numbers.append(_as_number(cached))
+        self.is_error.append(bool(info.get("is_error")))
+
+        self.styled.append(style is not None)
+        style = style or {}
+        self.number_formats.append(style.get("number_format"))
+        self.decimal_places.append(style.get("decimal_places"))
+        self.align_h.append(style.get("align_h"))
+        self.bold.append(bool(style.get("bold")))
+        self.wrap.append(style.get("wrap"))
+
+    def index(self, addr: str) -> int:
+        return self._index[addr.replace("$", "").upper()]
+
+    def info(self, addr: str) -> dict | None:
+        i = self.index(addr)
+        if not self.exists[i]:
+            return None
+
+        return {
+            "exists": True,
+            "formula": self.formulas[i],
+            "value_cached": self.values_cached[i],
+            "is_error": bool(self.is_error[i]),
+        }
+
+    def style(self, addr: str) -> dict | None:
+        i = self.index(addr)
+        if not self.styled[i]:
+            return None
+
+        return {
+            "number_format": self.number_formats[i],
+            "decimal_places": self.decimal_places[i],
+            "align_h": self.align_h[i],
+            "bold": bool(self.bold[i]),
+            "wrap": self.wrap[i],
+        }
+
+
+def _as_number(value) -> float:
+    if isinstance(value, bool) or value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
 
 class SpreadsheetDocument(ABC):
+    DEBUG_DIR = "debug_xml"
+
     @staticmethod
     def from_path(path: str | Path) -> "SpreadsheetDocument":
         path = Path(path)
@@ -19,9 +146,29 @@ class SpreadsheetDocument(ABC):
 
         raise ValueError(f"Nepodporovaný tabulkový formát: {path}")
 
-    @abstractmethod
-    def save_debug_xml(self, out_dir: str):
-        ...
+    def preload(self):
+        """Načte předem vše, co kontroly sdílí (před paralelním během kontrol)."""
+
+    def reopen(self):
+        """Vlastní otevření archivu – proces po fork nesmí sdílet deskriptor s rodičem."""
+        self._archive.reopen()
+
+    def close(self):
+        """Zavře soubor odevzdání; po hodnocení už se z archivu nečte."""
+        self._archive.close()
+
+    def save_debug_xml(
+        self,
+        out_dir: str | Path | None = None,
+        parts: list[str] | None = None,
+        workers: int = 1,
+    ) -> list[Path]:
+        """
+        Vypíše XML části pro ladění. `parts` jsou vzory názvů částí (fnmatch),
+        bez nich všechna .xml; s workers > 1 souběžně v procesech.
+        """
+        names = select_parts(self._archive.names(), parts)
+        return dump_parts(self._archive, names, out_dir or self.DEBUG_DIR, workers)
 
     @abstractmethod
     def has_sheet(self, name: str) -> bool:
@@ -35,6 +182,14 @@ class SpreadsheetDocument(ABC):
     def get_cell(self, ref: str) -> dict | None:
         ...
 
+    @abstractmethod
+    def get_range(self, sheet: str, cells: str | Iterable[str]) -> CellRange:
+        """
+        Hodnoty, vzorce a styly celé oblasti ('A1:D20') nebo seznamu adres
+        najednou – jeden průchod listem místo dotazu na každou buňku.
+        """
+        ...
+
     @abstractmethod
     def get_cell_style(self, sheet: str, addr: str) -> dict | None:
         ...
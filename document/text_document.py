@@ -1,3 +1,9 @@
+from pathlib import Path
+
+from document.debug_dump import dump_parts, select_parts
+from document.media import ImageInfo, probe_member
+
+
 class TextDocument:
     BUILTIN_STYLE_NAMES = {
         "normal",
@@ -12,6 +18,61 @@ class TextDocument:
         "content heading",
     }
 
+    # výchozí výpis pro ladění (save_xml)
+    DEBUG_DIR = "debug_xml"
+    DEBUG_PARTS: tuple[str, ...] = ()
+
+    @staticmethod
+    def from_path(path: str | Path) -> "TextDocument":
+        path = Path(path)
+        suffix = path.suffix.lower()
+
+        if suffix == ".docx":
+            from document.word_document import WordDocument
+            return WordDocument(str(path))
+
+        if suffix == ".odt":
+            from document.writer_document import WriterDocument
+            return WriterDocument(str(path))
+
+        raise ValueError(f"Nepodporovaný textový formát: {path}")
+
+    def preload(self):
+        """Načte předem vše, co kontroly sdílí (před paralelním během kontrol)."""
+
+    def reopen(self):
+        """Vlastní otevření archivu – proces po fork nesmí sdílet deskriptor s rodičem."""
+        self._archive.reopen()
+
+    def close(self):
+        """Zavře soubor odevzdání; po hodnocení už se z archivu nečte."""
+        self._archive.close()
+
+    def save_xml(
+        self,
+        out_dir: str | Path | None = None,
+        parts: list[str] | None = None,
+        workers: int = 1,
+    ) -> list[Path]:
+        """
+        Vypíše XML části pro ladění. `parts` jsou vzory názvů částí (fnmatch),
+        bez nich se vypíšou DEBUG_PARTS; s workers > 1 souběžně v procesech.
+        """
+        names = select_parts(self._archive.names(), parts or self.DEBUG_PARTS)
+        return dump_parts(self._archive, names, out_dir or self.DEBUG_DIR, workers)
+
+    def media_info(self, name: str) -> ImageInfo | None:
+        """
+        Rozměry (a DPI) obrázku v balíku podle názvu položky, čtené jen
+        z hlavičky a pamatované pro každou položku zvlášť.
+        """
+        if name not in self._media_infos:
+            try:
+                self._media_infos[name] = probe_member(self._archive, name)
+            except KeyError:
+                self._media_infos[name] = None
+        return self._media_infos[name]
+
     def _norm(self, name: str) -> str:
         return name.strip().lower()
 
@@ -1,25 +1,53 @@
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Iterable
-import zipfile
 import xml.etree.ElementTree as ET
 import re
 
 from assignment.word.word_assignment_model import StyleSpec
-from pathlib import Path
-import xml.dom.minidom as minidom
 
+from document import xml_backend
+from document.archive import Archive
+from document.qnames import (
+    ALL_A_BLIP, ALL_REL_RELATIONSHIP, ALL_W_ABSTRACTNUM, ALL_W_BOOKMARKSTART,
+    ALL_W_INSTRTEXT, ALL_W_NUM, ALL_W_P, ALL_W_R, ALL_W_STYLE, ALL_W_T, ALL_W_TAB, A_NS,
+    M_NS, REL_NS, R_EMBED, R_ID, R_NS, W_ABSTRACTNUMID, W_ANCHOR, W_ASCII, W_B, W_BASEDON, W_BEFORE, W_BODY, W_CAPS,
+    W_COLOR, W_CS, W_DEFAULT, W_EVENANDODDHEADERS, W_FIRSTLINE, W_FOOTERREFERENCE,
+    W_HANGING, W_HANSI, W_HEADERREFERENCE, W_HYPERLINK, W_I, W_ILVL, W_IND, W_JC,
+    W_LEFT, W_LINE, W_LINERULE, W_LINK, W_LVL, W_LVLTEXT, W_NAME, W_NS, W_NUMID,
+    W_NUMPR, W_OUTLINELVL, W_PAGEBREAKBEFORE, W_PGNUMTYPE, W_POS, W_PPR, W_PSTYLE,
+    W_RFONTS, W_RIGHT, W_RPR, W_SECTPR, W_SPACING, W_START, W_STYLEID, W_SZ, W_T, W_TAB,
+    W_TABS, W_TITLEPG, W_TYPE, W_U, W_VAL, W_WEBHIDDEN,
+)
+from document.media import ImageInfo
 from document.text_document import TextDocument
+from document.word_model import (
+    FieldEntry, FieldRegion, HeadingInfo, ParagraphInfo, PartInfo, SectionInfo,
+    SectionRefs, WordModel, WordScanner, parse_field_region,
+)
+from document.xml_stream import iter_children
 
 NS = {
-    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
-    "m": "http://schemas.openxmlformats.org/officeDocument/2006/math",
-    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
-    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "w": W_NS,
+    "m": M_NS,
+    "r": R_NS,
+    "a": A_NS,
+    "rel": REL_NS,
     }
 
 
+@dataclass
+class _StyleIndex:
+    by_id: dict = field(default_factory=dict)
+    by_name: dict = field(default_factory=dict)
+    default: ET.Element | None = None
+    chains: dict = field(default_factory=dict)
+    doc_default_size: int | None = None
+
 
 class WordDocument(TextDocument):
+    DEBUG_DIR = "debug_word_xml"
+    DEBUG_PARTS = ("word/document.xml", "word/styles.xml")
 
     COVER_STYLES = {
             "desky-fakulta": [
@@ -45,53 +73,378 @@ class WordDocument(TextDocument):
     def __init__(self, path: str):
         self.path = path
         self.NS = NS  
-        self._zip = zipfile.ZipFile(path)
-        self._xml = self._load("word/document.xml")
-        self._styles_xml = self._load("word/styles.xml")
-        self._sections = self._split_into_sections()
+        self._archive = Archive(path)
+        self._style_specs = {}
+        self._linked_chains = {}
+        self._parts = {}
+        self._part_infos = {}
+        self._media_infos = {}
+
+    # části balíku se načítají až při prvním použití
+    @cached_property
+    def _xml(self) -> ET.Element:
+        return self._load("word/document.xml")
+
+    @cached_property
+    def _styles_xml(self) -> ET.Element:
+        return self._load("word/styles.xml")
+
+    @cached_property
+    def _model(self) -> WordModel:
+        return self._scanner.scan(self._xml)
+
+    @cached_property
+    def _scanner(self) -> WordScanner:
+        return WordScanner(self._style_level_from_styles_xml)
+
+    def preload(self):
+        self._model
+        self._sections
+        self._outline
+        self._field_regions
+        self._section_props
+        self._section_infos
+        self._section_refs
+        self._style_index
+        self._rels
+
+    def _info(self, p: ET.Element) -> ParagraphInfo:
+        """Souhrn odstavce z modelu, pro prvky mimo document.xml se spočítá."""
+        info = self._model.by_element.get(p)
+        if info is None:
+            info = self._scanner.scan_element(p)
+        return info
+
+    def paragraph_info(self, p: ET.Element) -> ParagraphInfo:
+        return self._info(p)
+
+    def iter_paragraph_infos(self) -> list[ParagraphInfo]:
+        """Souhrny všech odstavců v pořadí dokumentu (jako iter_paragraphs)."""
+        return self._model.paragraphs
+
+    def _block(self, el: ET.Element):
+        block = self._model.blocks.get(el)
+        if block is None:
+            block = self._scanner.scan_block(el)
+        return block
+
+    @cached_property
+    def _sections(self) -> list[list[ET.Element]]:
+        return self._split_into_sections()
+
+    @cached_property
+    def _section_infos(self) -> list[SectionInfo]:
+        return [self._build_section_info(i, sec) for i, sec in enumerate(self._sections)]
+
+    def _build_section_info(self, index: int, sec: list[ET.Element]) -> SectionInfo:
+        info = SectionInfo(index, sec, self._find_section_properties(sec))
+        simple_fields = []
+
+        for el in sec:
+            block = self._block(el)
+            info.instr_texts.extend(block.instr_texts)
+            simple_fields.extend(block.simple_fields)
+            info.has_text = info.has_text or block.has_text
+            info.has_bibliography = info.has_bibliography or block.has_bibliography
+
+            heading = self._outline_index.get(el)
+            if heading is not None:
+                info.headings.append(heading)
+
+        info.field_instructions = simple_fields + info.instr_texts
+        info.has_toc = any(i.startswith("TOC") and "\\o" in i for i in info.instr_texts)
+
+        for instr in info.field_instructions:
+            instr_u = instr.upper()
+            if not instr_u.startswith("TOC") or ("\\C" not in instr_u and "\\T" not in instr_u):
+                continue
+
+            if "OBRÁZEK" in instr_u or "FIGURE" in instr_u:
+                info.has_list_of_figures = True
+            if "TABULKA" in instr_u or "TABLE" in instr_u:
+                info.has_list_of_tables = True
+
+        return info
+
+    def _section_info(self, index: int) -> SectionInfo | None:
+        infos = self._section_infos
+        if index < 0 or index >= len(infos):
+            return None
+        return infos[index]
+
+    @cached_property
+    def _outline(self) -> list[HeadingInfo]:
+        """Osnova: všechny odstavce s úrovní nadpisu v pořadí dokumentu."""
+        section_of = {el: i for i, sec in enumerate(self._sections) for el in sec}
+
+        outline = []
+        for info in self._model.paragraphs:
+            if info.level is None:
+                continue
+
+            num_id, num_level = self._paragraph_numbering(info.element)
+            outline.append(HeadingInfo(
+                element=info.element,
+                text=info.text,
+                level=info.level,
+                index=info.index,
+                body_index=info.body_index,
+                section=section_of.get(info.element),
+                num_id=num_id,
+                num_level=num_level,
+            ))
+
+        return outline
+
+    @cached_property
+    def _outline_index(self) -> dict:
+        return {h.element: h for h in self._outline}
+
+    def heading_outline(self) -> list[HeadingInfo]:
+        return self._outline
+
+    @cached_property
+    def _field_regions(self) -> list[FieldRegion]:
+        """
+        Pole přes více odstavců (obsah, seznamy obrázků a tabulek…) v pořadí
+        začátků. Odstavce toku se projdou jednou a podle začátků a konců polí
+        z modelu se přiřadí nejvnitřnějšímu otevřenému TOC jako položky.
+        """
+        regions = []
+        open_regions = []
+
+        for section, sec in enumerate(self._sections):
+            for el in sec:
+                block = self._model.blocks.get(el)
+                if block is None:
+                    continue
+
+                for i in block.paragraphs:
+                    info = self._model.paragraphs[i]
+                    if info.nested:
+                        continue
+
+                    # odstavec patří i k polím, která v něm končí
+                    current = list(open_regions)
+                    if info.field_ends:
+                        del open_regions[-info.field_ends:]
+
+                    for instr in info.field_starts:
+                        region = parse_field_region(instr)
+                        region.element = info.element
+                        region.section = section
+                        regions.append(region)
+                        open_regions.append(region)
+                        current.append(region)
+
+                    owner = next((r for r in reversed(current) if r.kind == "TOC"), None)
+                    if owner is None:
+                        continue
+
+                    entry = self._field_entry(info)
+                    if entry is not None:
+                        owner.entries.append(entry)
+
+        return regions
+
+    def _field_entry(self, info: ParagraphInfo) -> FieldEntry | None:
+        hl = info.element.find(W_HYPERLINK)
+        if hl is None and not info.text:
+            return None
+
+        m = re.fullmatch(r"(?:toc|obsah)(\d+)", (info.style_id or "").lower())
+
+        return FieldEntry(
+            element=info.element,
+            text=self._visible_text(hl if hl is not None else info.element),
+            level=int(m.group(1)) if m else None,
+            has_link=hl is not None,
+            anchor=hl.attrib.get(W_ANCHOR) if hl is not None else None,
+            has_page_ref="PAGEREF" in info.field_types,
+        )
+
+    def iter_field_regions(self) -> list[FieldRegion]:
+        return self._field_regions
+
+    def table_of_contents(self) -> FieldRegion | None:
+        """První obsah nadpisů v dokumentu."""
+        return next((r for r in self._field_regions if r.is_toc), None)
+
+    @cached_property
+    def _section_refs(self) -> list[SectionRefs]:
+        """Odkazy na záhlaví a zápatí každého oddílu (stačí jim proudově čtené sectPr)."""
+        return [self._build_section_refs(sect_pr) for sect_pr in self._section_props]
+
+    def _build_section_refs(self, sect_pr: ET.Element | None) -> SectionRefs:
+        refs = SectionRefs(sect_pr)
+        if sect_pr is None:
+            return refs
+
+        for ref in sect_pr.findall(W_HEADERREFERENCE):
+            r_id = ref.attrib.get(R_ID)
+            if r_id:
+                refs.header_ids.append(r_id)
+                refs.headers[ref.attrib.get(W_TYPE, "default")] = r_id
+
+        for ref in sect_pr.findall(W_FOOTERREFERENCE):
+            r_id = ref.attrib.get(R_ID)
+            if r_id:
+                refs.footer_ids.append(r_id)
+                refs.footers[ref.attrib.get(W_TYPE, "default")] = r_id
 
-    def save_xml(self, out_dir: str | Path = "debug_word_xml"):
-        out_dir = Path(out_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
+        refs.title_page = sect_pr.find(W_TITLEPG) is not None
 
-        self._save_pretty_xml(self._xml, out_dir / "document.xml")
-        self._save_pretty_xml(self._styles_xml, out_dir / "styles.xml")
+        pg_num = sect_pr.find(W_PGNUMTYPE)
+        if pg_num is not None:
+            refs.page_number_start = pg_num.attrib.get(W_START)
 
-    def _save_pretty_xml(self, root: ET.Element, path: Path):
-        rough_string = ET.tostring(root, encoding="utf-8")
-        reparsed = minidom.parseString(rough_string)
-        pretty = reparsed.toprettyxml(indent="  ", encoding="utf-8")
+        return refs
 
-        with open(path, "wb") as f:
-            f.write(pretty)
+    def _refs(self, index: int) -> SectionRefs | None:
+        refs = self._section_refs
+        if index < 0 or index >= len(refs):
+            return None
+        return refs[index]
+
+    def _part_info(self, r_id: str) -> PartInfo | None:
+        """Souhrn záhlaví / zápatí podle r:id; chybějící část je None."""
+        name = self.resolve_part_target(r_id)
+        if not name:
+            return None
+
+        if name not in self._part_infos:
+            try:
+                root = self._part(name)
+            except KeyError:
+                self._part_infos[name] = None
+            else:
+                self._part_infos[name] = self._scanner.scan_part(root)
+
+        return self._part_infos[name]
+
+    def _part_infos_of(self, r_ids: list[str]) -> list[PartInfo]:
+        parts = (self._part_info(r_id) for r_id in r_ids)
+        return [part for part in parts if part is not None]
+
+    @cached_property
+    def _section_props(self) -> list[ET.Element | None]:
+        """
+        sectPr každého oddílu (None u posledního oddílu bez sectPr).
+        Dokud není document.xml načtený celý, projde se jen proudově –
+        kontroly záhlaví a zápatí tak nepotřebují strom celého těla.
+        """
+        if "_xml" in self.__dict__:
+            return [self._find_section_properties(sec) for sec in self._sections]
+
+        props = []
+        trailing = False
+
+        with self._archive.open("word/document.xml") as f:
+            for el in iter_children(f, W_BODY):
+                sect = self._boundary_sect_pr(el)
+                if sect is None:
+                    trailing = True
+                    continue
+
+                props.append(sect)
+                trailing = False
+
+        if trailing:
+            props.append(None)
+
+        return props
+
+    @cached_property
+    def _style_index(self) -> _StyleIndex:
+        styles = self._styles_xml.findall(ALL_W_STYLE)
+        index = _StyleIndex()
+
+        for style in styles:
+            style_id = style.attrib.get(W_STYLEID)
+            if style_id:
+                index.by_id.setdefault(style_id, style)
+                index.by_name.setdefault(style_id.strip().lower(), style)
+
+            name_el = style.find(W_NAME)
+            if name_el is not None:
+                name = name_el.attrib.get(W_VAL)
+                if name:
+                    index.by_name.setdefault(name.strip().lower(), style)
+
+            if index.default is None and style.attrib.get(W_DEFAULT) == "1":
+                index.default = style
+
+        # basedOn řetězec každého stylu (styl sám je první)
+        for style in styles:
+            chain = []
+            current = style
+            while current is not None and current not in chain:
+                chain.append(current)
+                based = current.find(W_BASEDON)
+                if based is None:
+                    break
+                current = index.by_id.get(based.attrib.get(W_VAL))
+            index.chains[style] = chain
+
+        dd = self._styles_xml.find(".//w:docDefaults/w:rPrDefault/w:rPr", self.NS)
+        if dd is not None:
+            sz = dd.find(W_SZ)
+            if sz is not None:
+                index.doc_default_size = int(sz.attrib[W_VAL]) // 2
+
+        return index
+
+    def _style_chain(self, style) -> list:
+        if style is None:
+            return []
+        return self._style_index.chains.get(style, [style])
 
     def _load(self, name):
-        with self._zip.open(name) as f:
-            return ET.fromstring(f.read())
+        with self._archive.open(name) as f:
+            return xml_backend.parse(f)
+
+    def _part(self, name: str) -> ET.Element:
+        """
+        Načte část balíku (záhlaví, zápatí, numbering…) jen jednou.
+        Chybějící část vyhodí KeyError stejně jako _load.
+        """
+        part = self._parts.get(name)
+        if part is None:
+            part = self._parts[name] = self._load(name)
+        return part
+
+    @cached_property
+    def _rels(self) -> dict[str, tuple[str, str | None]]:
+        """rId -> (typ vztahu, cíl) z word/_rels/document.xml.rels"""
+        try:
+            rels = self._load("word/_rels/document.xml.rels")
+        except KeyError:
+            return {}
+
+        rel_map = {}
+        for rel in rels.findall(ALL_REL_RELATIONSHIP):
+            r_id = rel.attrib.get("Id")
+            if r_id:
+                rel_map.setdefault(r_id, (rel.attrib.get("Type", ""), rel.attrib.get("Target")))
+
+        return rel_map
         
     def iter_paragraphs(self) -> Iterable[ET.Element]:
-        return self._xml.findall(".//w:p", self.NS)
+        return [info.element for info in self._model.paragraphs]
     
     # oddíly
     def _split_into_sections(self):
         sections = []
         current = []
 
-        body = self._xml.find("w:body", self.NS)
+        body = self._xml.find(W_BODY)
 
         for el in body:
             current.append(el)
 
-            if el.tag.endswith("}sectPr"):
+            if self._boundary_sect_pr(el) is not None:
                 sections.append(current)
                 current = []
-                continue
-
-            if el.tag.endswith("}p"):
-                ppr = el.find("w:pPr", self.NS)
-                if ppr is not None and ppr.find("w:sectPr", self.NS) is not None:
-                    sections.append(current)
-                    current = []
 
         if current:
             sections.append(current)
@@ -99,89 +452,50 @@ class WordDocument(TextDocument):
         return sections
 
     def section_count(self) -> int:
-        return len(self._sections)
+        return len(self._section_props)
 
     def section(self, index: int):
         if index < 0 or index >= len(self._sections):
             return []
         return self._sections[index]
 
-    def _find_instr_texts(self, section):
-        texts = []
-        for el in section:
-            for instr in el.findall(".//w:instrText", self.NS):
-                if instr.text:
-                    texts.append(instr.text.strip())
-        return texts
-    
     def has_toc_in_section(self, section_index: int) -> bool:
-        for instr in self._find_instr_texts(self.section(section_index)):
-            if instr.startswith("TOC") and "\\o" in instr:
-                return True
-        return False
+        info = self._section_info(section_index)
+        return info is not None and info.has_toc
 
     def has_text_in_section(self, section_index: int) -> bool:
-        for el in self.section(section_index):
-            for t in el.findall(".//w:t", self.NS):
-                if t.text and t.text.strip():
-                    return True
-        return False
+        info = self._section_info(section_index)
+        return info is not None and info.has_text
 
     # bibliography
     def has_bibliography_in_section(self, section_index: int) -> bool:
-        for el in self.section(section_index):
-            for sdt in el.findall(".//w:sdt", self.NS):
-                sdt_pr = sdt.find("w:sdtPr", self.NS)
-                if sdt_pr is not None and sdt_pr.find("w:bibliography", self.NS) is not None:
-                    return True
-        return False
+        info = self._section_info(section_index)
+        return info is not None and info.has_bibliography
     
     def get_field_instructions(self, section):
+        # oddíl z section(i) má souhrn předpočítaný
+        for info in self._section_infos:
+            if info.elements is section:
+                return list(info.field_instructions)
+
         instrs = []
 
         for el in section:
-            for fld in el.findall(".//w:fldSimple", self.NS):
-                instr = fld.attrib.get(f"{{{self.NS['w']}}}instr")
-                if instr:
-                    instrs.append(instr.strip())
+            instrs.extend(self._block(el).simple_fields)
 
         for el in section:
-            for instr in el.findall(".//w:instrText", self.NS):
-                if instr.text:
-                    instrs.append(instr.text.strip())
+            instrs.extend(self._block(el).instr_texts)
 
         return instrs
 
     def has_list_of_figures_in_section(self, section_index: int) -> bool:
-        section = self.section(section_index)
-
-        for instr in self.get_field_instructions(section):
-            instr_u = instr.upper()
-
-            if not instr_u.startswith("TOC"):
-                continue
-
-            if "\\C" in instr_u or "\\T" in instr_u:
-                if "OBRÁZEK" in instr_u or "FIGURE" in instr_u:
-                    return True
-
-        return False
+        info = self._section_info(section_index)
+        return info is not None and info.has_list_of_figures
 
 
     def has_list_of_tables_in_section(self, section_index: int) -> bool:
-        section = self.section(section_index)
-
-        for instr in self.get_field_instructions(section):
-            instr_u = instr.upper()
-
-            if not instr_u.startswith("TOC"):
-                continue
-
-            if "\\C" in instr_u or "\\T" in instr_u:
-                if "TABULKA" in instr_u or "TABLE" in instr_u:
-                    return True
-
-        return False
+        info = self._section_info(section_index)
+        return info is not None and info.has_list_of_tables
     
     def _normalize_font(self, font: str | None) -> str | None:
         if not font:
@@ -189,308 +503,199 @@ class WordDocument(TextDocument):
         font = re.sub(r"\s*\(.*$", "", font)
         return font.strip()
     
-    def _resolve_font(self, style):
-        while style is not None:
-            rpr = style.find("w:rPr", self.NS)
-            if rpr is not None:
-                fonts = rpr.find("w:rFonts", self.NS)
-                if fonts is not None:
-                    font = (
-                        fonts.attrib.get(f"{{{self.NS['w']}}}ascii")
-                        or fonts.attrib.get(f"{{{self.NS['w']}}}hAnsi")
-                        or fonts.attrib.get(f"{{{self.NS['w']}}}cs")
-                    )
-                    if font:
-                        return self._normalize_font(font)
-
-            based = style.find("w:basedOn", self.NS)
-            style = (
-                self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val"))
-                if based is not None
-                else None
-            )
-
-        return None
-    
-    def _resolve_alignment(self, style):
-        while style is not None:
-            ppr = style.find("w:pPr", self.NS)
-            if ppr is not None:
-                jc = ppr.find("w:jc", self.NS)
-                if jc is not None:
-                    return jc.attrib.get(f"{{{self.NS['w']}}}val")
-
-            based = style.find("w:basedOn", self.NS)
-            style = (
-                self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val"))
-                if based is not None
-                else None
-            )
-
-        return None
-
-    def _resolve_space_before(self, style) -> int | None:
-        while style is not None:
-            ppr = style.find("w:pPr", self.NS)
-            if ppr is not None:
-                spacing = ppr.find("w:spacing", self.NS)
-                if spacing is not None:
-                    val = spacing.attrib.get(f"{{{self.NS['w']}}}before")
-                    if val is not None:
-                        return int(val)
-
-            based = style.find("w:basedOn", self.NS)
-            style = (
-                self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val"))
-                if based is not None
-                else None
-            )
-
-        return None
-
-    def _resolve_color(self, style) -> str | None:
-        while style is not None:
-            rpr = style.find("w:rPr", self.NS)
-            if rpr is not None:
-                col = rpr.find("w:color", self.NS)
-                if col is not None:
-                    val = col.attrib.get(f"{{{self.NS['w']}}}val")
-                    if val:
-                        return val.upper()
-
-            based = style.find("w:basedOn", self.NS)
-            if based is None:
-                break
-
-            style = self._find_style_by_id(
-                based.attrib.get(f"{{{self.NS['w']}}}val")
-            )
-
-        return None
-    
     def _find_style_by_id(self, style_id: str):
         if not style_id:
             return None
 
-        for style in self._styles_xml.findall(".//w:style", self.NS):
-            if style.attrib.get(f"{{{self.NS['w']}}}styleId") == style_id:
-                return style
+        return self._style_index.by_id.get(style_id)
 
-        return None
-    
-    def _resolve_size(self, style) -> int | None:
-        while style is not None:
-            rpr = style.find("w:rPr", self.NS)
-            if rpr is not None:
-                sz = rpr.find("w:sz", self.NS)
-                if sz is not None:
-                    return int(sz.attrib[f"{{{self.NS['w']}}}val"]) // 2
-                
-            based = style.find("w:basedOn", self.NS)
-            if based is None:
-                break
-
-            style = self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val"))
+    def get_doc_default_font_size(self) -> int | None:
+        return self._style_index.doc_default_size
 
-        return self.get_doc_default_font_size()
-    
-    def _resolve_underline(self, style) -> bool | None:
-        visited = set()
+    def _get_linked_style(self, style):
+        link = style.find(W_LINK)
+        if link is None:
+            return None
+        return self._find_style_by_id(
+            link.attrib.get(W_VAL)
+        )
 
-        while style is not None and id(style) not in visited:
-            visited.add(id(style))
+    def _linked_style_chain(self, style) -> list:
+        # pořadí jako u přímého formátování znaků: nejdřív propojený styl, pak basedOn
+        chain = self._linked_chains.get(style)
+        if chain is not None:
+            return chain
 
-            rpr = style.find("w:rPr", self.NS)
-            if rpr is not None:
-                u = rpr.find("w:u", self.NS)
-                if u is not None:
-                    val = u.attrib.get(f"{{{self.NS['w']}}}val", "single")
-                    return val != "none"
-
-            linked = self._get_linked_style(style)
-            if linked is not None and id(linked) not in visited:
-                style = linked
-                continue
+        chain = []
+        current = style
+        while current is not None and current not in chain:
+            chain.append(current)
 
-            based = style.find("w:basedOn", self.NS)
-            if based is not None:
-                style = self._find_style_by_id(
-                    based.attrib.get(f"{{{self.NS['w']}}}val")
-                )
+            linked = self._get_linked_style(current)
+            if linked is not None and linked not in chain:
+                current = linked
                 continue
 
-            break
+            based = current.find(W_BASEDON)
+            if based is None:
+                break
+            current = self._find_style_by_id(based.attrib.get(W_VAL))
 
-        return None
-    
-    def _resolve_page_break_before(self, style) -> bool:
-        visited = set()
-        while style is not None and id(style) not in visited:
-            visited.add(id(style))
+        self._linked_chains[style] = chain
+        return chain
 
-            ppr = style.find("w:pPr", self.NS)
-            if ppr is not None:
-                if ppr.find("w:pageBreakBefore", self.NS) is not None:
-                    return True
+    def _resolve_style_properties(self, style) -> dict:
+        """
+        Projde řetězec stylů jednou a vrátí první nalezenou hodnotu
+        každé vlastnosti.
+        """
+        props = {}
 
-            linked = self._get_linked_style(style)
-            if linked is not None and id(linked) not in visited:
-                style = linked
+        for st in self._style_chain(style):
+            rpr = st.find(W_RPR)
+            if rpr is not None:
+                if "font" not in props:
+                    fonts = rpr.find(W_RFONTS)
+                    if fonts is not None:
+                        font = (
+                            fonts.attrib.get(W_ASCII)
+                            or fonts.attrib.get(W_HANSI)
+                            or fonts.attrib.get(W_CS)
+                        )
+                        if font:
+                            props["font"] = self._normalize_font(font)
+
+                if "color" not in props:
+                    col = rpr.find(W_COLOR)
+                    if col is not None:
+                        val = col.attrib.get(W_VAL)
+                        if val:
+                            props["color"] = val.upper()
+
+                if "size" not in props:
+                    sz = rpr.find(W_SZ)
+                    if sz is not None:
+                        props["size"] = int(sz.attrib[W_VAL]) // 2
+
+            ppr = st.find(W_PPR)
+            if ppr is None:
                 continue
 
-            based = style.find("w:basedOn", self.NS)
-            style = self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val")) if based is not None else None
-
-        return False
-    
-    def _resolve_tabs(self, style) -> list[tuple[str, int]] | None:
-        tabs = []
+            if "alignment" not in props:
+                jc = ppr.find(W_JC)
+                if jc is not None:
+                    props["alignment"] = jc.attrib.get(W_VAL)
+
+            spacing = ppr.find(W_SPACING)
+            if spacing is not None:
+                if "spaceBefore" not in props:
+                    before = spacing.attrib.get(W_BEFORE)
+                    if before is not None:
+                        props["spaceBefore"] = int(before)
+
+                if "lineHeight" not in props:
+                    line = spacing.attrib.get(W_LINE)
+                    rule = spacing.attrib.get(W_LINERULE, "auto")
+                    if line and rule == "auto":
+                        props["lineHeight"] = int(line) / 240
 
-        while style is not None:
-            ppr = style.find("w:pPr", self.NS)
-            if ppr is not None:
-                tabs_el = ppr.find("w:tabs", self.NS)
+            if "tabs" not in props:
+                tabs_el = ppr.find(W_TABS)
                 if tabs_el is not None:
-                    for tab in tabs_el.findall("w:tab", self.NS):
-                        val = tab.attrib.get(f"{{{self.NS['w']}}}val")
-                        pos = tab.attrib.get(f"{{{self.NS['w']}}}pos")
+                    tabs = []
+                    for tab in tabs_el.findall(W_TAB):
+                        val = tab.attrib.get(W_VAL)
+                        pos = tab.attrib.get(W_POS)
                         if val and pos:
                             tabs.append((val, int(pos)))
-
                     if tabs:
-                        return tabs
-
-            based = style.find("w:basedOn", self.NS)
-            style = (
-                self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val"))
-                if based is not None
-                else None
-            )
+                        props["tabs"] = tabs
 
-        return None
-    
-    def _resolve_line_height(self, style) -> float | None:
-        while style is not None:
-            ppr = style.find("w:pPr", self.NS)
-            if ppr is not None:
-                spacing = ppr.find("w:spacing", self.NS)
-                if spacing is not None:
-                    line = spacing.attrib.get(f"{{{self.NS['w']}}}line")
-                    rule = spacing.attrib.get(f"{{{self.NS['w']}}}lineRule", "auto")
-
-                    if line and rule == "auto":
-                        return int(line) / 240
-
-            based = style.find("w:basedOn", self.NS)
-            style = (
-                self._find_style_by_id(based.attrib.get(f"{{{self.NS['w']}}}val"))
-                if based is not None
-                else None
-            )
-
-        return None
-    
-    def get_doc_default_font_size(self) -> int | None:
-        dd = self._styles_xml.find(".//w:docDefaults/w:rPrDefault/w:rPr", self.NS)
-        if dd is None:
-            return None
-        sz = dd.find("w:sz", self.NS)
-        if sz is None:
-            return None
-        return int(sz.attrib[f"{{{self.NS['w']}}}val"]) // 2
-    
-    def _resolve_bool(self, style, tag: str) -> bool | None:
-        visited = set()
-
-        while style is not None and id(style) not in visited:
-            visited.add(id(style))
-
-            rpr = style.find("w:rPr", self.NS)
+        for st in self._linked_style_chain(style):
+            rpr = st.find(W_RPR)
             if rpr is not None:
-                el = rpr.find(f"w:{tag}", self.NS)
-                if el is not None:
-                    if el.attrib.get(f"{{{self.NS['w']}}}val") == "0":
-                        return False
-                    return True
-
-            linked = self._get_linked_style(style)
-            if linked is not None and id(linked) not in visited:
-                style = linked
-                continue
+                for tag, key in ((W_B, "bold"), (W_I, "italic"), (W_CAPS, "allCaps")):
+                    if key not in props:
+                        el = rpr.find(tag)
+                        if el is not None:
+                            props[key] = el.attrib.get(W_VAL) != "0"
 
-            based = style.find("w:basedOn", self.NS)
-            if based is not None:
-                style = self._find_style_by_id(
-                    based.attrib.get(f"{{{self.NS['w']}}}val")
-                )
-                continue
-
-            break
+                if "underline" not in props:
+                    u = rpr.find(W_U)
+                    if u is not None:
+                        props["underline"] = u.attrib.get(W_VAL, "single") != "none"
 
-        return None
+            if "pageBreakBefore" not in props:
+                ppr = st.find(W_PPR)
+                if ppr is not None and ppr.find(W_PAGEBREAKBEFORE) is not None:
+                    props["pageBreakBefore"] = True
 
-    def _get_linked_style(self, style):
-        link = style.find("w:link", self.NS)
-        if link is None:
-            return None
-        return self._find_style_by_id(
-            link.attrib.get(f"{{{self.NS['w']}}}val")
-        )
+        return props
 
     def _build_style_spec(self, style, *, default_alignment=None) -> StyleSpec:
-        font = self._resolve_font(style)
-        color = self._resolve_color(style)
-        size = self._resolve_size(style)
-        underline = self._resolve_underline(style)
-        bold = self._resolve_bool(style, "b")
-        italic = self._resolve_bool(style, "i")
+        key = (style, default_alignment)
+        spec = self._style_specs.get(key)
+        if spec is None:
+            spec = self._create_style_spec(style, default_alignment=default_alignment)
+            self._style_specs[key] = spec
+        return spec
+
+    def _create_style_spec(self, style, *, default_alignment=None) -> StyleSpec:
+        props = self._resolve_style_properties(style)
+
+        font = props.get("font")
+        color = props.get("color")
+        size = props.get("size", self.get_doc_default_font_size())
+        underline = props.get("underline")
+        bold = props.get("bold")
+        italic = props.get("italic")
         
-        all_caps = self._resolve_bool(style, "caps")
-        alignment = self._resolve_alignment(style) or default_alignment
-        line_height = self._resolve_line_height(style)
-        page_break = self._resolve_page_break_before(style)
+        all_caps = props.get("allCaps")
+        alignment = props.get("alignment") or default_alignment
+        line_height = props.get("lineHeight")
+        page_break = props.get("pageBreakBefore", False)
         num_level = None
         is_numbered = None
-        before = self._resolve_space_before(style)
+        before = props.get("spaceBefore")
         based_on = None
 
         indent_left = None
         indent_right = None
         indent_first = None
         indent_hanging = None
-        tabs = self._resolve_tabs(style)
+        tabs = props.get("tabs")
 
 
-        ppr = style.find("w:pPr", self.NS)
+        ppr = style.find(W_PPR)
         if ppr is not None:
-            jc = ppr.find("w:jc", self.NS)
+            jc = ppr.find(W_JC)
             if jc is not None:
-                alignment = jc.attrib.get(f"{{{self.NS['w']}}}val") or alignment
+                alignment = jc.attrib.get(W_VAL) or alignment
 
             if ppr is not None:
-                numpr = ppr.find("w:numPr", self.NS)
+                numpr = ppr.find(W_NUMPR)
                 if numpr is not None:
-                    num_id = numpr.find("w:numId", self.NS)
+                    num_id = numpr.find(W_NUMID)
                     if num_id is not None:
-                        val = int(num_id.attrib.get(f"{{{self.NS['w']}}}val", 0))
+                        val = int(num_id.attrib.get(W_VAL, 0))
                         if val > 0:
                             is_numbered = True
-                            ilvl = numpr.find("w:ilvl", self.NS)
-                            num_level = int(ilvl.attrib.get(f"{{{self.NS['w']}}}val")) if ilvl is not None else 0
+                            ilvl = numpr.find(W_ILVL)
+                            num_level = int(ilvl.attrib.get(W_VAL)) if ilvl is not None else 0
             
-            ind = ppr.find("w:ind", self.NS)
+            ind = ppr.find(W_IND)
             if ind is not None:
-                indent_left = ind.attrib.get(f"{{{self.NS['w']}}}left")
-                indent_right = ind.attrib.get(f"{{{self.NS['w']}}}right")
-                indent_first = ind.attrib.get(f"{{{self.NS['w']}}}firstLine")
-                indent_hanging = ind.attrib.get(f"{{{self.NS['w']}}}hanging")
+                indent_left = ind.attrib.get(W_LEFT)
+                indent_right = ind.attrib.get(W_RIGHT)
+                indent_first = ind.attrib.get(W_FIRSTLINE)
+                indent_hanging = ind.attrib.get(W_HANGING)
 
-        based_el = style.find("w:basedOn", self.NS)
+        based_el = style.find(W_BASEDON)
         if based_el is not None:
-            based_on = based_el.attrib.get(f"{{{self.NS['w']}}}val")
+            based_on = based_el.attrib.get(W_VAL)
 
-        name_el = style.find("w:name", self.NS)
-        name = name_el.attrib.get(f"{{{self.NS['w']}}}val") if name_el is not None else None
+        name_el = style.find(W_NAME)
+        name = name_el.attrib.get(W_VAL) if name_el is not None else None
 
         return StyleSpec(
             name=name,
@@ -516,27 +721,13 @@ class WordDocument(TextDocument):
         )
     
     def _find_style(self, *, name: str | None = None, default: bool = False):
-        for style in self._styles_xml.findall(".//w:style", self.NS):
-            if default:
-                if style.attrib.get(f"{{{self.NS['w']}}}default") == "1":
-                    return style
-                continue
+        if default:
+            return self._style_index.default
 
-            if not name:
-                continue
-
-            style_id = style.attrib.get(f"{{{self.NS['w']}}}styleId")
-            if style_id and style_id.strip().lower() == name.strip().lower():
-                return style
-
-            name_el = style.find("w:name", self.NS)
-            if name_el is None:
-                continue
-            actual_name = name_el.attrib.get(f"{{{self.NS['w']}}}val")
-            if actual_name and actual_name.strip().lower() == name.strip().lower():
-                return style
+        if not name:
+            return None
 
-        return None
+        return self._style_index.by_name.get(name.strip().lower())
     
     def get_normal_style(self) -> StyleSpec | None:
         style = self._find_style(default=True)
@@ -565,8 +756,15 @@ class WordDocument(TextDocument):
         return None
     
     def _paragraph_text(self, p: ET.Element) -> str:
+        info = self._model.by_element.get(p)
+        if info is not None:
+            return info.text
+
+        return self._compute_paragraph_text(p)
+
+    def _compute_paragraph_text(self, p: ET.Element) -> str:
         parts = []
-        for t in p.findall(".//w:t", self.NS):
+        for t in p.findall(ALL_W_T):
             if t.text:
                 parts.append(t.text)
 
@@ -576,66 +774,51 @@ class WordDocument(TextDocument):
         return txt
 
     def _paragraph_style_id(self, p: ET.Element) -> str | None:
-        ppr = p.find("w:pPr", self.NS)
+        ppr = p.find(W_PPR)
         if ppr is None:
             return None
-        ps = ppr.find("w:pStyle", self.NS)
+        ps = ppr.find(W_PSTYLE)
         if ps is None:
             return None
-        return ps.attrib.get(f"{{{self.NS['w']}}}val")
+        return ps.attrib.get(W_VAL)
 
     def _style_level_from_styles_xml(self, style_id: str) -> int | None:
         style = self._find_style_by_id(style_id)
         if style is None:
             return None
 
-        visited = set()
-
-        while style is not None and id(style) not in visited:
-            visited.add(id(style))
-
-            name_el = style.find("w:name", self.NS)
+        for style in self._style_chain(style):
+            name_el = style.find(W_NAME)
             if name_el is not None:
-                name = (name_el.attrib.get(f"{{{self.NS['w']}}}val") or "").lower()
+                name = (name_el.attrib.get(W_VAL) or "").lower()
                 m = re.search(r"(heading|nadpis)\s*([0-9]+)", name)
                 if m:
                     return int(m.group(2))
 
-            ppr = style.find("w:pPr", self.NS)
+            ppr = style.find(W_PPR)
             if ppr is not None:
-                out = ppr.find("w:outlineLvl", self.NS)
+                out = ppr.find(W_OUTLINELVL)
                 if out is not None:
-                    return int(out.attrib.get(f"{{{self.NS['w']}}}val")) + 1
-
-            based = style.find("w:basedOn", self.NS)
-            if based is None:
-                break
-
-            style = self._find_style_by_id(
-                based.attrib.get(f"{{{self.NS['w']}}}val")
-            )
+                    return int(out.attrib.get(W_VAL)) + 1
 
         return None
 
     def iter_headings(self) -> list[tuple[str, int]]:
-        items: list[tuple[str, int]] = []
+        return [(h.text, h.level) for h in self._outline if h.body_index is not None]
 
-        for p in self._xml.findall(".//w:body/w:p", self.NS):
-            txt = self._paragraph_text(p)
-            if not txt:
+    def heading_bookmarks(self, max_level: int = 3) -> set[str]:
+        """Záložky v nadpisech těla do dané úrovně (cíle odkazů z obsahu)."""
+        names = set()
+        for h in self._outline:
+            if h.body_index is None or h.level > max_level:
                 continue
 
-            sid = self._paragraph_style_id(p)
-            if not sid:
-                continue
-
-            lvl = self._style_level_from_styles_xml(sid)
-            if lvl is None:
-                continue
+            for bm in h.element.findall(ALL_W_BOOKMARKSTART):
+                name = bm.attrib.get(W_NAME)
+                if name:
+                    names.add(name)
 
-            items.append((txt, lvl))
-
-        return items
+        return names
         
     def has_manual_formatting(self) -> bool:
         return bool(self.find_manual_formatting())
@@ -649,68 +832,47 @@ class WordDocument(TextDocument):
     def find_html_artifacts(self) -> list[tuple[int, str]]:
         results = []
 
-        paragraphs = list(self._xml.findall(".//w:body/w:p", self.NS))
-
-        for i, p in enumerate(paragraphs, start=1):
+        for info in self._model.body_paragraphs:
 
-            if self._paragraph_is_toc_or_object_list(p):
+            if self._info_is_toc_or_object_list(info):
                 continue
 
-            text = self._paragraph_text(p)
+            text = info.text
             if not text:
                 continue
 
             if any(x in text for x in ["&nbsp;", "&#160;", "<", ">"]):
-                results.append((i, text))
+                results.append((info.body_index, text))
 
         return results
 
     def find_manual_formatting(self) -> list[tuple[int, str]]:
         results = []
 
-        paragraphs = list(self._xml.findall(".//w:body/w:p", self.NS))
-
-        for i, p in enumerate(paragraphs, start=1):
-            if self._paragraph_is_toc_or_object_list(p):
+        for info in self._model.body_paragraphs:
+            if self._info_is_toc_or_object_list(info):
                 continue
-            if self.paragraph_is_caption(p):
+            if self._info_seq_caption(info) is not None:
                 continue
 
-            if (
-                p.findall(".//w:drawing", self.NS) or
-                p.findall(".//m:oMath", self.NS) or
-                p.findall(".//m:oMathPara", self.NS)
-            ):
+            if info.has_drawing or info.has_math or info.has_math_para:
                 continue
 
-            text = self._paragraph_text(p)
+            text = info.text
             if not text:
                 continue
 
-            has_ref_field = False
-
-            for instr in p.findall(".//w:instrText", self.NS):
-                text = (instr.text or "").strip().upper()
-                if text.startswith("REF "):
-                    has_ref_field = True
-                    break
-
-            if has_ref_field:
+            if any(instr.strip().upper().startswith("REF ") for instr in info.instr_texts):
                 continue
 
-            if p.findall(".//w:hyperlink", self.NS):
+            if info.has_hyperlink:
                 continue
 
-            for r in p.findall(".//w:r", self.NS):
-                rpr = r.find("w:rPr", self.NS)
-                if rpr is None:
-                    continue
-
-                rs = rpr.find("w:rStyle", self.NS)
-                if rs is not None:
+            for run in info.runs:
+                if not run.has_rpr or run.has_style:
                     continue
 
-                results.append((i, text))
+                results.append((info.body_index, text))
                 break
 
         return results
@@ -718,160 +880,136 @@ class WordDocument(TextDocument):
     def find_inline_font_changes(self) -> list[tuple[int, str]]:
         results = []
 
-        paragraphs = list(self._xml.findall(".//w:body/w:p", self.NS))
-
-        for i, p in enumerate(paragraphs, start=1):
-            if self._paragraph_is_toc_or_object_list(p):
+        for info in self._model.body_paragraphs:
+            if self._info_is_toc_or_object_list(info):
                 continue
-            if self.paragraph_is_caption(p):
+            if self._info_seq_caption(info) is not None:
                 continue
 
-            has_object = False
-
-            if p.findall(".//w:drawing", self.NS):
-                has_object = True
-
-            if p.findall(".//m:oMath", self.NS):
-                has_object = True
-
-            if has_object:
+            if info.has_drawing or info.has_math:
                 continue
 
-            for r in p.findall(".//w:r", self.NS):
-                rpr = r.find("w:rPr", self.NS)
-                if rpr is None:
+            for run in info.runs:
+                if not run.has_rpr:
                     continue
 
-                if (
-                    rpr.find("w:sz", self.NS) is not None or
-                    rpr.find("w:rFonts", self.NS) is not None or
-                    rpr.find("w:color", self.NS) is not None
-                ):
-                    text = self._paragraph_text(p)
-                    if text:
-                        results.append((i, text))
+                if run.has_size or run.has_font or run.has_color:
+                    if info.text:
+                        results.append((info.body_index, info.text))
                     break
 
         return results
 
     def toc_shows_numbers(self) -> bool | None:
-        for instr in self._xml.findall(".//w:instrText", self.NS):
-            txt = instr.text or ""
+        for txt in self._model.instr_texts:
             if txt.strip().startswith("TOC"):
                 return "\\n" not in txt
         return None
     
     def paragraph_has_page_break(self, p):
-        ppr = p.find("w:pPr", self.NS)
-        if ppr is None:
-            return False
-        return ppr.find("w:pageBreakBefore", self.NS) is not None
+        return self._info(p).page_break_before
     
     def style_has_page_break(self, style_id):
         style = self._find_style_by_id(style_id)
         if style is None:
             return False
 
-        ppr = style.find("w:pPr", self.NS)
+        ppr = style.find(W_PPR)
         if ppr is None:
             return False
 
-        return ppr.find("w:pageBreakBefore", self.NS) is not None
+        return ppr.find(W_PAGEBREAKBEFORE) is not None
     
     def paragraph_text_raw(self, p: ET.Element) -> str:
         parts = []
 
-        for t in p.findall(".//w:t", self.NS):
+        for t in p.findall(ALL_W_T):
             if t.text is not None:
                 parts.append(t.text)
 
-        for tab in p.findall(".//w:tab", self.NS):
+        for tab in p.findall(ALL_W_TAB):
             parts.append("\t")
 
         return "".join(parts)
         
     def section_properties(self, index: int) -> ET.Element | None:
-        sec = self.section(index)
-        if not sec:
+        props = self._section_props
+        if index < 0 or index >= len(props):
             return None
+        return props[index]
 
+    def _find_section_properties(self, sec) -> ET.Element | None:
         for el in reversed(sec):
-            if el.tag.endswith("}sectPr"):
-                return el
+            sect = self._boundary_sect_pr(el)
+            if sect is not None:
+                return sect
 
-            if el.tag.endswith("}p"):
-                ppr = el.find("w:pPr", self.NS)
-                if ppr is not None:
-                    sect = ppr.find("w:sectPr", self.NS)
-                    if sect is not None:
-                        return sect
+        return None
+
+    def _boundary_sect_pr(self, el) -> ET.Element | None:
+        if el.tag.endswith("}sectPr"):
+            return el
+
+        if el.tag.endswith("}p"):
+            ppr = el.find(W_PPR)
+            if ppr is not None:
+                return ppr.find(W_SECTPR)
 
         return None
         
     def section_has_header_or_footer_content(self, section_index: int) -> bool:
-        sect_pr = self.section_properties(section_index)
-        if sect_pr is None:
+        refs = self._refs(section_index)
+        if refs is None or refs.sect_pr is None:
             return False
 
-        refs = (
-            sect_pr.findall("w:headerReference", self.NS)
-            + sect_pr.findall("w:footerReference", self.NS)
+        # viditelný text nebo pole (PAGE, DATE..)
+        return any(
+            part.has_text or part.has_instr_text
+            for part in self._part_infos_of(refs.header_ids + refs.footer_ids)
         )
-
-        for ref in refs:
-            r_id = ref.attrib.get(f"{{{self.NS['r']}}}id")
-            if not r_id:
-                continue
-
-            xml = self.load_part_by_rid(r_id)
-            if xml is None:
-                continue
-
-            # viditelný text
-            for t in xml.findall(".//w:t", self.NS):
-                if t.text and t.text.strip():
-                    return True
-
-            # pole (PAGE, DATE..)
-            for instr in xml.findall(".//w:instrText", self.NS):
-                if instr.text and instr.text.strip():
-                    return True
-
-        return False
         
-    def get_heading_num_id(self, p: ET.Element) -> str | None:
-        ppr = p.find("w:pPr", self.NS)
+    def _num_prs(self, p: ET.Element) -> Iterable[ET.Element]:
+        """numPr odstavce: přímé, pak z jeho stylu."""
+        ppr = p.find(W_PPR)
         if ppr is not None:
-            numpr = ppr.find("w:numPr", self.NS)
+            numpr = ppr.find(W_NUMPR)
             if numpr is not None:
-                ilvl = numpr.find("w:ilvl", self.NS)
-                if ilvl is None or ilvl.attrib.get(f"{{{self.NS['w']}}}val") == "0":
-                    num_id = numpr.find("w:numId", self.NS)
-                    if num_id is not None:
-                        return num_id.attrib.get(f"{{{self.NS['w']}}}val")
+                yield numpr
 
-        # ze stylu
         style_id = self._paragraph_style_id(p)
         if not style_id:
-            return None
+            return
 
         style = self._find_style_by_id(style_id)
         if style is None:
-            return None
+            return
 
-        ppr = style.find("w:pPr", self.NS)
-        if ppr is None:
-            return None
+        ppr = style.find(W_PPR)
+        if ppr is not None:
+            numpr = ppr.find(W_NUMPR)
+            if numpr is not None:
+                yield numpr
 
-        numpr = ppr.find("w:numPr", self.NS)
-        if numpr is None:
-            return None
+    def _paragraph_numbering(self, p: ET.Element) -> tuple[str | None, int | None]:
+        """(numId, ilvl) prvního numPr s numId."""
+        for numpr in self._num_prs(p):
+            num_id = numpr.find(W_NUMID)
+            if num_id is None:
+                continue
+
+            ilvl = numpr.find(W_ILVL)
+            level = ilvl.attrib.get(W_VAL, "") if ilvl is not None else "0"
+            return num_id.attrib.get(W_VAL), int(level) if level.isdigit() else 0
 
-        ilvl = numpr.find("w:ilvl", self.NS)
-        if ilvl is None or ilvl.attrib.get(f"{{{self.NS['w']}}}val") == "0":
-            num_id = numpr.find("w:numId", self.NS)
-            if num_id is not None:
-                return num_id.attrib.get(f"{{{self.NS['w']}}}val")
+        return None, None
+
+    def get_heading_num_id(self, p: ET.Element) -> str | None:
+        for numpr in self._num_prs(p):
+            ilvl = numpr.find(W_ILVL)
+            if ilvl is None or ilvl.attrib.get(W_VAL) == "0":
+                num_id = numpr.find(W_NUMID)
+                if num_id is not None:
+                    return num_id.attrib.get(W_VAL)
 
         return None
     #-------------------------------
@@ -879,33 +1017,20 @@ class WordDocument(TextDocument):
     def iter_objects(self):
         objects = []
 
-        for p in self._xml.findall(".//w:p", self.NS):
-            for drawing in p.findall(".//w:drawing", self.NS):
-                gd = drawing.find(".//a:graphicData", self.NS)
-                if gd is None:
-                    continue
-
-                uri = gd.attrib.get("uri", "")
-
-                if "picture" in uri:
-                    obj_type = "image"
-                elif "chart" in uri:
-                    obj_type = "chart"
-                else:
-                    continue
-
+        for info in self._model.paragraphs:
+            for obj_type in info.object_types:
                 objects.append({
                     "type": obj_type,
-                    "element": p
+                    "element": info.element
                 })
 
-            if p.findall(".//m:oMath", self.NS) or p.findall(".//m:oMathPara", self.NS):
+            if info.has_math or info.has_math_para:
                 objects.append({
                     "type": "equation",
-                    "element": p
+                    "element": info.element
                 })
 
-        for tbl in self._xml.findall(".//w:tbl", self.NS):
+        for tbl in self._model.tables:
             objects.append({
                 "type": "table",
                 "element": tbl
@@ -916,97 +1041,81 @@ class WordDocument(TextDocument):
     def iter_figure_caption_texts(self) -> list[str]:
         captions = []
 
-        for p in self._xml.findall(".//w:p", self.NS):
-            if self.paragraph_has_seq_caption(p) != "Obrázek":
+        for info in self._model.paragraphs:
+            if self._info_seq_caption(info) != "Obrázek":
                 continue
 
-            text = self._paragraph_text(p)
-            if text:
-                captions.append(text.strip())
+            if info.text:
+                captions.append(info.text.strip())
 
         return captions
     
     def iter_list_of_figures_texts(self) -> list[str]:
         items: list[str] = []
 
-        paragraphs = list(self._xml.findall(".//w:body/w:p", self.NS))
-
-        is_inside_figures_toc = False
-
-        for p in paragraphs:
-            for instr in p.findall(".//w:instrText", self.NS):
-                if instr.text:
-                    txt = instr.text.upper()
-                    if "TOC" in txt and "\\C" in txt and "OBRÁZEK" in txt:
-                        is_inside_figures_toc = True
-                        break
-
-            if not is_inside_figures_toc:
+        for region in self._field_regions:
+            if region.kind != "TOC" or "OBRÁZEK" not in (region.caption or "").upper():
                 continue
 
-            if p.find("w:pPr/w:sectPr", self.NS) is not None:
-                break
-
-            hl = p.find("w:hyperlink", self.NS)
-            if hl is None:
-                continue
-
-            text = self._paragraph_text(hl)
-            if text:
-                items.append(text.strip())
+            for entry in region.entries:
+                if entry.has_link and entry.text:
+                    items.append(entry.text)
 
         return items
             
     def object_image_rids(self, element) -> list[str]:
         rids = []
 
-        for blip in element.findall(".//a:blip", self.NS):
-            rid = blip.attrib.get(f"{{{self.NS['r']}}}embed")
+        for blip in element.findall(ALL_A_BLIP):
+            rid = blip.attrib.get(R_EMBED)
             if rid:
                 rids.append(rid)
 
         return rids
     
-    def get_image_bytes(self, r_id: str) -> bytes | None:
-        try:
-            rels = self._load("word/_rels/document.xml.rels")
-        except KeyError:
+    def _media_path(self, r_id: str) -> str | None:
+        rel = self._rels.get(r_id)
+        if rel is None:
             return None
-        for rel in rels.findall(".//rel:Relationship", NS):
-            if rel.attrib.get("Id") == r_id:
-                target = rel.attrib.get("Target")
 
-                if not target.startswith("media/"):
-                    return None
+        target = rel[1]
+        if not target or not target.startswith("media/"):
+            return None
 
-                media_path = f"word/{target}"
+        return f"word/{target}"
 
-                try:
-                    with self._zip.open(media_path) as f:
-                        return f.read()
-                except KeyError:
-                    return None
+    def get_image_bytes(self, r_id: str) -> bytes | None:
+        media_path = self._media_path(r_id)
+        if media_path is None:
+            return None
 
-        return None
+        try:
+            with self._archive.open(media_path, cache=False) as f:
+                return f.read()
+        except KeyError:
+            return None
+
+    def image_info(self, r_id: str) -> ImageInfo | None:
+        """Rozměry obrázku podle r:embed, bez načtení celého souboru."""
+        media_path = self._media_path(r_id)
+        if media_path is None:
+            return None
+        return self.media_info(media_path)
     
     def paragraph_has_seq_caption(self, p: ET.Element) -> str | None:
         if p is None:
             return None
 
-        for fld in p.findall(".//w:fldSimple", self.NS):
-            instr = fld.attrib.get(f"{{{self.NS['w']}}}instr") or ""
+        return self._info_seq_caption(self._info(p))
+
+    def _info_seq_caption(self, info: ParagraphInfo) -> str | None:
+        for instr in info.simple_fields:
             m = re.search(r"\bSEQ\s+([^\s\\]+)", instr, re.IGNORECASE)
             if m:
                 return m.group(1)
 
-        instr_parts = []
-
-        for instr in p.findall(".//w:instrText", self.NS):
-            if instr.text:
-                instr_parts.append(instr.text)
-
-        if instr_parts:
-            joined = " ".join(instr_parts)
+        if info.instr_texts:
+            joined = " ".join(info.instr_texts)
             m = re.search(r"\bSEQ\s+([^\s\\]+)", joined, re.IGNORECASE)
             if m:
                 return m.group(1)
@@ -1014,100 +1123,48 @@ class WordDocument(TextDocument):
         return None
 
     def paragraph_before(self, element):
-        paragraphs = self._xml.findall(".//w:p", self.NS)
-
-        try:
-            idx = paragraphs.index(element)
-        except ValueError:
+        model = self._model
+        info = model.by_element.get(element)
+        if info is None:
             return None
 
-        for p in reversed(paragraphs[:idx]):
-            if self._paragraph_text(p):
-                return p
-
-        return None
+        prev = model.prev_non_empty[info.index]
+        return model.paragraphs[prev].element if prev is not None else None
 
 
     def paragraph_after(self, element):
-        paragraphs = self._xml.findall(".//w:p", self.NS)
-
-        try:
-            idx = paragraphs.index(element)
-        except ValueError:
+        model = self._model
+        info = model.by_element.get(element)
+        if info is None:
             return None
 
-        for p in paragraphs[idx + 1:]:
-            if self._paragraph_text(p):
-                return p
-
-        return None
+        nxt = model.next_non_empty[info.index]
+        return model.paragraphs[nxt].element if nxt is not None else None
     
 
     def paragraph_is_caption(self, p: ET.Element) -> bool:
         return self.paragraph_has_seq_caption(p) is not None
 
     
-    # def _paragraph_is_toc_or_object_list(self, p):
-    #     ppr = p.find("w:pPr", self.NS)
-    #     if ppr is not None:
-    #         ps = ppr.find("w:pStyle", self.NS)
-    #         if ps is not None:
-    #             style = (ps.attrib.get(f"{{{self.NS['w']}}}val") or "").lower()
-    #             if any(x in style for x in ("toc", "obsah", "seznam")):
-    #                 return True
-
-    #     for instr in p.findall(".//w:instrText", self.NS):
-    #         if instr.text:
-    #             txt = instr.text.upper()
-    #             if txt.startswith("TOC") or "PAGEREF" in txt:
-    #                 return True
-
-    #     return False
-
     def _paragraph_is_toc_or_object_list(self, p) -> bool:
-        ppr = p.find("w:pPr", self.NS)
-        if ppr is not None:
-            ps = ppr.find("w:pStyle", self.NS)
-            if ps is not None:
-                style = (ps.attrib.get(f"{{{self.NS['w']}}}val") or "").lower()
-                if any(x in style for x in ("toc", "obsah", "seznam")):
-                    return True
+        return self._info_is_toc_or_object_list(self._info(p))
 
-        instr_parts = []
-        for instr in p.findall(".//w:instrText", self.NS):
-            if instr.text:
-                instr_parts.append(instr.text)
-
-        instr_joined = "".join(instr_parts).strip().upper()
-
-        if "TOC" in instr_joined or "PAGEREF" in instr_joined:
-            return True
-
-        for fld in p.findall(".//w:fldSimple", self.NS):
-            instr = (fld.attrib.get(f"{{{self.NS['w']}}}instr") or "").strip().upper()
-            if "TOC" in instr or "PAGEREF" in instr:
-                return True
-
-        return False
+    def _info_is_toc_or_object_list(self, info: ParagraphInfo) -> bool:
+        return info.is_toc_or_object_list
     
     def iter_crossref_anchors_in_body_text(self) -> set[str]:
         anchors = set()
 
-        for p in self._xml.findall(".//w:body/w:p", self.NS):
-            if self._paragraph_is_toc_or_object_list(p):
+        for info in self._model.body_paragraphs:
+            if self._info_is_toc_or_object_list(info):
                 continue
-            if self.paragraph_is_caption(p):
+            if self._info_seq_caption(info) is not None:
                 continue
 
-            for hl in p.findall(".//w:hyperlink", self.NS):
-                a = hl.attrib.get(f"{{{self.NS['w']}}}anchor")
-                if a:
-                    anchors.add(a)
+            anchors.update(info.hyperlink_anchors)
 
-            for instr in p.findall(".//w:instrText", self.NS):
-                if not instr.text:
-                    continue
-                txt = instr.text.strip()
+            for instr in info.instr_texts:
+                txt = instr.strip()
                 if txt.upper().startswith("REF "):
                     parts = txt.split()
                     if len(parts) >= 2:
@@ -1117,80 +1174,32 @@ class WordDocument(TextDocument):
     #-------------------------------------
     # Liteatura
     def has_word_bibliography(self) -> bool:
-        for sdt in self._xml.findall(".//w:sdt", self.NS):
-            sdt_pr = sdt.find("w:sdtPr", self.NS)
-            if sdt_pr is not None and sdt_pr.find("w:bibliography", self.NS) is not None:
-                return True
-        return False
+        return any(sdt.is_bibliography for sdt in self._model.sdts)
     
     def count_word_citations(self) -> int:
-        count = 0
-        for sdt in self._xml.findall(".//w:sdt", self.NS):
-            sdt_pr = sdt.find("w:sdtPr", self.NS)
-            if sdt_pr is not None and sdt_pr.find("w:citation", self.NS) is not None:
-                count += 1
-        return count
+        return sum(1 for sdt in self._model.sdts if sdt.is_citation)
     
     def count_bibliography_items(self) -> int:
-        count = 0
-
-        for sdt in self._xml.findall(".//w:sdt", self.NS):
-            sdt_pr = sdt.find("w:sdtPr", self.NS)
-            if sdt_pr is None or sdt_pr.find("w:bibliography", self.NS) is None:
-                continue
-
-            for p in sdt.findall(".//w:p", self.NS):
-                ppr = p.find("w:pPr", self.NS)
-                if ppr is None:
-                    continue
-
-                ps = ppr.find("w:pStyle", self.NS)
-                if ps is None:
-                    continue
-
-                style = ps.attrib.get(f"{{{self.NS['w']}}}val", "").lower()
-                if style in ("bibliografie", "bibliography"):
-                    if self._paragraph_text(p):
-                        count += 1
-
-        return count
+        return sum(sdt.bibliography_items for sdt in self._model.sdts)
     #----------------------------------
     # Header/Footer
     def load_part_by_rid(self, r_id: str):
-        try:
-            rels = self._load("word/_rels/document.xml.rels")
-        except KeyError:
+        rel = self._rels.get(r_id)
+        if rel is None or not rel[1]:
             return None
 
-        for rel in rels.findall(".//rel:Relationship", self.NS):
-            if rel.attrib.get("Id") == r_id:
-                target = rel.attrib.get("Target")
-                if not target:
-                    return None
-                return self._load(f"word/{target}")
-
-        return None
+        return self._part(f"word/{rel[1]}")
 
     def resolve_part_target(self, r_id: str) -> str | None:
-        try:
-            rels = self._load("word/_rels/document.xml.rels")
-        except KeyError:
+        rel = self._rels.get(r_id)
+        if rel is None or not rel[1]:
             return None
 
-        for rel in rels.findall(".//rel:Relationship", self.NS):
-            if rel.attrib.get("Id") != r_id:
-                continue
-
-            target = rel.attrib.get("Target")
-            if not target:
-                return None
-
-            if not target.startswith("word/"):
-                return f"word/{target}"
-
-            return target
+        target = rel[1]
+        if not target.startswith("word/"):
+            return f"word/{target}"
 
-        return None
+        return target
     
     def has_text_after_paragraph(self, paragraphs, index: int) -> bool:
         for p in paragraphs[index + 1:]:
@@ -1199,20 +1208,16 @@ class WordDocument(TextDocument):
         return False
     
     def paragraph_is_generated_by_field(self, p) -> bool:
-        if p.findall(".//w:fldChar", self.NS):
-            return True
-        if p.findall(".//w:instrText", self.NS):
-            return True
-        return False
+        return self._info(p).generated_by_field
     
     def _visible_text(self, element) -> str:
         parts = []
-        for r in element.findall(".//w:r", self.NS):
-            rpr = r.find("w:rPr", self.NS)
-            if rpr is not None and rpr.find("w:webHidden", self.NS) is not None:
+        for r in element.findall(ALL_W_R):
+            rpr = r.find(W_RPR)
+            if rpr is not None and rpr.find(W_WEBHIDDEN) is not None:
                 continue
 
-            for t in r.findall("w:t", self.NS):
+            for t in r.findall(W_T):
                 if t.text:
                     parts.append(t.text)
 
@@ -1221,20 +1226,13 @@ class WordDocument(TextDocument):
         return txt
     
     def first_heading_in_section(self, section_index: int, level: int = 1):
-        for el in self.section(section_index):
-            if not el.tag.endswith("}p"):
-                continue
-
-            if not self._paragraph_text(el):
-                continue
-
-            style_id = self._paragraph_style_id(el)
-            if not style_id:
-                continue
+        info = self._section_info(section_index)
+        if info is None:
+            return None
 
-            lvl = self._style_level_from_styles_xml(style_id)
-            if lvl == level:
-                return el
+        for heading in info.headings:
+            if heading.level == level:
+                return heading.element
 
         return None
   
@@ -1243,18 +1241,18 @@ class WordDocument(TextDocument):
         for el in self.section(section_index):
             if el.tag.endswith("}p"):
                 yield el
-            yield from el.findall(".//w:p", self.NS)
+            yield from el.findall(ALL_W_P)
 #_______________________________________
     def get_style_parent(self, style_name: str) -> str | None:
         style_el = self._find_style(name=style_name)
         if style_el is None:
             return None
 
-        based_el = style_el.find("w:basedOn", self.NS)
+        based_el = style_el.find(W_BASEDON)
         if based_el is None:
             return None
 
-        parent_id = based_el.attrib.get(f"{{{self.NS['w']}}}val")
+        parent_id = based_el.attrib.get(W_VAL)
         if not parent_id:
             return None
 
@@ -1262,32 +1260,32 @@ class WordDocument(TextDocument):
         if parent_style is None:
             return None
 
-        name_el = parent_style.find("w:name", self.NS)
+        name_el = parent_style.find(W_NAME)
         if name_el is None:
             return None
 
-        return name_el.attrib.get(f"{{{self.NS['w']}}}val")
+        return name_el.attrib.get(W_VAL)
     
     def get_used_paragraph_styles(self) -> set[str]:
         used = set()
 
         for p in self.iter_paragraphs():
-            ppr = p.find("w:pPr", self.NS)
+            ppr = p.find(W_PPR)
             if ppr is None:
                 continue
 
-            ps = ppr.find("w:pStyle", self.NS)
+            ps = ppr.find(W_PSTYLE)
             if ps is None:
                 continue
 
-            style_id = ps.attrib.get(f"{{{self.NS['w']}}}val")
+            style_id = ps.attrib.get(W_VAL)
             style_el = self._find_style_by_id(style_id)
             if style_el is None:
                 continue
 
-            name_el = style_el.find("w:name", self.NS)
+            name_el = style_el.find(W_NAME)
             if name_el is not None:
-                used.add(name_el.attrib.get(f"{{{self.NS['w']}}}val"))
+                used.add(name_el.attrib.get(W_VAL))
 
         return used
 
@@ -1300,49 +1298,34 @@ class WordDocument(TextDocument):
         if style is None:
             return False, False, None
 
-        ppr = style.find("w:pPr", self.NS)
+        ppr = style.find(W_PPR)
         if ppr is None:
             return False, False, None
 
-        numpr = ppr.find("w:numPr", self.NS)
+        numpr = ppr.find(W_NUMPR)
         if numpr is None:
             return False, False, None
 
         # úroveň (ilvl)
-        ilvl_el = numpr.find("w:ilvl", self.NS)
-        num_level = int(ilvl_el.attrib[f"{{{self.NS['w']}}}val"]) if ilvl_el is not None else 0
+        ilvl_el = numpr.find(W_ILVL)
+        num_level = int(ilvl_el.attrib[W_VAL]) if ilvl_el is not None else 0
 
         # numId
-        numid_el = numpr.find("w:numId", self.NS)
+        numid_el = numpr.find(W_NUMID)
         if numid_el is None:
             return False, False, None
 
-        num_id = numid_el.attrib.get(f"{{{self.NS['w']}}}val")
+        num_id = numid_el.attrib.get(W_VAL)
         if not num_id:
             return False, False, None
 
-        numbering = self._load("word/numbering.xml")
-
-        abstract_id = None
-        for num in numbering.findall(".//w:num", self.NS):
-            if num.attrib.get(f"{{{self.NS['w']}}}numId") == num_id:
-                abs_el = num.find("w:abstractNumId", self.NS)
-                if abs_el is not None:
-                    abstract_id = abs_el.attrib.get(f"{{{self.NS['w']}}}val")
-                    break
+        nums, lvl_texts = self._numbering_index
 
+        abstract_id = nums.get(num_id)
         if abstract_id is None:
             return True, False, num_level
 
-        lvl_text = None
-        for absn in numbering.findall(".//w:abstractNum", self.NS):
-            if absn.attrib.get(f"{{{self.NS['w']}}}abstractNumId") == abstract_id:
-                for lvl in absn.findall("w:lvl", self.NS):
-                    if lvl.attrib.get(f"{{{self.NS['w']}}}ilvl") == str(num_level):
-                        txt = lvl.find("w:lvlText", self.NS)
-                        if txt is not None:
-                            lvl_text = txt.attrib.get(f"{{{self.NS['w']}}}val")
-                        break
+        lvl_text = lvl_texts.get((abstract_id, str(num_level)))
 
         if not lvl_text:
             return True, False, num_level
@@ -1354,45 +1337,62 @@ class WordDocument(TextDocument):
         return True, is_hierarchical, num_level
     
 
+    @cached_property
+    def _numbering_index(self) -> tuple[dict, dict]:
+        """numId -> abstractNumId a (abstractNumId, ilvl) -> lvlText z numbering.xml."""
+        numbering = self._part("word/numbering.xml")
+
+        nums = {}
+        for num in numbering.findall(ALL_W_NUM):
+            abs_el = num.find(W_ABSTRACTNUMID)
+            if abs_el is not None:
+                nums.setdefault(num.attrib.get(W_NUMID), abs_el.attrib.get(W_VAL))
+
+        lvl_texts = {}
+        for absn in numbering.findall(ALL_W_ABSTRACTNUM):
+            abstract_id = absn.attrib.get(W_ABSTRACTNUMID)
+            for lvl in absn.findall(W_LVL):
+                key = (abstract_id, lvl.attrib.get(W_ILVL))
+                if key in lvl_texts:
+                    continue
+                txt = lvl.find(W_LVLTEXT)
+                lvl_texts[key] = txt.attrib.get(W_VAL) if txt is not None else None
+
+        return nums, lvl_texts
+
     def find_inline_formatting(self) -> list[dict]:
         results = []
 
-        for p in self.iter_paragraphs():
+        for info in self._model.paragraphs:
 
-            if self._paragraph_is_toc_or_object_list(p):
+            if self._info_is_toc_or_object_list(info):
                 continue
 
-            for r in p.findall(".//w:r", self.NS):
+            for run in info.runs:
 
-                rpr = r.find("w:rPr", self.NS)
-                if rpr is None:
+                if not run.has_rpr:
                     continue
 
-                run_text = "".join(
-                    t.text for t in r.findall("w:t", self.NS)
-                    if t.text
-                ).strip()
+                run_text = run.text.strip()
 
                 if not run_text:
                     continue
 
                 problems = []
 
-                if self._is_enabled(rpr.find("w:b", self.NS)) \
-                or self._is_enabled(rpr.find("w:bCs", self.NS)):
+                if run.bold:
                     problems.append("tučné písmo")
 
-                if self._is_enabled(rpr.find("w:i", self.NS)) \
-                or self._is_enabled(rpr.find("w:iCs", self.NS)):
+                if run.italic:
                     problems.append("kurzíva")
 
-                if rpr.find("w:sz", self.NS) is not None:
+                if run.has_size:
                     problems.append("změna velikosti písma")
 
-                if rpr.find("w:rFonts", self.NS) is not None:
+                if run.has_font:
                     problems.append("změna fontu")
 
-                if rpr.find("w:color", self.NS) is not None:
+                if run.has_color:
                     problems.append("změna barvy")
 
                 for problem in problems:
@@ -1407,23 +1407,14 @@ class WordDocument(TextDocument):
         if el is None:
             return False
 
-        val = el.attrib.get(f"{{{self.NS['w']}}}val")
+        val = el.attrib.get(W_VAL)
         return val is None or val not in ("0", "false", "False")
     
 
     def iter_main_headings(self):
-        for p in self.iter_paragraphs():
-            text = self._paragraph_text(p)
-            if not text:
-                continue
-
-            style_id = self._paragraph_style_id(p)
-            if not style_id:
-                continue
-
-            level = self._style_level_from_styles_xml(style_id)
-            if level == 1:
-                yield p
+        for heading in self._outline:
+            if heading.level == 1:
+                yield heading.element
 
 
     def heading_starts_on_new_page(self, p) -> bool:
@@ -1442,27 +1433,24 @@ class WordDocument(TextDocument):
     
 
     def paragraph_is_toc(self, p) -> bool:
-        ppr = p.find("w:pPr", self.NS)
+        ppr = p.find(W_PPR)
         if ppr is None:
             return False
 
-        ps = ppr.find("w:pStyle", self.NS)
+        ps = ppr.find(W_PSTYLE)
         if ps is not None:
-            val = ps.attrib.get(f"{{{self.NS['w']}}}val", "").lower()
+            val = ps.attrib.get(W_VAL, "").lower()
             if "toc" in val or "obsah" in val:
                 return True
 
-        for instr in p.findall(".//w:instrText", self.NS):
+        for instr in p.findall(ALL_W_INSTRTEXT):
             if instr.text and instr.text.upper().startswith("TOC"):
                 return True
 
         return False
     
     def paragraph_is_empty(self, p) -> bool:
-        for t in p.findall(".//w:t", self.NS):
-            if t.text and t.text.strip():
-                return False
-        return True
+        return self._info(p).is_empty
 
 
     def paragraph_has_text(self, p) -> bool:
@@ -1474,31 +1462,18 @@ class WordDocument(TextDocument):
 
 
     def paragraph_style_name(self, p) -> str:
-        ppr = p.find("w:pPr", self.NS)
+        ppr = p.find(W_PPR)
         if ppr is None:
             return "bez stylu"
-        ps = ppr.find("w:pStyle", self.NS)
-        return ps.attrib.get(f"{{{self.NS['w']}}}val", "bez stylu") if ps else "bez stylu"
+        ps = ppr.find(W_PSTYLE)
+        return ps.attrib.get(W_VAL, "bez stylu") if ps else "bez stylu"
 
 
     def paragraph_has_spacing_before(self, p) -> bool:
-        ppr = p.find("w:pPr", self.NS)
-        if ppr is None:
-            return False
-        spacing = ppr.find("w:spacing", self.NS)
-        if spacing is None:
-            return False
-        before = spacing.attrib.get(f"{{{self.NS['w']}}}before")
-        return before is not None and int(before) > 0
+        return self._info(p).spacing_before
     
     def paragraph_is_generated(self, p) -> bool:
-        if self.paragraph_is_generated_by_field(p):
-            return True
-
-        if self._paragraph_is_toc_or_object_list(p):
-            return True
-
-        return False
+        return self._info(p).is_generated
     
     def get_cover_style(self, key: str):
         names = COVER_STYLES.get(key, [])
@@ -1508,16 +1483,7 @@ class WordDocument(TextDocument):
         )
     
     def paragraph_is_heading(self, p) -> bool:
-        ppr = p.find("w:pPr", self.NS)
-        if ppr is None:
-            return False
-
-        ps = ppr.find("w:pStyle", self.NS)
-        if ps is None:
-            return False
-
-        style = (ps.attrib.get(f"{{{self.NS['w']}}}val") or "").lower()
-        return style.startswith("heading") or style.startswith("nadpis")
+        return self._info(p).is_heading
     
 
     def has_list_level(self, level: int) -> bool:
@@ -1525,15 +1491,15 @@ class WordDocument(TextDocument):
             return False
 
         for p in self.iter_paragraphs():
-            ppr = p.find("w:pPr", self.NS)
+            ppr = p.find(W_PPR)
             if ppr is None:
                 continue
 
-            ps = ppr.find("w:pStyle", self.NS)
+            ps = ppr.find(W_PSTYLE)
             if ps is None:
                 continue
 
-            style_id = ps.attrib.get(f"{{{self.NS['w']}}}val")
+            style_id = ps.attrib.get(W_VAL)
             if not style_id:
                 continue
 
@@ -1542,24 +1508,25 @@ class WordDocument(TextDocument):
 
         return False
     
-    def toc_level_contains_numbers(self, level: int) -> bool | None:
-        number_re = re.compile(r'^\s*\d+(\.\d+)*\.')
-
-        items = []
-        for p in self.iter_paragraphs():
-            sid = (self._paragraph_style_id(p) or "").lower()
-
-            ok = (
-                (sid == f"toc{level}") or
-                (sid == f"obsah{level}")
-            )
-            if not ok:
+    @cached_property
+    def _toc_entries(self) -> dict[str, list[str]]:
+        """Neprázdné texty položek obsahu (styly TOC N / Obsah N) podle úrovně."""
+        entries = {}
+        for info in self._model.paragraphs:
+            m = re.fullmatch(r"(?:toc|obsah)(\d+)", (info.style_id or "").lower())
+            if m is None:
                 continue
 
-            txt = (self._paragraph_text(p) or "").strip()
+            txt = info.text.strip()
             if txt:
-                items.append(txt)
+                entries.setdefault(m.group(1), []).append(txt)
 
+        return entries
+
+    def toc_level_contains_numbers(self, level: int) -> bool | None:
+        number_re = re.compile(r'^\s*\d+(\.\d+)*\.')
+
+        items = self._toc_entries.get(str(level))
         if not items:
             return None
 
@@ -1577,222 +1544,98 @@ class WordDocument(TextDocument):
         return bool(style.isNumbered)
     
     def section_has_header_text(self, index: int) -> bool:
-        sect_pr = self.section_properties(index)
-        if sect_pr is None:
+        refs = self._refs(index)
+        if refs is None or refs.sect_pr is None:
             return False
 
-        header_refs = sect_pr.findall("w:headerReference", self.NS)
-        for ref in header_refs:
-            r_id = ref.attrib.get(f"{{{self.NS['r']}}}id")
-            if not r_id:
-                continue
-
-            part_path = self.resolve_part_target(r_id)
-            if not part_path:
-                continue
-
-            try:
-                header_xml = self._load(part_path)
-            except KeyError:
-                continue
-
-            for t in header_xml.findall(".//w:t", self.NS):
-                if t.text and t.text.strip():
-                    return True
-
-        return False
+        return any(part.has_text for part in self._part_infos_of(refs.header_ids))
     
     def second_section_page_number_starts_at_one(self) -> bool | None:
         if self.section_count() < 2:
             return None
 
-        sect_pr = self.section_properties(1)
-        if sect_pr is None:
+        refs = self._refs(1)
+        if refs.sect_pr is None:
             return False
 
-        pg_num = sect_pr.find("w:pgNumType", self.NS)
-        if pg_num is None:
-            return False
-
-        start = pg_num.attrib.get(f"{{{self.NS['w']}}}start")
-        return start == "1"
+        return refs.page_number_start == "1"
     
     def section_footer_is_empty(self, index: int) -> bool | None:
-        sect_pr = self.section_properties(index)
-        if sect_pr is None:
-            return None
-
-        footer_refs = sect_pr.findall("w:footerReference", self.NS)
-        if not footer_refs:
-            return True
+        return self._header_footer_is_empty(index, footer=True)
 
-        for ref in footer_refs:
-            r_id = ref.attrib.get(f"{{{self.NS['r']}}}id")
-            if not r_id:
-                continue
-
-            part = self.resolve_part_target(r_id)
-            if not part:
-                continue
-
-            try:
-                xml = self._load(part)
-            except KeyError:
-                continue
+    def section_header_is_empty(self, index: int) -> bool | None:
+        return self._header_footer_is_empty(index, footer=False)
 
-            # text
-            for t in xml.findall(".//w:t", self.NS):
-                if t.text and t.text.strip():
-                    return False
+    def _header_footer_is_empty(self, index: int, *, footer: bool) -> bool | None:
+        refs = self._refs(index)
+        if refs is None or refs.sect_pr is None:
+            return None
 
-            # objekty
-            if (
-                xml.findall(".//w:drawing", self.NS)
-                or xml.findall(".//m:oMath", self.NS)
-                or xml.findall(".//m:oMathPara", self.NS)
-            ):
-                return False
+        r_ids = refs.footer_ids if footer else refs.header_ids
+        if not r_ids:
+            return True
 
-        return True
+        # text nebo objekty
+        return not any(
+            part.has_text or part.has_objects
+            for part in self._part_infos_of(r_ids)
+        )
     
     def section_has_title_page(self, sect_pr) -> bool:
-        return sect_pr.find("w:titlePg", self.NS) is not None
+        return sect_pr.find(W_TITLEPG) is not None
 
     def even_and_odd_headers_enabled(self) -> bool:
         settings = getattr(self, "settings", None)
         if settings is None:
             return False
-        return settings.find("w:evenAndOddHeaders", self.NS) is not None
+        return settings.find(W_EVENANDODDHEADERS) is not None
 
     def footer_is_linked_to_previous(self, index: int) -> bool | None:
-        if index <= 0:
-            return None
-
-        sect_prev = self.section_properties(index - 1)
-        sect_curr = self.section_properties(index)
-
-        if sect_prev is None or sect_curr is None:
-            return None
-
-        footers_prev = sect_prev.findall("w:footerReference", self.NS)
-        footers_curr = sect_curr.findall("w:footerReference", self.NS)
-
-        map_prev = {}
-        for f in footers_prev:
-            f_type = f.attrib.get(f"{{{self.NS['w']}}}type", "default")
-            r_id = f.attrib.get(f"{{{self.NS['r']}}}id")
-            if r_id:
-                map_prev[f_type] = r_id
-
-        map_curr = {}
-        for f in footers_curr:
-            f_type = f.attrib.get(f"{{{self.NS['w']}}}type", "default")
-            r_id = f.attrib.get(f"{{{self.NS['r']}}}id")
-            if r_id:
-                map_curr[f_type] = r_id
-
-        # které typy zápatí MUSÍ existovat
-        required_types = {"default"}
-
-        if self.section_has_title_page(sect_curr):
-            required_types.add("first")
-
-        if self.even_and_odd_headers_enabled():
-            required_types.add("even")
-
-        for t in required_types:
-            if t not in map_curr:
-                return True
-
-        for t in required_types:
-            if t in map_prev and map_prev[t] == map_curr[t]:
-                return True
-
-        return False
+        return self._is_linked_to_previous(index, footer=True)
     
     def section_footer_has_page_number(self, index: int) -> bool | None:
         if self.section_count() <= index:
             return None
 
-        sect_pr = self.section_properties(index)
-        if sect_pr is None:
+        refs = self._refs(index)
+        if refs is None or refs.sect_pr is None:
             return False
 
-        footer_refs = sect_pr.findall("w:footerReference", self.NS)
-        if not footer_refs:
-            return False
-
-        for ref in footer_refs:
-            r_id = ref.attrib.get(f"{{{self.NS['r']}}}id")
-            if not r_id:
-                continue
-
-            part = self.resolve_part_target(r_id)
-            if not part:
-                continue
-
-            try:
-                xml = self._load(part)
-            except KeyError:
-                continue
-
-            # fldSimple
-            for fld in xml.findall(".//w:fldSimple", self.NS):
-                instr = fld.attrib.get(f"{{{self.NS['w']}}}instr", "")
-                if "PAGE" in instr.upper():
-                    return True
-
-            # instrText
-            for instr in xml.findall(".//w:instrText", self.NS):
-                if instr.text and "PAGE" in instr.text.upper():
-                    return True
-
-        return False
+        return any(part.has_page_field for part in self._part_infos_of(refs.footer_ids))
 
     def header_is_linked_to_previous(self, index: int) -> bool | None:
+        return self._is_linked_to_previous(index, footer=False)
+
+    def _is_linked_to_previous(self, index: int, *, footer: bool) -> bool | None:
         if index <= 0:
             return None
 
-        sect_prev = self.section_properties(index - 1)
-        sect_curr = self.section_properties(index)
+        prev = self._refs(index - 1)
+        curr = self._refs(index)
 
-        if sect_prev is None or sect_curr is None:
+        if prev is None or curr is None or prev.sect_pr is None or curr.sect_pr is None:
             return None
 
-        headers_prev = sect_prev.findall("w:headerReference", self.NS)
-        headers_curr = sect_curr.findall("w:headerReference", self.NS)
-
-        map_prev = {}
-        for h in headers_prev:
-            h_type = h.attrib.get(f"{{{self.NS['w']}}}type", "default")
-            r_id = h.attrib.get(f"{{{self.NS['r']}}}id")
-            if r_id:
-                map_prev[h_type] = r_id
-
-        map_curr = {}
-        for h in headers_curr:
-            h_type = h.attrib.get(f"{{{self.NS['w']}}}type", "default")
-            r_id = h.attrib.get(f"{{{self.NS['r']}}}id")
-            if r_id:
-                map_curr[h_type] = r_id
+        map_prev = prev.footers if footer else prev.headers
+        map_curr = curr.footers if footer else curr.headers
 
-        # které typy hlaviček MUSÍ mít vlastní definici
+        # které typy záhlaví / zápatí MUSÍ mít vlastní definici
         required_types = {"default"}
 
-        if self.section_has_title_page(sect_curr):
+        if curr.title_page:
             required_types.add("first")
 
         if self.even_and_odd_headers_enabled():
             required_types.add("even")
 
-        # 1️⃣ chybějící headerReference = dědí z předchozího
+        # 1️⃣ chybějící reference = dědí z předchozího
         for t in required_types:
             if t not in map_curr:
                 return True
 
-        # 2️⃣ stejný r:id jako předchozí = fyzicky stejný header
+        # 2️⃣ stejný r:id jako předchozí = fyzicky stejná část
         for t in required_types:
             if t in map_prev and map_prev[t] == map_curr[t]:
                 return True
 
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,584 @@
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Callable
+
+from document.qnames import (
+    ALL_A_GRAPHICDATA, M_OMATH, M_OMATHPARA, W_ANCHOR, W_B, W_BCS, W_BIBLIOGRAPHY,
+    W_BEFORE, W_BODY, W_CITATION, W_COLOR, W_DRAWING, W_FLDCHAR, W_FLDCHARTYPE,
+    W_FLDSIMPLE, W_HYPERLINK, W_I, W_ICS, W_INSTR, W_INSTRTEXT, W_P, W_PAGEBREAKBEFORE,
+    W_PPR, W_PSTYLE, W_R, W_RFONTS, W_RPR, W_RSTYLE, W_SDT, W_SDTPR, W_SECTPR, W_SPACING,
+    W_SZ, W_T, W_TBL, W_VAL,
+)
+
+
+def _is_enabled(el) -> bool:
+    if el is None:
+        return False
+
+    val = el.attrib.get(W_VAL)
+    return val is None or val not in ("0", "false", "False")
+
+
+def _twips(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+@dataclass(frozen=True, slots=True)
+class RunInfo:
+    element: ET.Element
+    text: str = ""  # přímé w:t běhu, bez normalizace
+    has_rpr: bool = False
+    has_style: bool = False
+    bold: bool = False
+    italic: bool = False
+    has_size: bool = False
+    has_font: bool = False
+    has_color: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ParagraphInfo:
+    """
+    Neměnný souhrn jednoho odstavce, spočítaný jednou při průchodu dokumentem.
+    Stejně jako p.findall(".//…") zahrnuje i obsah vnořených odstavců
+    (textová pole v kresbách).
+    """
+    element: ET.Element
+    index: int
+    body_index: int | None = None  # pořadí mezi w:body/w:p, od 1
+    nested: bool = False  # odstavec uvnitř jiného odstavce (textové pole)
+    style_id: str | None = None
+    level: int | None = None
+    text: str = ""
+    instr_texts: tuple[str, ...] = ()
+    simple_fields: tuple[str, ...] = ()
+    field_types: tuple[str, ...] = ()  # první slovo instrukce každého pole (TOC, SEQ, PAGEREF…)
+    field_ends: int = 0  # konce polí začatých v dřívějších odstavcích
+    field_starts: tuple[str, ...] = ()  # instrukce polí, která pokračují za odstavec
+    has_fld_char: bool = False
+    generated_by_field: bool = False  # w:fldChar nebo w:instrText
+    has_drawing: bool = False
+    object_types: tuple[str, ...] = ()
+    has_math: bool = False
+    has_math_para: bool = False
+    has_hyperlink: bool = False
+    hyperlink_anchors: tuple[str, ...] = ()
+    has_sect_pr: bool = False
+    page_break_before: bool = False
+    spacing_before: bool = False  # nenulová mezera před odstavcem
+    runs: tuple[RunInfo, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.text
+
+    @property
+    def is_heading(self) -> bool:
+        style = (self.style_id or "").lower()
+        return style.startswith("heading") or style.startswith("nadpis")
+
+    @property
+    def is_toc_or_object_list(self) -> bool:
+        style = (self.style_id or "").lower()
+        if any(x in style for x in ("toc", "obsah", "seznam")):
+            return True
+
+        instr_joined = "".join(self.instr_texts).strip().upper()
+        if "TOC" in instr_joined or "PAGEREF" in instr_joined:
+            return True
+
+        for instr in self.simple_fields:
+            instr = instr.strip().upper()
+            if "TOC" in instr or "PAGEREF" in instr:
+                return True
+
+        return False
+
+    @property
+    def is_generated(self) -> bool:
+        return self.generated_by_field or self.is_toc_or_object_list
+
+
+class _ParagraphBuilder:
+    """Rozpracovaný ParagraphInfo během průchodu, na konci se zmrazí."""
+
+    __slots__ = (
+        "element", "index", "body_index", "nested", "style_id", "level", "text",
+        "parts", "instr_texts", "simple_fields", "field_types", "fields",
+        "field_ends", "has_fld_char",
+        "generated_by_field", "has_drawing", "object_types", "has_math",
+        "has_math_para", "has_hyperlink", "hyperlink_anchors", "has_sect_pr",
+        "page_break_before", "spacing_before", "runs",
+    )
+
+    def __init__(self, element, index: int, body_index: int | None, nested: bool = False):
+        self.element = element
+        self.index = index
+        self.body_index = body_index
+        self.nested = nested
+        self.style_id = None
+        self.level = None
+        self.text = ""
+        self.parts = []
+        self.instr_texts = []
+        self.simple_fields = []
+        self.field_types = []
+        self.fields = []  # rozpracovaná složená pole: [části instrukce, už zapsáno]
+        self.field_ends = 0
+        self.has_fld_char = False
+        self.generated_by_field = False
+        self.has_drawing = False
+        self.object_types = []
+        self.has_math = False
+        self.has_math_para = False
+        self.has_hyperlink = False
+        self.hyperlink_anchors = []
+        self.has_sect_pr = False
+        self.page_break_before = False
+        self.spacing_before = False
+        self.runs = []
+
+    def add_field(self, instr: str):
+        words = instr.split()
+        if words:
+            self.field_types.append(words[0].upper())
+
+    def fld_char(self, kind: str | None):
+        if kind == "begin":
+            self.fields.append([[], False])
+        elif kind == "end" and not self.fields:
+            self.field_ends += 1
+        elif self.fields and kind in ("separate", "end"):
+            parts, done = self.fields[-1]
+            if not done:
+                self.add_field("".join(parts))
+                self.fields[-1][1] = True
+            if kind == "end":
+                self.fields.pop()
+
+    def freeze(self) -> ParagraphInfo:
+        # pole neukončené v tomto odstavci (obsah přes více odstavců)
+        for parts, done in self.fields:
+            if not done:
+                self.add_field("".join(parts))
+
+        return ParagraphInfo(
+            element=self.element,
+            index=self.index,
+            body_index=self.body_index,
+            nested=self.nested,
+            style_id=self.style_id,
+            level=self.level,
+            text=self.text,
+            instr_texts=tuple(self.instr_texts),
+            simple_fields=tuple(self.simple_fields),
+            field_types=tuple(self.field_types),
+            field_ends=self.field_ends,
+            field_starts=tuple("".join(parts) for parts, _ in self.fields),
+            has_fld_char=self.has_fld_char,
+            generated_by_field=self.generated_by_field,
+            has_drawing=self.has_drawing,
+            object_types=tuple(self.object_types),
+            has_math=self.has_math,
+            has_math_para=self.has_math_para,
+            has_hyperlink=self.has_hyperlink,
+            hyperlink_anchors=tuple(self.hyperlink_anchors),
+            has_sect_pr=self.has_sect_pr,
+            page_break_before=self.page_break_before,
+            spacing_before=self.spacing_before,
+            runs=tuple(self.runs),
+        )
+
+
+@dataclass
+class BlockInfo:
+    """Souhrn jednoho přímého potomka w:body (bez prvku samotného)."""
+    element: ET.Element
+    instr_texts: list[str] = field(default_factory=list)
+    simple_fields: list[str] = field(default_factory=list)
+    has_text: bool = False
+    has_bibliography: bool = False
+    paragraphs: range = range(0)  # indexy v WordModel.paragraphs
+
+
+@dataclass
+class SdtInfo:
+    element: ET.Element
+    is_bibliography: bool = False
+    is_citation: bool = False
+    bibliography_items: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class HeadingInfo:
+    """Položka osnovy dokumentu – odstavec s úrovní nadpisu."""
+    element: ET.Element
+    text: str
+    level: int
+    index: int  # pořadí v WordModel.paragraphs / mezi text:h
+    body_index: int | None = None  # jen nadpisy přímo v těle dokumentu
+    section: int | None = None
+    num_id: str | None = None  # číslování: přímé numPr, jinak ze stylu
+    num_level: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FieldEntry:
+    """Jedna položka obsahu nebo seznamu (odstavec uvnitř pole / rejstříku)."""
+    element: ET.Element
+    text: str  # viditelný text odkazu, bez něj celého odstavce
+    level: int | None = None  # z úrovně stylu položky (Obsah 2, Contents 2…)
+    has_link: bool = False
+    anchor: str | None = None
+    has_page_ref: bool = False  # pole PAGEREF (jen Word)
+
+
+@dataclass
+class FieldRegion:
+    """
+    Úsek dokumentu generovaný jedním polem přes více odstavců (TOC, seznam
+    obrázků či tabulek…), u ODT rejstřík (text:table-of-content…).
+    """
+    kind: str  # první slovo instrukce: TOC, SEQ, PAGEREF…
+    instruction: str = ""
+    element: ET.Element | None = None  # odstavec se začátkem pole / prvek rejstříku
+    caption: str | None = None  # \c "Obrázek", u ODT caption-sequence-name
+    levels: tuple[int, int] | None = None  # \o "1-3"
+    section: int | None = None
+    entries: list[FieldEntry] = field(default_factory=list)
+
+    @property
+    def is_toc(self) -> bool:
+        """Obsah nadpisů (TOC bez \\c)."""
+        return self.kind == "TOC" and self.caption is None
+
+
+def parse_field_region(instruction: str) -> FieldRegion:
+    """Druh pole a přepínače \\c a \\o z instrukce."""
+    instruction = instruction.strip()
+    words = instruction.split()
+    region = FieldRegion(words[0].upper() if words else "", instruction)
+
+    m = re.search(r'\\c\s+(?:"([^"]*)"|(\S+))', instruction)
+    if m:
+        region.caption = m.group(1) if m.group(1) is not None else m.group(2)
+
+    m = re.search(r'\\o\s+"\s*(\d+)\s*-\s*(\d+)\s*"', instruction)
+    if m:
+        region.levels = (int(m.group(1)), int(m.group(2)))
+
+    return region
+
+
+@dataclass
+class SectionInfo:
+    """Souhrn jednoho oddílu těla (přímí potomci w:body až po sectPr)."""
+    index: int
+    elements: list[ET.Element]
+    sect_pr: ET.Element | None = None
+    instr_texts: list[str] = field(default_factory=list)  # bez okrajových mezer
+    field_instructions: list[str] = field(default_factory=list)  # fldSimple, pak instrText
+    has_text: bool = False
+    has_bibliography: bool = False
+    has_toc: bool = False
+    has_list_of_figures: bool = False
+    has_list_of_tables: bool = False
+    headings: list[HeadingInfo] = field(default_factory=list)
+
+
+@dataclass
+class SectionRefs:
+    """Odkazy oddílu na záhlaví a zápatí podle jeho sectPr."""
+    sect_pr: ET.Element | None = None
+    header_ids: list[str] = field(default_factory=list)  # r:id v pořadí dokumentu
+    footer_ids: list[str] = field(default_factory=list)
+    headers: dict[str, str] = field(default_factory=dict)  # typ -> r:id
+    footers: dict[str, str] = field(default_factory=dict)
+    title_page: bool = False
+    page_number_start: str | None = None
+
+
+@dataclass
+class PartInfo:
+    """Souhrn části záhlaví nebo zápatí."""
+    has_text: bool = False
+    has_instr_text: bool = False
+    has_objects: bool = False  # kresby a rovnice
+    has_page_field: bool = False
+
+
+@dataclass
+class WordModel:
+    paragraphs: list[ParagraphInfo] = field(default_factory=list)
+    body_paragraphs: list[ParagraphInfo] = field(default_factory=list)
+    by_element: dict = field(default_factory=dict)
+    prev_non_empty: list[int | None] = field(default_factory=list)
+    next_non_empty: list[int | None] = field(default_factory=list)
+    blocks: dict = field(default_factory=dict)
+    tables: list[ET.Element] = field(default_factory=list)
+    sdts: list[SdtInfo] = field(default_factory=list)
+    instr_texts: list[str] = field(default_factory=list)
+
+
+class WordScanner:
+    """
+    Jeden průchod přes word/document.xml, ze kterého WordDocument
+    odpovídá na dotazy nad odstavci, objekty, poli a oddíly.
+    """
+
+    def __init__(self, style_level: Callable[[str], int | None]):
+        self._style_level = style_level
+        self._levels: dict[str, int | None] = {}
+
+    def scan(self, root: ET.Element) -> WordModel:
+        model = WordModel()
+
+        body = root.find(W_BODY)
+        if body is not None:
+            for el in body:
+                block = BlockInfo(el)
+                model.blocks[el] = block
+                first = len(model.paragraphs)
+                self._visit(el, model, block, [], [], top=True)
+                block.paragraphs = range(first, len(model.paragraphs))
+
+        self._freeze(model)
+        self._link_neighbours(model)
+        return model
+
+    def scan_element(self, el: ET.Element) -> ParagraphInfo:
+        """Souhrn libovolného prvku mimo document.xml (záhlaví, zápatí…)."""
+        model = WordModel()
+        info = self._open_paragraph(el, model, None)
+        open_paragraphs = [info]
+        block = BlockInfo(el)
+
+        for child in el:
+            self._visit(child, model, block, open_paragraphs, [])
+
+        self._close_paragraph(info, [])
+        return info.freeze()
+
+    def scan_block(self, el: ET.Element) -> BlockInfo:
+        """Souhrn prvku oddílu, který v modelu není."""
+        block = BlockInfo(el)
+        self._visit(el, WordModel(), block, [], [], top=True)
+        return block
+
+    def scan_part(self, root: ET.Element) -> PartInfo:
+        """Souhrn záhlaví / zápatí jedním průchodem."""
+        part = PartInfo()
+
+        for el in root.iter():
+            tag = el.tag
+            if tag == W_T:
+                if el.text and el.text.strip():
+                    part.has_text = True
+            elif tag == W_INSTRTEXT:
+                if el.text and el.text.strip():
+                    part.has_instr_text = True
+                if el.text and "PAGE" in el.text.upper():
+                    part.has_page_field = True
+            elif tag == W_FLDSIMPLE:
+                if "PAGE" in el.attrib.get(W_INSTR, "").upper():
+                    part.has_page_field = True
+            elif tag in (W_DRAWING, M_OMATH, M_OMATHPARA):
+                part.has_objects = True
+
+        return part
+
+    def _level(self, style_id: str) -> int | None:
+        if style_id not in self._levels:
+            self._levels[style_id] = self._style_level(style_id)
+        return self._levels[style_id]
+
+    def _open_paragraph(self, el, model: WordModel, body_index, nested=False) -> _ParagraphBuilder:
+        info = _ParagraphBuilder(el, len(model.paragraphs), body_index, nested)
+
+        ppr = el.find(W_PPR)
+        if ppr is not None:
+            ps = ppr.find(W_PSTYLE)
+            if ps is not None:
+                info.style_id = ps.attrib.get(W_VAL)
+            info.has_sect_pr = ppr.find(W_SECTPR) is not None
+            info.page_break_before = ppr.find(W_PAGEBREAKBEFORE) is not None
+
+            spacing = ppr.find(W_SPACING)
+            if spacing is not None:
+                before = spacing.attrib.get(W_BEFORE)
+                info.spacing_before = bool(before) and _twips(before) > 0
+
+        return info
+
+    def _close_paragraph(self, info: _ParagraphBuilder, sdts: list[SdtInfo]):
+        info.text = re.sub(r"\s+", " ", "".join(info.parts)).strip()
+        info.parts = None
+
+        if info.text:
+            if info.style_id:
+                info.level = self._level(info.style_id)
+
+            style = (info.style_id or "").lower()
+            if style in ("bibliografie", "bibliography"):
+                for sdt in sdts:
+                    if sdt.is_bibliography:
+                        sdt.bibliography_items += 1
+
+    def _freeze(self, model: WordModel):
+        model.paragraphs = [info.freeze() for info in model.paragraphs]
+        model.body_paragraphs = [model.paragraphs[info.index] for info in model.body_paragraphs]
+        model.by_element = {info.element: info for info in model.paragraphs}
+
+    def _visit(self, el, model: WordModel, block: BlockInfo, open_paragraphs, sdts, top=False):
+        tag = el.tag
+
+        if tag == W_P:
+            body_index = None
+            if top:
+                body_index = len(model.body_paragraphs) + 1
+
+            info = self._open_paragraph(el, model, body_index, bool(open_paragraphs))
+            model.paragraphs.append(info)
+            if top:
+                model.body_paragraphs.append(info)
+
+            open_paragraphs.append(info)
+            for child in el:
+                self._visit(child, model, block, open_paragraphs, sdts)
+            open_paragraphs.pop()
+
+            self._close_paragraph(info, sdts)
+            return
+
+        if tag == W_T:
+            if el.text:
+                for info in open_paragraphs:
+                    info.parts.append(el.text)
+                if el.text.strip():
+                    block.has_text = True
+            return
+
+        if tag == W_INSTRTEXT:
+            for info in open_paragraphs:
+                info.generated_by_field = True
+            if el.text:
+                for info in open_paragraphs:
+                    info.instr_texts.append(el.text)
+                    if info.fields:
+                        info.fields[-1][0].append(el.text)
+                model.instr_texts.append(el.text)
+                block.instr_texts.append(el.text.strip())
+            return
+
+        if tag == W_R:
+            run = self._run_info(el)
+            for info in open_paragraphs:
+                info.runs.append(run)
+
+        elif tag == W_FLDSIMPLE:
+            instr = el.attrib.get(W_INSTR)
+            if instr:
+                for info in open_paragraphs:
+                    info.simple_fields.append(instr)
+                    info.add_field(instr)
+                block.simple_fields.append(instr.strip())
+
+        elif tag == W_FLDCHAR:
+            kind = el.attrib.get(W_FLDCHARTYPE)
+            for info in open_paragraphs:
+                info.has_fld_char = True
+                info.generated_by_field = True
+                info.fld_char(kind)
+
+        elif tag == W_HYPERLINK:
+            anchor = el.attrib.get(W_ANCHOR)
+            for info in open_paragraphs:
+                info.has_hyperlink = True
+                if anchor:
+                    info.hyperlink_anchors.append(anchor)
+
+        elif tag == W_DRAWING:
+            obj_type = None
+            gd = el.find(ALL_A_GRAPHICDATA)
+            if gd is not None:
+                uri = gd.attrib.get("uri", "")
+                if "picture" in uri:
+                    obj_type = "image"
+                elif "chart" in uri:
+                    obj_type = "chart"
+
+            for info in open_paragraphs:
+                info.has_drawing = True
+                if obj_type:
+                    info.object_types.append(obj_type)
+
+        elif tag == M_OMATH:
+            for info in open_paragraphs:
+                info.has_math = True
+
+        elif tag == M_OMATHPARA:
+            for info in open_paragraphs:
+                info.has_math_para = True
+
+        elif tag == W_TBL:
+            model.tables.append(el)
+
+        elif tag == W_SDT:
+            sdt = SdtInfo(el)
+            sdt_pr = el.find(W_SDTPR)
+            if sdt_pr is not None:
+                sdt.is_bibliography = sdt_pr.find(W_BIBLIOGRAPHY) is not None
+                sdt.is_citation = sdt_pr.find(W_CITATION) is not None
+            model.sdts.append(sdt)
+
+            # findall(".//w:sdt") nad prvkem oddílu nezahrnuje prvek samotný
+            if not top and sdt.is_bibliography:
+                block.has_bibliography = True
+
+            sdts.append(sdt)
+            for child in el:
+                self._visit(child, model, block, open_paragraphs, sdts)
+            sdts.pop()
+            return
+
+        for child in el:
+            self._visit(child, model, block, open_paragraphs, sdts)
+
+    def _run_info(self, r: ET.Element) -> RunInfo:
+        text = "".join(t.text for t in r.findall(W_T) if t.text)
+
+        rpr = r.find(W_RPR)
+        if rpr is None:
+            return RunInfo(r, text)
+
+        return RunInfo(
+            r,
+            text,
+            has_rpr=True,
+            has_style=rpr.find(W_RSTYLE) is not None,
+            bold=_is_enabled(rpr.find(W_B)) or _is_enabled(rpr.find(W_BCS)),
+            italic=_is_enabled(rpr.find(W_I)) or _is_enabled(rpr.find(W_ICS)),
+            has_size=rpr.find(W_SZ) is not None,
+            has_font=rpr.find(W_RFONTS) is not None,
+            has_color=rpr.find(W_COLOR) is not None,
+        )
+
+    def _link_neighbours(self, model: WordModel):
+        last = None
+        for info in model.paragraphs:
+            model.prev_non_empty.append(last)
+            if info.text:
+                last = info.index
+
+        following = None
+        model.next_non_empty = [None] * len(model.paragraphs)
+        for info in reversed(model.paragraphs):
+            model.next_non_empty[info.index] = following
+            if info.text:
+                following = info.index
@@ -1,21 +1,44 @@
-from pathlib import Path
+from functools import cached_property
 import re
-import zipfile
 import xml.etree.ElementTree as ET
 from assignment.word.word_assignment_model import StyleSpec
-import xml.dom.minidom as minidom
 import xml.etree.ElementTree as ET
 
+from document import xml_backend
+from document.archive import Archive
+from document.qnames import (
+    ALL_STYLE_DEFAULT_STYLE, ALL_STYLE_MASTER_PAGE, ALL_STYLE_STYLE, ALL_TEXT_H,
+    ALL_TEXT_OUTLINE_STYLE, ALL_TEXT_P, ALL_TEXT_PAGE_NUMBER, ALL_TEXT_SPAN,
+    ALL_TEXT_TABLE_OF_CONTENT, FO_BREAK_BEFORE, FO_COLOR, FO_FONT_SIZE, FO_FONT_STYLE,
+    FO_FONT_WEIGHT, FO_LINE_HEIGHT, FO_MARGIN_TOP, FO_NS, FO_TEXT_ALIGN,
+    FO_TEXT_TRANSFORM, LOEXT_NS, LOEXT_NUM_LIST_FORMAT, OFFICE_TEXT, STYLE_DEFAULT_OUTLINE_LEVEL,
+    STYLE_DISPLAY_NAME, STYLE_FONT_NAME, STYLE_FONT_STYLE_NAME, STYLE_FOOTER,
+    STYLE_HEADER, STYLE_MASTER_PAGE_NAME, STYLE_NAME, STYLE_NS, STYLE_NUM_FORMAT,
+    STYLE_PAGE_LAYOUT_NAME, STYLE_PAGE_LAYOUT_PROPERTIES, STYLE_PAGE_NUMBER,
+    STYLE_PARAGRAPH_PROPERTIES, STYLE_PARENT_STYLE_NAME, STYLE_POSITION,
+    STYLE_TAB_STOP, STYLE_TAB_STOPS, STYLE_TEXT_PROPERTIES, STYLE_TYPE, TEXT_C,
+    TEXT_A, TEXT_BIBLIOGRAPHY, TEXT_CAPTION_SEQUENCE_NAME, TEXT_DISPLAY_OUTLINE_LEVEL,
+    TEXT_H, TEXT_ILLUSTRATION_INDEX, TEXT_ILLUSTRATION_INDEX_SOURCE, TEXT_INDEX_BODY, TEXT_LEVEL,
+    TEXT_LINE_BREAK, TEXT_NS, TEXT_NUM_LIST_FORMAT, TEXT_OUTLINE_LEVEL,
+    TEXT_OUTLINE_LEVEL_STYLE, TEXT_OUTLINE_STYLE, TEXT_P, TEXT_S, TEXT_STYLE_NAME,
+    TEXT_TAB, TEXT_TABLE_INDEX, TEXT_TABLE_INDEX_SOURCE, TEXT_TABLE_OF_CONTENT,
+    TEXT_TABLE_OF_CONTENT_ENTRY_TEMPLATE, TEXT_TABLE_OF_CONTENT_SOURCE, TEXT_TRACKED_CHANGES,
+    XLINK_HREF,
+)
+from document.media import ImageInfo
 from document.text_document import TextDocument
+from document.word_model import FieldEntry, FieldRegion, HeadingInfo, ParagraphInfo
 
 
 class WriterDocument(TextDocument):
+    DEBUG_DIR = "debug_writer_xml"
+    DEBUG_PARTS = ("content.xml", "styles.xml")
 
     NS = {
-        "text":  "urn:oasis:names:tc:opendocument:xmlns:text:1.0",
-        "style": "urn:oasis:names:tc:opendocument:xmlns:style:1.0",  
-        "fo": "urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0",
-        "loext": "urn:org:documentfoundation:names:experimental:office:xmlns:loext:1.0",
+        "text":  TEXT_NS,
+        "style": STYLE_NS,  
+        "fo": FO_NS,
+        "loext": LOEXT_NS,
     }
     COVER_STYLES = {
                 "desky-fakulta": [
@@ -39,98 +62,105 @@ class WriterDocument(TextDocument):
 
     def __init__(self, path: str):
         self.path = path
-        self._zip = zipfile.ZipFile(path)
-        self.content = self._load("content.xml")
-        self.styles = self._load("styles.xml")
-    
-        
+        self._archive = Archive(path)
+        self._style_chains = {}
+        self._style_specs = {}
+        self._media_infos = {}
+
+    # části balíku se načítají až při prvním použití
+    @cached_property
+    def content(self) -> ET.Element:
+        return self._load("content.xml")
+
+    @cached_property
+    def styles(self) -> ET.Element:
+        return self._load("styles.xml")
+
+    def preload(self):
+        self.content
+        self.styles
+        self._style_index
+        self._paragraph_infos
+        self._outline
+        self._field_regions
+        self._page_sections
 
     def _load(self, name):
-        with self._zip.open(name) as f:
-            return ET.fromstring(f.read())
-        
-    def save_xml(self, out_dir: str | Path = "debug_writer_xml"):
-        out_dir = Path(out_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        self._save_pretty_xml(self.content, out_dir / "content.xml")
-        self._save_pretty_xml(self.styles, out_dir / "styles.xml")
-
-    def _save_pretty_xml(self, root: ET.Element, path: Path):
-        rough_string = ET.tostring(root, encoding="utf-8")
-        reparsed = minidom.parseString(rough_string)
-        pretty = reparsed.toprettyxml(indent="  ", encoding="utf-8")
-
-        with open(path, "wb") as f:
-            f.write(pretty)
+        with self._archive.open(name) as f:
+            return xml_backend.parse(f)
         
-    def _find_style(self, name: str):
+    @cached_property
+    def _style_index(self) -> dict[str, ET.Element]:
+        """
+        Název i zobrazovaný název stylu (malými písmeny) -> první odpovídající
+        style:style, ve stejném pořadí, v jakém se styly dříve prohledávaly.
+        """
+        index = {}
         for root in (self.styles, self.content):
-            for style in root.findall(".//style:style", self.NS):
-
-                internal = style.attrib.get(f"{{{self.NS['style']}}}name", "").lower()
-                if internal == name.lower():
-                    return style
+            for style in root.findall(ALL_STYLE_STYLE):
+                index.setdefault(style.attrib.get(STYLE_NAME, "").lower(), style)
+                index.setdefault(style.attrib.get(STYLE_DISPLAY_NAME, "").lower(), style)
+        return index
 
-                display = style.attrib.get(f"{{{self.NS['style']}}}display-name", "")
-                if display.lower() == name.lower():
-                    return style
-
-        return None
+    def _find_style(self, name: str):
+        return self._style_index.get(name.lower())
         
     def _build_style_spec(self, style, *, default_alignment=None) -> StyleSpec:
-        para_props = style.find("style:paragraph-properties", self.NS)
+        key = (style, default_alignment)
+        spec = self._style_specs.get(key)
+        if spec is None:
+            spec = self._create_style_spec(style, default_alignment=default_alignment)
+            self._style_specs[key] = spec
+        return spec
 
-        font = self._resolve_font_name(style)
+    def _create_style_spec(self, style, *, default_alignment=None) -> StyleSpec:
+        para_props = style.find(STYLE_PARAGRAPH_PROPERTIES)
+        props = self._resolve_style_properties(style)
 
-        size = self._resolve_font_size_pt(style)
-        bold = self._resolve_bold(style)
+        font = props.get("font-name")
+
+        size = self._parse_font_size_pt(props.get("font-size"))
+        bold = props.get("bold", False)
 
         italic = False
-        fs = self._resolve_text_prop(style, f"{{{self.NS['fo']}}}font-style")
+        fs = props.get("font-style")
         if fs is not None:
             italic = (fs.lower() == "italic")
 
         alignment = default_alignment
         if para_props is not None:
-            alignment = para_props.attrib.get(f"{{{self.NS['fo']}}}text-align", default_alignment)
+            alignment = para_props.attrib.get(FO_TEXT_ALIGN, default_alignment)
         
         if alignment and alignment.lower() == "justify":
             alignment = "both"
 
-        color_val = self._resolve_text_prop(style, f"{{{self.NS['fo']}}}color")
+        color_val = props.get("color")
         if color_val is None:
             color = "000000"
         else:
             color = color_val.lstrip("#").upper()
 
-        text_transform = self._resolve_text_prop(
-            style,
-            f"{{{self.NS['fo']}}}text-traself.nsform"
-        )
+        text_transform = props.get("text-transform")
 
         all_caps = (text_transform == "uppercase")
 
-        based_on = style.attrib.get(f"{{{self.NS['style']}}}parent-style-name")
+        based_on = style.attrib.get(STYLE_PARENT_STYLE_NAME)
 
-        mt = self._resolve_paragraph_prop(
-            style,
-            f"{{{self.NS['fo']}}}margin-top"
-        )
+        mt = props.get("margin-top")
         space_before = self._cm_to_twips(mt) if mt else None
 
-        tabs = self._resolve_tabs(style)
+        tabs = props.get("tabs")
 
         page_break_before = None
         if para_props is not None:
-            br = para_props.attrib.get(f"{{{self.NS['fo']}}}break-before")
+            br = para_props.attrib.get(FO_BREAK_BEFORE)
             if br == "page":
                 page_break_before = True
             elif br is not None:
                 page_break_before = False
 
         outline_level = style.attrib.get(
-            f"{{{self.NS['style']}}}default-outline-level"
+            STYLE_DEFAULT_OUTLINE_LEVEL
         )
 
         num_level = None
@@ -140,10 +170,10 @@ class WriterDocument(TextDocument):
             except ValueError:
                 num_level = None
 
-        line_height = self._resolve_line_height(style)
+        line_height = self._parse_line_height(props.get("line-height"))
 
         return StyleSpec(
-            name=style.attrib.get(f"{{{self.NS['style']}}}name"),
+            name=style.attrib.get(STYLE_NAME),
             font=font,
             size=size,
             bold=bold,
@@ -158,13 +188,76 @@ class WriterDocument(TextDocument):
             numLevel=num_level,
             lineHeight=line_height,
         )
-    
-    def _resolve_line_height(self, style_el) -> float | None:
-        val = self._resolve_paragraph_prop(
-            style_el,
-            f"{{{self.NS['fo']}}}line-height"
-        )
 
+    def _style_chain(self, style_el: ET.Element) -> list[ET.Element]:
+        chain = self._style_chains.get(style_el)
+        if chain is not None:
+            return chain
+
+        chain = []
+        current = style_el
+        while current is not None and current not in chain:
+            chain.append(current)
+
+            parent_name = self._get_parent_style_name(current)
+            if not parent_name:
+                break
+            current = self._find_style(parent_name)
+
+        self._style_chains[style_el] = chain
+        return chain
+
+    def _resolve_style_properties(self, style_el: ET.Element) -> dict:
+        """
+        Projde řetězec parent-style-name jednou a vrátí první nalezenou
+        hodnotu každé vlastnosti.
+        """
+        text_attrs = {
+            "font-name": STYLE_FONT_NAME,
+            "font-size": FO_FONT_SIZE,
+            "font-style": FO_FONT_STYLE,
+            "color": FO_COLOR,
+            "text-transform": FO_TEXT_TRANSFORM,
+        }
+        paragraph_attrs = {
+            "margin-top": FO_MARGIN_TOP,
+            "line-height": FO_LINE_HEIGHT,
+        }
+        props = {}
+
+        for st in self._style_chain(style_el):
+            tp = st.find(STYLE_TEXT_PROPERTIES)
+            if tp is not None:
+                for key, qname in text_attrs.items():
+                    if key not in props:
+                        val = tp.attrib.get(qname)
+                        if val is not None:
+                            props[key] = val
+
+                if "bold" not in props:
+                    fw = tp.attrib.get(FO_FONT_WEIGHT)
+                    fsn = tp.attrib.get(STYLE_FONT_STYLE_NAME)
+                    if fw is not None:
+                        props["bold"] = fw.lower() == "bold"
+                    elif fsn is not None and "bold" in fsn.lower():
+                        props["bold"] = True
+
+            pp = st.find(STYLE_PARAGRAPH_PROPERTIES)
+            if pp is not None:
+                for key, qname in paragraph_attrs.items():
+                    if key not in props:
+                        val = pp.attrib.get(qname)
+                        if val is not None:
+                            props[key] = val
+
+                if "tabs" not in props:
+                    tabs_el = pp.find(STYLE_TAB_STOPS)
+                    if tabs_el is not None:
+                        props["tabs"] = self._parse_tab_stops(tabs_el)
+
+        return props
+
+    def _parse_line_height(self, val: str | None) -> float | None:
         if not val:
             return None
 
@@ -196,11 +289,11 @@ class WriterDocument(TextDocument):
     
     def get_doc_default_font_size(self) -> int | None:
         for root in (self.styles, self.content):
-            default = root.find(".//style:default-style", self.NS)
+            default = root.find(ALL_STYLE_DEFAULT_STYLE)
             if default is not None:
-                tp = default.find("style:text-properties", self.NS)
+                tp = default.find(STYLE_TEXT_PROPERTIES)
                 if tp is not None:
-                    fs = tp.attrib.get(f"{{{self.NS['fo']}}}font-size")
+                    fs = tp.attrib.get(FO_FONT_SIZE)
                     if fs and fs.endswith("pt"):
                         return int(float(fs.replace("pt", "")))
         return None
@@ -213,53 +306,9 @@ class WriterDocument(TextDocument):
         )
     
     def _get_parent_style_name(self, style_el: ET.Element) -> str | None:
-        return style_el.attrib.get(f"{{{self.NS['style']}}}parent-style-name")
+        return style_el.attrib.get(STYLE_PARENT_STYLE_NAME)
     
-    def _resolve_text_prop(self, style_el: ET.Element, attr_qname: str) -> str | None:
-        visited = set()
-
-        while style_el is not None and id(style_el) not in visited:
-            visited.add(id(style_el))
-
-            tp = style_el.find("style:text-properties", self.NS)
-            if tp is not None:
-                val = tp.attrib.get(attr_qname)
-                if val is not None:
-                    return val
-
-            parent_name = self._get_parent_style_name(style_el)
-            if not parent_name:
-                break
-
-            style_el = self._find_style(parent_name)
-
-        return None
-    
-    def _resolve_bold(self, style_el: ET.Element) -> bool:
-        visited = set()
-
-        while style_el is not None and id(style_el) not in visited:
-            visited.add(id(style_el))
-
-            tp = style_el.find("style:text-properties", self.NS)
-            if tp is not None:
-                fw = tp.attrib.get(f"{{{self.NS['fo']}}}font-weight")
-                if fw is not None:
-                    return fw.lower() == "bold"
-
-                fsn = tp.attrib.get(f"{{{self.NS['style']}}}font-style-name")
-                if fsn is not None and "bold" in fsn.lower():
-                    return True
-
-            parent_name = self._get_parent_style_name(style_el)
-            if not parent_name:
-                break
-            style_el = self._find_style(parent_name)
-
-        return False
-    
-    def _resolve_font_size_pt(self, style_el: ET.Element) -> int | None:
-        val = self._resolve_text_prop(style_el, f"{{{self.NS['fo']}}}font-size")
+    def _parse_font_size_pt(self, val: str | None) -> int | None:
         if not val:
             return None
 
@@ -272,66 +321,24 @@ class WriterDocument(TextDocument):
 
         return None
     
-    def _resolve_paragraph_prop(self, style_el, attr_qname):
-        visited = set()
-
-        while style_el is not None and id(style_el) not in visited:
-            visited.add(id(style_el))
-
-            pp = style_el.find("style:paragraph-properties", self.NS)
-            if pp is not None:
-                val = pp.attrib.get(attr_qname)
-                if val is not None:
-                    return val
-
-            parent = self._get_parent_style_name(style_el)
-            if not parent:
-                break
-            style_el = self._find_style(parent)
-
-        return None
-    
     def _cm_to_twips(self, cm: str) -> int | None:
         try:
             return int(float(cm.replace("cm", "")) * 567)
         except Exception:
             return None
-        
-    def _resolve_font_name(self, style_el: ET.Element) -> str | None:
-        val = self._resolve_text_prop(
-            style_el,
-            f"{{{self.NS['style']}}}font-name"
-        )
-        return val
     
-    def _resolve_tabs(self, style_el: ET.Element) -> list[tuple[str, int]] | None:
-        visited = set()
-
-        while style_el is not None and id(style_el) not in visited:
-            visited.add(id(style_el))
-
-            para = style_el.find("style:paragraph-properties", self.NS)
-            if para is not None:
-                tabs_el = para.find("style:tab-stops", self.NS)
-                if tabs_el is not None:
-                    tabs = []
-                    for t in tabs_el.findall("style:tab-stop", self.NS):
-                        pos = t.attrib.get(f"{{{self.NS['style']}}}position")
-                        typ = t.attrib.get(f"{{{self.NS['style']}}}type", "left")
-
-                        if pos and pos.endswith("cm"):
-                            cm = float(pos.replace("cm", ""))
-                            twips = int(round(cm * 567))
-                            tabs.append((typ, twips))
-
-                    return tabs if tabs else None
-
-            parent = self._get_parent_style_name(style_el)
-            if not parent:
-                break
-            style_el = self._find_style(parent)
-
-        return None
+    def _parse_tab_stops(self, tabs_el: ET.Element) -> list[tuple[str, int]] | None:
+        tabs = []
+        for t in tabs_el.findall(STYLE_TAB_STOP):
+            pos = t.attrib.get(STYLE_POSITION)
+            typ = t.attrib.get(STYLE_TYPE, "left")
+
+            if pos and pos.endswith("cm"):
+                cm = float(pos.replace("cm", ""))
+                twips = int(round(cm * 567))
+                tabs.append((typ, twips))
+
+        return tabs if tabs else None
     
     def get_style_parent(self, style_name: str) -> str | None:
         style_el = self._find_style(style_name)
@@ -347,8 +354,8 @@ class WriterDocument(TextDocument):
     def get_used_paragraph_styles(self) -> set[str]:
         used = set()
 
-        for p in self.content.findall(".//text:p", self.NS):
-            style_name = p.attrib.get(f"{{{self.NS['text']}}}style-name")
+        for p in self.content.findall(ALL_TEXT_P):
+            style_name = p.attrib.get(TEXT_STYLE_NAME)
             if style_name:
                 used.add(style_name)
 
@@ -381,12 +388,12 @@ class WriterDocument(TextDocument):
             if root is None:
                 continue
 
-            outline = root.find(".//text:outline-style", self.NS)
+            outline = root.find(ALL_TEXT_OUTLINE_STYLE)
             if outline is not None:
                 return outline
 
             outline = root.find(
-                f"{{{self.NS['text']}}}outline-style"
+                TEXT_OUTLINE_STYLE
             )
             if outline is not None:
                 return outline
@@ -394,31 +401,39 @@ class WriterDocument(TextDocument):
         return None
 
 
-    def get_heading_numbering_info(self, level: int):
+    @cached_property
+    def _outline_levels(self) -> dict[str, tuple[bool, bool, int | None]]:
+        """Číslování úrovní nadpisů z text:outline-style, podle text:level."""
+        levels = {}
         outline = self._find_outline_style()
         if outline is None:
-            return False, False, None
+            return levels
 
-        lvl = outline.find(
-            f".//{{{self.NS['text']}}}outline-level-style[@{{{self.NS['text']}}}level='{level}']"
-        )
-        if lvl is None:
-            return False, False, None
+        for lvl in outline.iter(TEXT_OUTLINE_LEVEL_STYLE):
+            key = lvl.attrib.get(TEXT_LEVEL)
+            if key in levels or not key or not key.isdigit():
+                continue
 
-        num_format = lvl.attrib.get(f"{{{self.NS['style']}}}num-format")
-        if not num_format:
-            return False, False, None
+            num_format = lvl.attrib.get(STYLE_NUM_FORMAT)
+            if not num_format:
+                levels[key] = (False, False, None)
+                continue
 
-        num_list = (
-            lvl.attrib.get(f"{{{self.NS['loext']}}}num-list-format")
-            or lvl.attrib.get(f"{{{self.NS['text']}}}num-list-format")
-            or ""
-        )
+            num_list = (
+                lvl.attrib.get(LOEXT_NUM_LIST_FORMAT)
+                or lvl.attrib.get(TEXT_NUM_LIST_FORMAT)
+                or ""
+            )
 
-        required = [f"%{i}%" for i in range(1, level + 1)]
-        is_hierarchical = all(r in num_list for r in required)
+            level = int(key)
+            required = [f"%{i}%" for i in range(1, level + 1)]
+            is_hierarchical = all(r in num_list for r in required)
+            levels[key] = (True, is_hierarchical, level - 1)
 
-        return True, is_hierarchical, level - 1
+        return levels
+
+    def get_heading_numbering_info(self, level: int):
+        return self._outline_levels.get(str(level), (False, False, None))
     
     def get_heading_outline_level(self, level: int) -> int | None:
         """
@@ -428,7 +443,7 @@ class WriterDocument(TextDocument):
         if style is None:
             return None
 
-        val = style.attrib.get(f"{{{self.NS['style']}}}default-outline-level")
+        val = style.attrib.get(STYLE_DEFAULT_OUTLINE_LEVEL)
         if not val:
             return None
 
@@ -438,15 +453,12 @@ class WriterDocument(TextDocument):
             return None
         
 
-    def iter_headings(self) -> list[tuple[str, int]]:
-        items = []
-
-        for p in self.content.findall(".//text:h", self.NS):
-            txt = "".join(p.itertext()).strip()
-            if not txt:
-                continue
-
-            lvl = p.attrib.get(f"{{{self.NS['text']}}}outline-level")
+    @cached_property
+    def _outline(self) -> list[HeadingInfo]:
+        """Osnova: text:h s platnou úrovní v pořadí dokumentu."""
+        outline = []
+        for index, h in enumerate(self.content.findall(ALL_TEXT_H)):
+            lvl = h.attrib.get(TEXT_OUTLINE_LEVEL)
             if not lvl:
                 continue
 
@@ -455,21 +467,34 @@ class WriterDocument(TextDocument):
             except ValueError:
                 continue
 
-            items.append((txt, level))
+            _, _, num_level = self.get_heading_numbering_info(level)
+            outline.append(HeadingInfo(
+                element=h,
+                text="".join(h.itertext()).strip(),
+                level=level,
+                index=index,
+                num_level=num_level,
+            ))
 
-        return items
+        return outline
+
+    def heading_outline(self) -> list[HeadingInfo]:
+        return self._outline
+
+    def iter_headings(self) -> list[tuple[str, int]]:
+        return [(h.text, h.level) for h in self._outline if h.text]
     
     def find_inline_formatting(self) -> list[dict]:
         results = []
 
-        for p in self.content.findall(".//text:p", self.NS):
+        for p in self.content.findall(ALL_TEXT_P):
 
-            for span in p.findall(".//text:span", self.NS):
+            for span in p.findall(ALL_TEXT_SPAN):
                 span_text = "".join(span.itertext()).strip()
                 if not span_text:
                     continue
 
-                span_style_name = span.attrib.get(f"{{{self.NS['text']}}}style-name")
+                span_style_name = span.attrib.get(TEXT_STYLE_NAME)
                 if not span_style_name:
                     continue
 
@@ -477,29 +502,29 @@ class WriterDocument(TextDocument):
                 if span_style is None:
                     continue
 
-                tp = span_style.find("style:text-properties", self.NS)
+                tp = span_style.find(STYLE_TEXT_PROPERTIES)
                 if tp is None:
                     continue
 
-                if tp.attrib.get(f"{{{self.NS['fo']}}}font-weight") == "bold":
+                if tp.attrib.get(FO_FONT_WEIGHT) == "bold":
                     results.append({
                         "text": span_text,
                         "problem": "tučné písmo",
                     })
 
-                if tp.attrib.get(f"{{{self.NS['fo']}}}font-style") == "italic":
+                if tp.attrib.get(FO_FONT_STYLE) == "italic":
                     results.append({
                         "text": span_text,
                         "problem": "kurzíva",
                     })
 
-                if f"{{{self.NS['fo']}}}font-size" in tp.attrib:
+                if FO_FONT_SIZE in tp.attrib:
                     results.append({
                         "text": span_text,
                         "problem": "změna velikosti písma",
                     })
 
-                if f"{{{self.NS['fo']}}}color" in tp.attrib:
+                if FO_COLOR in tp.attrib:
                     results.append({
                         "text": span_text,
                         "problem": "změna barvy",
@@ -509,14 +534,13 @@ class WriterDocument(TextDocument):
     
 
     def iter_main_headings(self):
-        for h in self.content.findall(".//text:h", self.NS):
-            lvl = h.attrib.get(f"{{{self.NS['text']}}}outline-level")
-            if lvl == "1":
-                yield h
+        for heading in self._outline:
+            if heading.level == 1:
+                yield heading.element
 
 
     def heading_starts_on_new_page(self, h) -> bool:
-        style_name = h.attrib.get(f"{{{self.NS['text']}}}style-name")
+        style_name = h.attrib.get(TEXT_STYLE_NAME)
         if not style_name:
             return False
 
@@ -524,14 +548,28 @@ class WriterDocument(TextDocument):
         if style is None:
             return False
 
-        pprops = style.find("style:paragraph-properties", self.NS)
+        pprops = style.find(STYLE_PARAGRAPH_PROPERTIES)
         if pprops is None:
             return False
 
-        return pprops.attrib.get(f"{{{self.NS['fo']}}}break-before") == "page"
+        return pprops.attrib.get(FO_BREAK_BEFORE) == "page"
     
     def get_visible_text(self, element) -> str:
         return "".join(element.itertext()).strip()
+
+    def image_info(self, href: str) -> ImageInfo | None:
+        """Rozměry obrázku podle xlink:href z draw:image (Pictures/…)."""
+        if not href or "://" in href:
+            return None
+        return self.media_info(href.removeprefix("./"))
+
+    def iter_pictures(self) -> list[tuple[str, ImageInfo | None]]:
+        """Všechny obrázky v Pictures/ s jejich rozměry."""
+        return [
+            (name, self.media_info(name))
+            for name in self._archive.names()
+            if name.startswith("Pictures/") and not name.endswith("/")
+        ]
     
     
 
@@ -544,29 +582,84 @@ class WriterDocument(TextDocument):
                 parts.append(el.text)
 
             # <text:s text:c="N"/>
-            if el.tag == f"{{{self.NS['text']}}}s":
-                c = el.attrib.get(f"{{{self.NS['text']}}}c")
+            if el.tag == TEXT_S:
+                c = el.attrib.get(TEXT_C)
                 parts.append(" " * (int(c) if c and c.isdigit() else 1))
 
             # <text:tab/>
-            elif el.tag == f"{{{self.NS['text']}}}tab":
+            elif el.tag == TEXT_TAB:
                 parts.append("\t")
 
         return "".join(parts)
 
     def paragraph_is_toc(self, p) -> bool:
-        style = p.attrib.get(f"{{{self.NS['text']}}}style-name", "").lower()
+        style = p.attrib.get(TEXT_STYLE_NAME, "").lower()
         return "toc" in style or "obsah" in style
     
     def iter_paragraphs(self):
-        return self.content.findall(".//text:p", self.NS)
+        return [info.element for info in self._paragraph_infos]
+
+    @cached_property
+    def _paragraph_infos(self) -> list[ParagraphInfo]:
+        infos = []
+        paragraph_styles = {}
+        for p in self.content.findall(ALL_TEXT_P):
+            infos.append(self._build_paragraph_info(p, len(infos), paragraph_styles))
+        return infos
+
+    @cached_property
+    def _paragraph_info_index(self) -> dict:
+        return {info.element: info for info in self._paragraph_infos}
+
+    def paragraph_info(self, p) -> ParagraphInfo:
+        info = self._paragraph_info_index.get(p)
+        if info is None:
+            info = self._build_paragraph_info(p, -1, {})
+        return info
+
+    def iter_paragraph_infos(self) -> list[ParagraphInfo]:
+        """Souhrny všech text:p v pořadí dokumentu (jako iter_paragraphs)."""
+        return self._paragraph_infos
+
+    def _build_paragraph_info(self, p, index: int, paragraph_styles: dict) -> ParagraphInfo:
+        style_name = p.attrib.get(TEXT_STYLE_NAME)
+
+        # zalomení a mezera před odstavcem jsou v ODT jen ve stylu
+        flags = paragraph_styles.get(style_name)
+        if flags is None:
+            flags = self._paragraph_style_flags(style_name or "bez stylu")
+            paragraph_styles[style_name] = flags
+
+        level = p.attrib.get(TEXT_OUTLINE_LEVEL)
+
+        return ParagraphInfo(
+            element=p,
+            index=index,
+            style_id=style_name,
+            level=int(level) if level and level.isdigit() else None,
+            text=self.paragraph_text(p),
+            page_break_before=flags[0],
+            spacing_before=flags[1],
+        )
+
+    def _paragraph_style_flags(self, style_name: str) -> tuple[bool, bool]:
+        style = self._find_style(style_name)
+        if style is None:
+            return False, False
+
+        pp = style.find(STYLE_PARAGRAPH_PROPERTIES)
+        if pp is None:
+            return False, False
+
+        mt = pp.attrib.get(FO_MARGIN_TOP)
+        return pp.attrib.get(FO_BREAK_BEFORE) == "page", mt is not None and mt != "0cm"
     
     def paragraph_is_empty(self, p) -> bool:
-        return not self.paragraph_text(p).strip()
+        return self.paragraph_info(p).is_empty
 
 
     def paragraph_has_text(self, p) -> bool:
-        return bool(self.paragraph_text(p).strip())
+        return not self.paragraph_info(p).is_empty
 
 
     def paragraph_text(self, p) -> str:
@@ -574,21 +667,14 @@ class WriterDocument(TextDocument):
 
 
     def paragraph_style_name(self, p) -> str:
-        return p.attrib.get(f"{{{self.NS['text']}}}style-name", "bez stylu")
+        return p.attrib.get(TEXT_STYLE_NAME, "bez stylu")
 
 
     def paragraph_has_spacing_before(self, p) -> bool:
-        style_name = self.paragraph_style_name(p)
-        style = self._find_style(style_name)
-        if style is None:
-            return False
+        return self.paragraph_info(p).spacing_before
 
-        pp = style.find("style:paragraph-properties", self.NS)
-        if pp is None:
-            return False
-
-        mt = pp.attrib.get(f"{{{self.NS['fo']}}}margin-top")
-        return mt is not None and mt != "0cm"
+    def paragraph_is_heading(self, p) -> bool:
+        return self.paragraph_info(p).is_heading
     
     def _odt_text_with_specials(self, el) -> str:
         out = []
@@ -598,14 +684,14 @@ class WriterDocument(TextDocument):
                 out.append(node.text)
 
             for ch in list(node):
-                if ch.tag == f"{{{self.NS['text']}}}s":
-                    c = ch.attrib.get(f"{{{self.NS['text']}}}c")
+                if ch.tag == TEXT_S:
+                    c = ch.attrib.get(TEXT_C)
                     out.append(" " * (int(c) if c and c.isdigit() else 1))
 
-                elif ch.tag == f"{{{self.NS['text']}}}tab":
+                elif ch.tag == TEXT_TAB:
                     out.append("\t")
 
-                elif ch.tag == f"{{{self.NS['text']}}}line-break":
+                elif ch.tag == TEXT_LINE_BREAK:
                     out.append("\n")
 
                 else:
@@ -618,7 +704,7 @@ class WriterDocument(TextDocument):
         return "".join(out)
     
     def _paragraph_is_toc_or_object_list(self, p) -> bool:
-        style = p.attrib.get(f"{{{self.NS['text']}}}style-name", "").lower()
+        style = p.attrib.get(TEXT_STYLE_NAME, "").lower()
 
         if any(x in style for x in ("toc", "obsah", "seznam")):
             return True
@@ -629,7 +715,7 @@ class WriterDocument(TextDocument):
         return False
     
     def paragraph_has_page_break(self, p) -> bool:
-        return False
+        return self.paragraph_info(p).page_break_before
     
     #---------------------------
     def get_writer_list_level(self, style_name: str) -> int | None:
@@ -669,13 +755,104 @@ class WriterDocument(TextDocument):
         return self._build_style_spec(style)
     
     def toc_shows_numbers(self) -> bool | None:
-        toc = self.content.find(".//text:table-of-content", self.NS)
+        toc = self.content.find(ALL_TEXT_TABLE_OF_CONTENT)
         if toc is None:
             return None
 
-        lvl = toc.attrib.get(f"{{{self.NS['text']}}}display-outline-level")
+        lvl = toc.attrib.get(TEXT_DISPLAY_OUTLINE_LEVEL)
         return bool(lvl)
     
+    # rejstřík -> (prvek se zdrojem, atribut s popiskem)
+    INDEX_SOURCES = {
+        TEXT_TABLE_OF_CONTENT: (TEXT_TABLE_OF_CONTENT_SOURCE, None),
+        TEXT_ILLUSTRATION_INDEX: (TEXT_ILLUSTRATION_INDEX_SOURCE, TEXT_CAPTION_SEQUENCE_NAME),
+        TEXT_TABLE_INDEX: (TEXT_TABLE_INDEX_SOURCE, TEXT_CAPTION_SEQUENCE_NAME),
+    }
+
+    @cached_property
+    def _field_regions(self) -> list[FieldRegion]:
+        """Obsahy a seznamy obrázků / tabulek (rejstříky) s jejich položkami."""
+        regions = []
+        for tag, (source_tag, caption_attr) in self.INDEX_SOURCES.items():
+            for index in self.content.iter(tag):
+                regions.append(self._index_region(index, source_tag, caption_attr))
+        return regions
+
+    def _index_region(self, index, source_tag: str, caption_attr: str | None) -> FieldRegion:
+        region = FieldRegion("TOC", element=index)
+        entry_levels = {}
+
+        source = index.find(source_tag)
+        if source is not None:
+            if caption_attr is not None:
+                region.caption = source.attrib.get(caption_attr)
+
+            lvl = source.attrib.get(TEXT_OUTLINE_LEVEL)
+            if lvl and lvl.isdigit():
+                region.levels = (1, int(lvl))
+
+            for template in source.findall(TEXT_TABLE_OF_CONTENT_ENTRY_TEMPLATE):
+                lvl = template.attrib.get(TEXT_OUTLINE_LEVEL)
+                if lvl and lvl.isdigit():
+                    entry_levels[template.attrib.get(TEXT_STYLE_NAME)] = int(lvl)
+
+        body = index.find(TEXT_INDEX_BODY)
+        if body is None:
+            return region
+
+        styles = {}
+        for p in body.findall(TEXT_P):
+            style = p.attrib.get(TEXT_STYLE_NAME)
+            if style not in styles:
+                styles[style] = self._index_entry_level(style, entry_levels, caption_attr is None)
+            level = styles[style]
+
+            link = p.find(TEXT_A)
+            href = link.attrib.get(XLINK_HREF) if link is not None else None
+
+            region.entries.append(FieldEntry(
+                element=p,
+                text=self.paragraph_text(link if link is not None else p),
+                level=level,
+                has_link=link is not None,
+                anchor=href.lstrip("#") if href else None,
+            ))
+
+        return region
+
+    def _index_entry_level(self, style: str | None, entry_levels: dict, is_toc: bool) -> int | None:
+        # automatické styly (P2…) odkazují na Contents_20_N přes parent-style-name
+        names = [style]
+        st = self._find_style(style) if style else None
+        if st is not None:
+            names.append(st.attrib.get(STYLE_PARENT_STYLE_NAME))
+
+        for name in names:
+            if name in entry_levels:
+                return entry_levels[name]
+
+            m = re.fullmatch(r"Contents_20_(\d+)", name or "")
+            if m and is_toc:
+                return int(m.group(1))
+
+        return None
+
+    def iter_field_regions(self) -> list[FieldRegion]:
+        return self._field_regions
+
+    def table_of_contents(self) -> FieldRegion | None:
+        return next((r for r in self._field_regions if r.is_toc), None)
+
+    def iter_list_of_figures_texts(self) -> list[str]:
+        items = []
+        for region in self._field_regions:
+            if region.element.tag != TEXT_ILLUSTRATION_INDEX:
+                continue
+
+            items.extend(e.text for e in region.entries if e.text)
+
+        return items
+
     def toc_level_contains_numbers(self, level: int) -> bool | None:
         """
         True  = TOC položky této úrovně mají viditelné číslování
@@ -684,34 +861,34 @@ class WriterDocument(TextDocument):
         """
         number_re = re.compile(r'^\s*\d+(\.\d+)*\s+')
 
-        toc = self.content.find(".//text:table-of-content", self.NS)
-        if toc is None:
-            return None
-
-        body = toc.find("text:index-body", self.NS)
-        if body is None:
+        entries = self._toc_entries
+        if entries is None:
             return None
 
-        found_any = False
-
         # Writer mapování: P2 = level 1, P3 = level 2, ...
-        expected_style = f"P{level + 1}"
-
-        for p in body.findall("text:p", self.NS):
-            style = p.attrib.get(f"{{{self.NS['text']}}}style-name")
-            if style != expected_style:
-                continue
+        items = entries.get(f"P{level + 1}")
+        if items is None:
+            return None
 
-            found_any = True
-            txt = self.paragraph_text(p).strip()
+        return any(number_re.match(t) for t in items)
 
-            if number_re.match(txt):
-                return True
+    @cached_property
+    def _toc_entries(self) -> dict[str, list[str]] | None:
+        """Texty položek obsahu podle stylu odstavce; None bez obsahu."""
+        toc = self.content.find(ALL_TEXT_TABLE_OF_CONTENT)
+        if toc is None:
+            return None
 
-        if not found_any:
+        body = toc.find(TEXT_INDEX_BODY)
+        if body is None:
             return None
 
-        return False
+        entries = {}
+        for p in body.findall(TEXT_P):
+            style = p.attrib.get(TEXT_STYLE_NAME)
+            entries.setdefault(style, []).append(self.paragraph_text(p).strip())
+
+        return entries
     
     def heading_level_is_numbered(self, level: int) -> bool:
         exists, _, _ = self.get_heading_numbering_info(level)
@@ -724,7 +901,7 @@ class WriterDocument(TextDocument):
             return False
 
         outline = style.attrib.get(
-            f"{{{self.NS['style']}}}default-outline-level"
+            STYLE_DEFAULT_OUTLINE_LEVEL
         )
         if not outline:
             return False
@@ -733,25 +910,66 @@ class WriterDocument(TextDocument):
         return exists
     
     def section_count(self) -> int:
-        masters = self.styles.findall(
-            ".//style:master-page",
-            self.NS
+        # oddíl = použitý stránkový styl, stejně jako u section_* metod níže
+        return len(self.used_page_styles_in_order())
+
+    @cached_property
+    def _page_sections(self) -> tuple[list[str], set[int]]:
+        """
+        Jeden průchod tělem dokumentu: použité stránkové styly v pořadí
+        (každý je jeden oddíl) a oddíly (od 0) se seznamem literatury.
+        Stránkový styl nastavuje styl odstavce (style:master-page-name);
+        text před prvním takovým odstavcem má výchozí stránkový styl.
+        """
+        pages = []
+        bibliographies = set()
+        body = self.content.find(f".//{OFFICE_TEXT}")
+        if body is None:
+            return pages, bibliographies
+
+        # odstavce ze záznamu změn nejsou text dokumentu
+        elements = (
+            el for block in body if block.tag != TEXT_TRACKED_CHANGES for el in block.iter()
         )
-        return len(masters)
+
+        current = 0
+        for el in elements:
+            if el.tag in (TEXT_P, TEXT_H):
+                name = el.attrib.get(TEXT_STYLE_NAME)
+                style = self._find_style(name) if name else None
+                page = style.attrib.get(STYLE_MASTER_PAGE_NAME) if style is not None else None
+
+                if not page and not pages:
+                    default = self.styles.find(ALL_STYLE_MASTER_PAGE)
+                    page = default.attrib.get(STYLE_NAME) if default is not None else None
+
+                if page:
+                    if page not in pages:
+                        pages.append(page)
+                    current = pages.index(page)
+
+            elif el.tag == TEXT_BIBLIOGRAPHY:
+                bibliographies.add(current)
+
+        return pages, bibliographies
+
+    def has_bibliography_in_section(self, section_index: int) -> bool:
+        return section_index in self._page_sections[1]
 
     def section_has_header_or_footer_content(self, index: int) -> bool:
-        masters = self.styles.findall(
-            ".//style:master-page",
+        pages = self.used_page_styles_in_order()
+        if index >= len(pages):
+            return False
+
+        master = self.styles.find(
+            f".//style:master-page[@style:name='{pages[index]}']",
             self.NS
         )
-
-        if index >= len(masters):
+        if master is None:
             return False
 
-        master = masters[index]
-
-        for tag in ("header", "footer"):
-            el = master.find(f"style:{tag}", self.NS)
+        for tag in (STYLE_HEADER, STYLE_FOOTER):
+            el = master.find(tag)
             if el is None:
                 continue
 
@@ -762,14 +980,7 @@ class WriterDocument(TextDocument):
         return False
     
     def used_page_styles_in_order(self) -> list[str]:
-        used = []
-
-        for el in self.content.iter():
-            ps = el.attrib.get(f"{{{self.NS['style']}}}master-page-name")
-            if ps and ps not in used:
-                used.append(ps)
-
-        return used
+        return list(self._page_sections[0])
     
     def section_has_header_text(self, index: int) -> bool:
         pages = self.used_page_styles_in_order()
@@ -785,7 +996,7 @@ class WriterDocument(TextDocument):
         if master is None:
             return False
 
-        header = master.find("style:header", self.NS)
+        header = master.find(STYLE_HEADER)
         if header is None:
             return False
 
@@ -801,7 +1012,7 @@ class WriterDocument(TextDocument):
             return None
 
         layout_name = master.attrib.get(
-            f"{{{self.NS['style']}}}page-layout-name"
+            STYLE_PAGE_LAYOUT_NAME
         )
         if not layout_name:
             return None
@@ -821,11 +1032,11 @@ class WriterDocument(TextDocument):
         if layout is None:
             return False
 
-        props = layout.find("style:page-layout-properties", self.NS)
+        props = layout.find(STYLE_PAGE_LAYOUT_PROPERTIES)
         if props is None:
             return False
 
-        start = props.attrib.get(f"{{{self.NS['style']}}}page-number")
+        start = props.attrib.get(STYLE_PAGE_NUMBER)
         return start == "1"
     
     def section_footer_is_empty(self, index: int) -> bool | None:
@@ -841,7 +1052,7 @@ class WriterDocument(TextDocument):
         if master is None:
             return None
 
-        footer = master.find("style:footer", self.NS)
+        footer = master.find(STYLE_FOOTER)
         if footer is None:
             return True
 
@@ -862,7 +1073,7 @@ class WriterDocument(TextDocument):
         if master is None:
             return None
 
-        header = master.find("style:header", self.NS)
+        header = master.find(STYLE_HEADER)
         if header is None:
             return True
 
@@ -887,11 +1098,11 @@ class WriterDocument(TextDocument):
         if master is None:
             return False
 
-        footer = master.find("style:footer", self.NS)
+        footer = master.find(STYLE_FOOTER)
         if footer is None:
             return False
 
-        return footer.find(".//text:page-number", self.NS) is not None
+        return footer.find(ALL_TEXT_PAGE_NUMBER) is not None
     
     def header_is_linked_to_previous(self, index: int) -> bool | None:
         return None
\ No newline at end of file
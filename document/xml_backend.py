@@ -0,0 +1,143 @@
+"""
+Parser XML pro adaptéry: xml.etree.ElementTree, nebo lxml (rychlejší
+parsování, iterparse s filtrem tagů v C, getparent() / getprevious()).
+Adaptéry volají jen funkce tohoto modulu, takže na backendu nezávisí.
+
+Výchozí je ElementTree: kontroly strom procházejí v Pythonu a lxml pro
+každý navštívený prvek vytváří proxy objekt, takže celkově vychází
+pomaleji, i když samotné parsování je několikrát rychlejší. lxml se
+zapíná přes use("lxml"); když není nainstalované, zůstane ElementTree.
+"""
+import xml.etree.ElementTree as ET
+from typing import IO, Iterable, Iterator
+from weakref import WeakKeyDictionary
+
+try:
+    from lxml import etree as _lxml
+except ImportError:
+    _lxml = None
+
+BACKENDS = ("etree", "lxml")
+
+LXML = False
+
+# komentáře a instrukce by se v iter() objevily jako prvky bez textového tagu
+_PARSER = (
+    _lxml.XMLParser(remove_comments=True, remove_pis=True, huge_tree=True)
+    if _lxml is not None else None
+)
+
+
+def use(name: str) -> str:
+    """
+    Zvolí backend pro další načítané části a vrátí skutečně použitý –
+    bez nainstalovaného lxml je to vždy "etree".
+    """
+    global LXML
+    if name not in BACKENDS:
+        raise ValueError(f"Neznámý XML backend: {name}")
+
+    LXML = name == "lxml" and _lxml is not None
+    return active()
+
+
+def active() -> str:
+    return "lxml" if LXML else "etree"
+
+
+def is_lxml(el) -> bool:
+    """Prvek ze stromu lxml (strom si backend pamatuje i po přepnutí)."""
+    return _lxml is not None and isinstance(el, _lxml._Element)
+
+
+def parse(source: IO[bytes]) -> ET.Element:
+    """Kořen dokumentu ze souboru (otevřené části balíku)."""
+    if LXML:
+        return _lxml.parse(source, _PARSER).getroot()
+    return ET.parse(source).getroot()
+
+
+def fromstring(data: bytes) -> ET.Element:
+    if LXML:
+        return _lxml.fromstring(data, _PARSER)
+    return ET.fromstring(data)
+
+
+def tostring(el: ET.Element) -> bytes:
+    if is_lxml(el):
+        return _lxml.tostring(el, encoding="utf-8", xml_declaration=True)
+    return ET.tostring(el, encoding="utf-8")
+
+
+def iterparse(
+    source: IO[bytes],
+    events: tuple[str, ...] = ("end",),
+    tag: str | Iterable[str] | None = None,
+) -> Iterator[tuple[str, ET.Element]]:
+    """
+    Jako ET.iterparse; s `tag` vrací jen události daných prvků. lxml filtruje
+    už v parseru, ElementTree až tady.
+    """
+    if LXML:
+        yield from _lxml.iterparse(
+            source, events=events, tag=tag,
+            remove_comments=True, remove_pis=True, huge_tree=True,
+        )
+        return
+
+    if tag is None:
+        yield from ET.iterparse(source, events=events)
+        return
+
+    tags = {tag} if isinstance(tag, str) else set(tag)
+    for event, el in ET.iterparse(source, events=events):
+        if el.tag in tags:
+            yield event, el
+
+
+# --- navigace ve stromu ---
+
+# ElementTree nezná rodiče: (rodič, index) každého prvku, spočítané jednou na strom
+_positions: "WeakKeyDictionary[ET.Element, dict]" = WeakKeyDictionary()
+
+
+def _position_index(root: ET.Element) -> dict:
+    index = _positions.get(root)
+    if index is None:
+        index = {}
+        for parent in root.iter():
+            for i, child in enumerate(parent):
+                index[child] = (parent, i)
+        _positions[root] = index
+    return index
+
+
+def parent(el: ET.Element, root: ET.Element) -> ET.Element | None:
+    """Rodič prvku `el` ve stromu `root` (strom se mezitím nesmí měnit)."""
+    if is_lxml(el):
+        return el.getparent()
+
+    pos = _position_index(root).get(el)
+    return pos[0] if pos else None
+
+
+def previous(el: ET.Element, root: ET.Element) -> ET.Element | None:
+    """Předchozí sourozenec prvku `el`."""
+    if is_lxml(el):
+        return el.getprevious()
+
+    pos = _position_index(root).get(el)
+    if not pos or pos[1] == 0:
+        return None
+    return pos[0][pos[1] - 1]
+
+
+def next_sibling(el: ET.Element, root: ET.Element) -> ET.Element | None:
+    """Následující sourozenec prvku `el`."""
+    if is_lxml(el):
+        return el.getnext()
+
+    pos = _position_index(root).get(el)
+    if not pos or pos[1] + 1 >= len(pos[0]):
+        return None
+    return pos[0][pos[1] + 1]
@@ -0,0 +1,40 @@
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator
+
+from document import xml_backend
+
+
+def iter_children(source: IO[bytes], parent_tag: str) -> Iterator[ET.Element]:
+    """
+    Postupně vrací přímé potomky prvního prvku `parent_tag`, jakmile jsou
+    celé načtené, a hned je ze stromu odpojí. V paměti je tak vždy jen
+    jeden potomek (odstavec, tabulka, list…), ne celý dokument (s lxml
+    zůstává strom v C, viz níže).
+
+    Vrácený prvek zůstává platný i po odpojení, stačí si ho ponechat.
+    """
+    parent = None
+    depth = 0
+
+    for event, el in xml_backend.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if parent is None:
+                if el.tag == parent_tag:
+                    parent = el
+            else:
+                depth += 1
+            continue
+
+        if parent is None:
+            continue
+
+        if el is parent:
+            return
+
+        depth -= 1
+        if depth == 0:
+            yield el
+            # lxml přesouvá odpojený podstrom do nového dokumentu (u velkého
+            # listu sekundy); jeho strom je navíc čistě v C, takže se nechá být
+            if not xml_backend.is_lxml(parent):
+                parent.remove(el)
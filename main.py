@@ -1,3 +1,7 @@
+import argparse
+import os
+from pathlib import Path
+
 from assignment.excel.excel_assignment_loader import load_excel_assignment
 from checks.excel.chart.threeD_chart_check import ThreeDChartCheck
 from checks.excel.chart.chart_formatting_check import ChartFormattingCheck
@@ -63,12 +67,16 @@ from checks.word.structure.toc_first_section_check import TOCFirstSectionContent
 from checks.word.structure.toc_heading_levels_check import TOCHeadingLevelsCheck
 from checks.word.structure.toc_illegal_content_check import TOCIllegalContentCheck
 from checks.word.structure.toc_up_to_date_check import TOCUpToDateCheck
+from document import xml_backend
 from document.calc_document import CalcDocument
 from document.excel_document import ExcelDocument
 from document.spreadsheet_document import SpreadsheetDocument
 from document.word_document import WordDocument
-from core.runner import Runner
+from core.runner import EXECUTORS, Runner
 from core.report import Report
+from core.batch import BatchRunner, dump_debug_xml
+from core.profiling import Profiler
+from core.result_cache import ResultCache
 
 from checks.word.sections.section_count_check import SectionCountCheck
 from checks.word.sections.section1_toc_check import Section1TOCCheck
@@ -82,12 +90,93 @@ from assignment.word.word_assignment_loader import load_assignment
 from checks.word.formatting.normal_style_check import NormalStyleCheck
 from document.writer_document import WriterDocument
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Hodnocení odevzdaných dokumentů")
+    parser.add_argument(
+        "submissions",
+        nargs="?",
+        help="adresář s odevzdanými soubory (.docx, .odt, .xlsx, .ods)",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="počet paralelních procesů (výchozí: počet jader)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="ADRESÁŘ",
+        default=None,
+        help="adresář s cache výsledků – znovu se spustí jen kontroly, "
+             "které pro stejný soubor a zadání ještě neproběhly",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="ADRESÁŘ",
+        default=None,
+        help="uloží časy kontrol (timings.json, timings.csv) do adresáře",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="s --profile měří i alokovanou paměť (tracemalloc)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=0,
+        metavar="N",
+        help="s --profile uloží cProfile N nejpomalejších kontrol",
+    )
+    parser.add_argument(
+        "--check-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="u jednoho dokumentu spustí nezávislé kontroly souběžně v N vláknech/procesech",
+    )
+    parser.add_argument(
+        "--check-executor",
+        choices=EXECUTORS,
+        default="thread",
+        help="s --check-workers: vlákna (výchozí) nebo procesy",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="po první fatální chybě v dokumentu přeskočí zbývající kontroly",
+    )
+    parser.add_argument(
+        "--debug-xml",
+        metavar="ADRESÁŘ",
+        default=None,
+        help="vypíše XML části každého dokumentu do ADRESÁŘ/<soubor>/ pro ladění",
+    )
+    parser.add_argument(
+        "--debug-parts",
+        nargs="+",
+        metavar="VZOR",
+        default=None,
+        help="s --debug-xml jen části odpovídající vzorům (např. 'word/*.xml'); "
+             "výchozí hlavní části u textových a všechna XML u tabulkových dokumentů",
+    )
+    parser.add_argument(
+        "--xml-backend",
+        choices=xml_backend.BACKENDS,
+        default="etree",
+        help="parser XML; lxml se použije, jen je-li nainstalované",
+    )
+    return parser.parse_args()
+
+
 def main():
-    # doc = WordDocument("studentF.docx")
-    doc = WordDocument("studentG.docx")
-    # doc = WriterDocument("24_f3ea2.odt")
+    args = parse_args()
+    xml_backend.use(args.xml_backend)
+    cache = ResultCache(args.cache) if args.cache else None
+    profiler = None
+    if args.profile:
+        profiler = Profiler(trace_memory=args.profile_memory, profile_top=args.profile_top)
     assignment = load_assignment("assignment/word/assignment.json")
-    doc.save_xml()
 
     checks = [
         # # Části / oddíly 
@@ -158,13 +247,6 @@ def main():
     ]
 
     excel_assignment = load_excel_assignment("assignment/excel/assignment.json")
-    
-    #spreadsheet = SpreadsheetDocument.from_path("23_fb750G.ods")
-    spreadsheet = SpreadsheetDocument.from_path("23_fb750F.ods")
-    # spreadsheet = SpreadsheetDocument.from_path("23_fb750G.xlsx")
-    # spreadsheet = SpreadsheetDocument.from_path("23_fb750F.xlsx")
-    spreadsheet.save_debug_xml()
-
 
     excel_checks = [
         # RequiredSourceWorksheetCheck(),
@@ -192,15 +274,58 @@ def main():
 
     ]
 
+    if args.submissions:
+        batch = BatchRunner(
+            checks,
+            excel_checks,
+            text_assignment=assignment,
+            spreadsheet_assignment=excel_assignment,
+            workers=args.workers,
+            cache=cache,
+            profiler=profiler,
+            fail_fast=args.fail_fast,
+            debug_dir=args.debug_xml,
+            debug_parts=args.debug_parts,
+        )
+        for path, report in batch.run(args.submissions):
+            print(f"\n##### {path}")
+            report.print()
+
+        if profiler is not None:
+            profiler.write(args.profile)
+        return
+
+    # doc = WordDocument("studentF.docx")
+    doc = WordDocument("studentG.docx")
+    # doc = WriterDocument("24_f3ea2.odt")
+
+    #spreadsheet = SpreadsheetDocument.from_path("23_fb750G.ods")
+    spreadsheet = SpreadsheetDocument.from_path("23_fb750F.ods")
+    # spreadsheet = SpreadsheetDocument.from_path("23_fb750G.xlsx")
+    # spreadsheet = SpreadsheetDocument.from_path("23_fb750F.xlsx")
+
+    if args.debug_xml:
+        # části jednoho dokumentu se vypisují souběžně
+        dump_workers = args.workers or os.cpu_count() or 1
+        for document in (doc, spreadsheet):
+            out_dir = Path(args.debug_xml) / Path(document.path).name
+            dump_debug_xml(document, out_dir, args.debug_parts, dump_workers)
+
     report = Report()
 
-    word_runner = Runner(checks)
+    word_runner = Runner(
+        checks, cache, profiler, args.fail_fast,
+        workers=args.check_workers, executor=args.check_executor,
+    )
     results = word_runner.run(doc, assignment)
 
     for check, result in results:
         report.add(check.name, result)
 
-    excel_runner = Runner(excel_checks)
+    excel_runner = Runner(
+        excel_checks, cache, profiler, args.fail_fast,
+        workers=args.check_workers, executor=args.check_executor,
+    )
     excel_results = excel_runner.run(spreadsheet, excel_assignment)
 
     for check, result in excel_results:
@@ -208,6 +333,9 @@ def main():
 
     report.print()
 
+    if profiler is not None:
+        profiler.write(args.profile)
+
 if __name__ == "__main__":
     main()
 